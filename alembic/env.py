@@ -1,6 +1,7 @@
 import asyncio
 from logging.config import fileConfig
 
+import sqlalchemy as sa
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
@@ -13,7 +14,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from ai_news_agent.config import settings
-from ai_news_agent.storage.models import Base
+from ai_news_agent.storage.models import Base, EpochMicros
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,6 +32,21 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+def compare_type(
+    context, inspected_column, metadata_column, inspected_type, metadata_type
+):
+    """Treat EpochMicros columns as matching the timestamp type they are stored in.
+
+    On SQLite they are declared DATETIME (migrated databases) or BIGINT
+    (created from the models) and hold integers either way; other databases
+    keep a native timestamp column. Everything else is compared as usual.
+    """
+    if isinstance(metadata_type, EpochMicros):
+        return not isinstance(inspected_type, (sa.DateTime, sa.BigInteger))
+    return None
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -55,6 +71,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        compare_type=compare_type,
     )
 
     with context.begin_transaction():
@@ -62,7 +79,11 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        compare_type=compare_type,
+    )
 
     with context.begin_transaction():
         context.run_migrations()
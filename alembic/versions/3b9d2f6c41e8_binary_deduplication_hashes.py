@@ -0,0 +1,78 @@
+"""Store deduplication cache hashes as raw bytes
+
+Revision ID: 3b9d2f6c41e8
+Revises: ffa7c73e59fb
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9d2f6c41e8'
+down_revision: Union[str, Sequence[str], None] = 'ffa7c73e59fb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+HASH_COLUMNS = ('url_hash', 'title_hash', 'content_hash')
+
+
+def _rebuild_cache(hash_type: sa.types.TypeEngine, convert) -> None:
+    """Recreate deduplication_cache with new hash column types, keeping rows.
+
+    SQLite cannot change column types in place, so the table is copied out,
+    recreated and refilled on every dialect.
+    """
+    old_table = sa.table(
+        'deduplication_cache',
+        sa.column('id'),
+        *(sa.column(name) for name in HASH_COLUMNS),
+        sa.column('first_seen_at', sa.DateTime()),
+        sa.column('last_seen_at', sa.DateTime()),
+        sa.column('occurrence_count'),
+        sa.column('news_item_id'),
+    )
+    rows = [dict(row._mapping) for row in op.get_bind().execute(sa.select(old_table))]
+    for row in rows:
+        for name in HASH_COLUMNS:
+            row[name] = convert(row[name])
+
+    op.drop_index('idx_url_hash', table_name='deduplication_cache')
+    op.drop_index('idx_title_hash', table_name='deduplication_cache')
+    op.drop_index('idx_first_seen', table_name='deduplication_cache')
+    op.drop_index('idx_content_hash', table_name='deduplication_cache')
+    op.drop_table('deduplication_cache')
+
+    new_table = op.create_table('deduplication_cache',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('url_hash', hash_type, nullable=False),
+    sa.Column('title_hash', hash_type, nullable=False),
+    sa.Column('content_hash', hash_type, nullable=False),
+    sa.Column('first_seen_at', sa.DateTime(), nullable=False),
+    sa.Column('last_seen_at', sa.DateTime(), nullable=False),
+    sa.Column('occurrence_count', sa.Integer(), nullable=False),
+    sa.Column('news_item_id', sa.String(length=64), nullable=False),
+    sa.ForeignKeyConstraint(['news_item_id'], ['news_items.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('url_hash')
+    )
+    op.create_index('idx_content_hash', 'deduplication_cache', ['content_hash'], unique=False)
+    op.create_index('idx_first_seen', 'deduplication_cache', ['first_seen_at'], unique=False)
+    op.create_index('idx_title_hash', 'deduplication_cache', ['title_hash'], unique=False)
+    op.create_index('idx_url_hash', 'deduplication_cache', ['url_hash'], unique=False)
+
+    if rows:
+        op.bulk_insert(new_table, rows)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rebuild_cache(sa.LargeBinary(length=32), bytes.fromhex)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rebuild_cache(sa.String(length=64), bytes.hex)
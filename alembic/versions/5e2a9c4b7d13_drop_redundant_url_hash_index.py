@@ -0,0 +1,28 @@
+"""Drop the url_hash index duplicated by its unique constraint
+
+Revision ID: 5e2a9c4b7d13
+Revises: 8c1e5a7d3f20
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2a9c4b7d13'
+down_revision: Union[str, Sequence[str], None] = '8c1e5a7d3f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_url_hash', table_name='deduplication_cache')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_url_hash', 'deduplication_cache', ['url_hash'], unique=False)
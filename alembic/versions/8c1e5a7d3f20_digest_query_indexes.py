@@ -0,0 +1,36 @@
+"""Index news items for the digest query pattern
+
+Revision ID: 8c1e5a7d3f20
+Revises: 3b9d2f6c41e8
+Create Date: 2026-10-16 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c1e5a7d3f20'
+down_revision: Union[str, Sequence[str], None] = '3b9d2f6c41e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('idx_source', table_name='news_items')
+    op.drop_index('idx_published_at', table_name='news_items')
+    op.drop_index('idx_is_duplicate', table_name='news_items')
+    op.create_index('idx_news_nondup_published', 'news_items', ['published_at'], unique=False, sqlite_where=sa.text('is_duplicate = 0'), postgresql_where=sa.text('is_duplicate = false'))
+    op.create_index('idx_news_source_published', 'news_items', ['source', 'published_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_news_source_published', table_name='news_items')
+    op.drop_index('idx_news_nondup_published', table_name='news_items')
+    op.create_index('idx_is_duplicate', 'news_items', ['is_duplicate'], unique=False)
+    op.create_index('idx_published_at', 'news_items', ['published_at'], unique=False)
+    op.create_index('idx_source', 'news_items', ['source'], unique=False)
@@ -0,0 +1,55 @@
+"""Store range-queried timestamps as epoch microseconds on SQLite
+
+Revision ID: a47f1d2e9b65
+Revises: 5e2a9c4b7d13
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a47f1d2e9b65'
+down_revision: Union[str, Sequence[str], None] = '5e2a9c4b7d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns switched to EpochMicros; other databases keep native timestamps
+EPOCH_COLUMNS = {
+    'news_items': ('published_at', 'collected_at'),
+    'collector_runs': ('started_at', 'completed_at'),
+    'deduplication_cache': ('first_seen_at', 'last_seen_at'),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    # DateTime text is 'YYYY-MM-DD HH:MM:SS.ffffff'; the declared DATETIME
+    # column type has numeric affinity, so integers are stored as is
+    for table, columns in EPOCH_COLUMNS.items():
+        for column in columns:
+            op.execute(sa.text(
+                f"UPDATE {table} SET {column} = "
+                f"CAST(strftime('%s', {column}) AS INTEGER) * 1000000 "
+                f"+ CAST(substr({column}, 21, 6) AS INTEGER) "
+                f"WHERE typeof({column}) = 'text'"
+            ))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table, columns in EPOCH_COLUMNS.items():
+        for column in columns:
+            op.execute(sa.text(
+                f"UPDATE {table} SET {column} = "
+                f"strftime('%Y-%m-%d %H:%M:%S', {column} / 1000000, 'unixepoch') "
+                f"|| printf('.%06d', {column} % 1000000) "
+                f"WHERE typeof({column}) = 'integer'"
+            ))
@@ -63,13 +63,10 @@ async def main():
     logger.info("Scheduler started. Press Ctrl+C to stop.")
     
     # Handle shutdown gracefully
-    def shutdown(signum, frame):
-        logger.info("Shutting down scheduler...")
-        scheduler.stop()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, shutdown)
-    signal.signal(signal.SIGTERM, shutdown)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_event.set)
     
     # Run a task immediately
     logger.info("Running RSS collection task immediately...")
@@ -81,7 +78,11 @@ async def main():
     # Keep running
     try:
         while True:
-            await asyncio.sleep(30)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=30)
+                break
+            except TimeoutError:
+                pass
             
             # Show periodic status
             running_status = scheduler.get_status()
@@ -92,8 +93,9 @@ async def main():
                     f"errors={info['error_count']}, "
                     f"last_run={info['last_run'] or 'never'}"
                 )
-    except KeyboardInterrupt:
-        pass
+    finally:
+        logger.info("Shutting down scheduler...")
+        await scheduler.shutdown()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,16 @@
 """ArXiv-specific RSS feed parser"""
 
-from datetime import UTC, datetime
+import re
 from typing import Any
 
-import feedparser
 from loguru import logger
 
 from ...models import NewsItem
 from .base import BaseParser
 
+# ArXiv abstract URL: new-style YYMM.NNNNN or old-style category/YYMMNNN IDs
+_ARXIV_ID_RE = re.compile(r"arxiv\.org/abs/(?P<id>(?:(?P<category>[\w.\-]+)/)?[^/?#]+)")
+
 
 class ArxivParser(BaseParser):
     """Parser specifically for ArXiv RSS feeds
@@ -19,11 +21,11 @@ class ArxivParser(BaseParser):
     - Different namespace handling
     """
 
-    async def parse(self, content: str) -> list[NewsItem]:
+    def _parse_sync(self, content: str | bytes) -> list[NewsItem]:
         """Parse ArXiv RSS feed content
 
         Args:
-            content: Raw RSS/XML content as string
+            content: Raw RSS/XML content as string or undecoded bytes
 
         Returns:
             List of validated NewsItem objects
@@ -31,17 +33,11 @@ class ArxivParser(BaseParser):
         items: list[NewsItem] = []
 
         try:
-            # Parse RSS feed with namespace support
-            feed = feedparser.parse(content)
-
-            if feed.bozo:
-                logger.warning(
-                    f"Feed parsing warning for {self.source_name}: "
-                    f"{feed.bozo_exception}"
-                )
+            # Stream <item> elements, Dublin Core fields included
+            entries = self._iter_entries(content)
 
             # Process each entry
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     item = self._parse_entry(entry)
                     if item:
@@ -64,7 +60,7 @@ class ArxivParser(BaseParser):
         """Parse a single ArXiv feed entry into NewsItem
 
         Args:
-            entry: Feed entry from feedparser
+            entry: Entry dict produced by BaseParser._iter_entries
 
         Returns:
             NewsItem object or None if required fields missing
@@ -78,54 +74,43 @@ class ArxivParser(BaseParser):
             return None
 
         # Extract abstract/description
-        content = entry.get("description", "").strip()
+        content = entry.get("summary", "").strip()
         content = self._clean_html(content)
 
         # For ArXiv, summary is usually the same as description
         summary = content[:200] + "..." if len(content) > 200 else content
 
         # Parse publication date from dc:date
-        published_at = None
-        if hasattr(entry, "dc_date"):
-            published_at = self._parse_date(entry.dc_date)
-        elif hasattr(entry, "published"):
-            published_at = self._parse_date(entry.published)
-        elif hasattr(entry, "updated"):
-            published_at = self._parse_date(entry.updated)
+        published_at = self._parse_date(
+            entry.get("dc_date") or entry.get("published") or entry.get("updated")
+        )
 
         if not published_at:
-            published_at = datetime.now(UTC)
             logger.debug(f"No publication date found for ArXiv paper '{title}'")
+        published_at = self._to_naive_utc(published_at or self._collected_at)
 
         # Extract authors from dc:creator
         metadata = {}
         authors = []
 
-        if hasattr(entry, "dc_creator"):
+        if creators := entry.get("dc_creator"):
             # dc:creator is a comma-separated list of authors
             authors = [
-                author.strip()
-                for author in entry.dc_creator.split(",")
-                if author.strip()
+                author.strip() for author in creators.split(",") if author.strip()
             ]
             metadata["authors"] = ", ".join(authors)
-        elif hasattr(entry, "authors"):
+        elif authors := entry.get("authors", []):
             # Fallback to standard authors field
-            authors = [
-                author.get("name", "") for author in entry.authors if author.get("name")
-            ]
             metadata["authors"] = ", ".join(authors)
 
         # Extract ArXiv ID from link
-        if "arxiv.org/abs/" in link:
-            arxiv_id = link.split("/abs/")[-1]
-            metadata["arxiv_id"] = arxiv_id
+        if match := _ARXIV_ID_RE.search(link):
+            metadata["arxiv_id"] = match["id"]
 
             # Extract categories from ArXiv ID if present
             # ArXiv IDs often have format: YYMM.NNNNN or category/YYMMNNN
-            if "/" in arxiv_id:
-                category = arxiv_id.split("/")[0]
-                tags = [category, "arxiv"]
+            if match["category"]:
+                tags = [match["category"], "arxiv"]
             else:
                 tags = ["arxiv", "cs.AI"]  # Default to AI category
         else:
@@ -144,6 +129,7 @@ class ArxivParser(BaseParser):
                 summary=summary,
                 source=self.source_name,
                 published_at=published_at,
+                collected_at=self._collected_at,
                 tags=tags,
                 metadata=metadata,
             )
@@ -1,10 +1,98 @@
 """Base parser interface for RSS feed parsers"""
 
+import html
+import io
+import re
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Any
+
+from dateutil import parser as date_parser
+from loguru import logger
+from lxml import etree
 
 from ...models import NewsItem
 
+# libxml2 options for streaming entries: tolerant of broken markup, never
+# expands entities or touches the network. Raw bytes are decoded by libxml2
+# according to the XML declaration; str input is re-encoded to UTF-8.
+_ITERPARSE_OPTIONS: dict[str, Any] = {
+    "huge_tree": False,
+    "recover": True,
+    "resolve_entities": False,
+    "no_network": True,
+}
+
+# Entry elements in RSS 1.0/2.0 and Atom, in any namespace
+_ENTRY_TAGS = ("{*}item", "{*}entry")
+
+# Precompiled HTML stripping: drop script/style bodies, then any tag
+_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Namespaces we extract fields from
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+
+# Namespaces whose title/link/summary/... elements are the entry's own fields:
+# plain RSS 2.0, RSS 1.0 (RDF) and Atom 1.0/0.3. Extensions such as media:
+# or itunes: reuse those local names for other things and are skipped.
+_CORE_NAMESPACES = frozenset(
+    {
+        None,
+        "http://purl.org/rss/1.0/",
+        "http://www.w3.org/2005/Atom",
+        "http://purl.org/atom/ns#",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _field_for_tag(tag: str) -> str | None:
+    """Map a child element tag to the entry field it populates
+
+    Feeds reuse the same handful of tags in every entry, so the namespace
+    and name dispatch is resolved once per distinct tag and then served
+    from the cache.
+
+    Args:
+        tag: Element tag in Clark notation ({namespace}localname)
+
+    Returns:
+        Entry field name, or None if the element is not used
+    """
+    qname = etree.QName(tag)
+    name = qname.localname
+
+    if qname.namespace == _DC_NS:
+        return {"creator": "dc_creator", "date": "dc_date", "subject": "subject"}.get(
+            name
+        )
+    if qname.namespace == _CONTENT_NS:
+        return "content" if name == "encoded" else None
+    if qname.namespace not in _CORE_NAMESPACES:
+        return None
+    if name in ("description", "summary"):
+        return "summary"
+    if name in ("pubDate", "published", "issued"):
+        return "published"
+    if name in ("updated", "modified"):
+        return "updated"
+    if name in ("guid", "id"):
+        return "id"
+    if name in ("title", "link", "content", "author", "category"):
+        return name
+    return None
+
+
+def _text(elem: Any) -> str:
+    """Get the stripped text content of an element and its descendants"""
+    return "".join(elem.itertext()).strip()
+
 
 class BaseParser(ABC):
     """Abstract base class for RSS feed parsers
@@ -21,12 +109,30 @@ class BaseParser(ABC):
         """
         self.source_name = source_name
 
+        # Collection time shared by all entries of the feed being parsed,
+        # refreshed per feed by _iter_entries
+        self._collected_at = datetime.now(UTC)
+
+    async def parse(self, content: str | bytes) -> list[NewsItem]:
+        """Parse RSS feed content into NewsItem objects
+
+        Args:
+            content: Raw RSS/XML content as string or undecoded bytes
+
+        Returns:
+            List of validated NewsItem objects
+        """
+        return self._parse_sync(content)
+
     @abstractmethod
-    async def parse(self, content: str) -> list[NewsItem]:
+    def _parse_sync(self, content: str | bytes) -> list[NewsItem]:
         """Parse RSS feed content into NewsItem objects
 
+        Parsing is CPU-bound and never awaits, so the collector runs this
+        in a worker thread to keep the event loop free for other fetches.
+
         Args:
-            content: Raw RSS/XML content as string
+            content: Raw RSS/XML content as string or undecoded bytes
 
         Returns:
             List of validated NewsItem objects
@@ -37,6 +143,108 @@ class BaseParser(ABC):
         """
         pass
 
+    def _iter_entries(self, content: str | bytes) -> Iterator[dict[str, Any]]:
+        """Stream RSS 1.0/2.0 and Atom entries as plain dicts
+
+        Entries are extracted as soon as their closing tag is seen and the
+        element is then discarded, so only one entry is held in memory at
+        a time regardless of the feed size.
+
+        Args:
+            content: Raw RSS/XML content as string or undecoded bytes
+
+        Yields:
+            One dict per <item>/<entry> with the fields the parsers use:
+            title, link, summary, content, published, updated, dc_date,
+            author, authors, dc_creator, tags, id
+        """
+        self._collected_at = datetime.now(UTC)
+
+        if isinstance(content, str):
+            source, encoding = io.BytesIO(content.encode()), "utf-8"
+        else:
+            source, encoding = io.BytesIO(content), None
+
+        context = etree.iterparse(
+            source,
+            events=("end",),
+            tag=_ENTRY_TAGS,
+            encoding=encoding,
+            **_ITERPARSE_OPTIONS,
+        )
+
+        try:
+            for _, elem in context:
+                yield self._entry_to_dict(elem)
+
+                # Drop the entry and any already-processed siblings
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            logger.warning(f"Feed parsing warning for {self.source_name}: {e}")
+            return
+
+        if context.error_log:
+            logger.warning(
+                f"Feed parsing warning for {self.source_name}: "
+                f"{context.error_log[0].message}"
+            )
+
+    @staticmethod
+    def _entry_to_dict(elem: Any) -> dict[str, Any]:
+        """Extract the fields of a single <item>/<entry> element
+
+        Args:
+            elem: lxml element of the entry
+
+        Returns:
+            Dict of extracted field values
+        """
+        entry: dict[str, Any] = {}
+        tags: list[str] = []
+        authors: list[str] = []
+
+        for child in elem:
+            tag = child.tag
+            if not isinstance(tag, str):
+                continue  # Comments and processing instructions
+
+            field = _field_for_tag(tag)
+            if field is None:
+                continue
+
+            if field == "link":
+                # Atom links carry the URL in href; prefer rel="alternate"
+                href = child.get("href")
+                if href is None:
+                    entry.setdefault("link", _text(child))
+                elif child.get("rel", "alternate") == "alternate":
+                    entry.setdefault("link", href)
+            elif field == "author":
+                # RSS: plain text; Atom: <author><name>...</name></author>
+                author = child.findtext("{*}name")
+                author = author.strip() if author else _text(child)
+                if author:
+                    authors.append(author)
+            elif field == "category":
+                term = child.get("term") or _text(child)
+                if term:
+                    tags.append(term)
+            elif field == "subject":
+                if text := _text(child):
+                    tags.append(text)
+            else:
+                entry.setdefault(field, _text(child))
+
+        if authors:
+            entry["author"] = authors[0]
+            entry["authors"] = authors
+        if tags:
+            entry["tags"] = tags
+
+        return entry
+
     def _parse_date(self, date_str: str | None) -> datetime | None:
         """Parse various date formats into datetime
 
@@ -49,14 +257,41 @@ class BaseParser(ABC):
         if not date_str:
             return None
 
-        from dateutil import parser as date_parser
+        # RSS 2.0 uses RFC 822 dates
+        try:
+            return parsedate_to_datetime(date_str)
+        except (ValueError, TypeError, IndexError):
+            pass
+
+        # Atom and Dublin Core use ISO 8601
+        try:
+            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        except ValueError:
+            pass
 
         try:
-            # dateutil.parser handles most common date formats
+            # dateutil.parser handles the remaining, less common formats
             return date_parser.parse(date_str)
-        except (ValueError, TypeError):
+        except (ValueError, TypeError, OverflowError):
             return None
 
+    @staticmethod
+    def _to_naive_utc(value: datetime | None) -> datetime:
+        """Normalize a publication date to naive UTC, as stored in the database
+
+        Args:
+            value: Parsed datetime, naive (assumed UTC) or timezone-aware;
+                None falls back to the current time
+
+        Returns:
+            Naive datetime in UTC
+        """
+        if value is None:
+            return datetime.now(UTC).replace(tzinfo=None)
+        if value.tzinfo is not None:
+            return value.astimezone(UTC).replace(tzinfo=None)
+        return value
+
     def _clean_html(self, text: str | None) -> str:
         """Remove HTML tags from text
 
@@ -69,8 +304,6 @@ class BaseParser(ABC):
         if not text:
             return ""
 
-        from bs4 import BeautifulSoup
-
-        # Parse HTML and extract text
-        soup = BeautifulSoup(text, "html.parser")
-        return soup.get_text(strip=True)
+        # Tags become spaces so adjacent blocks don't run together
+        text = _TAG_RE.sub(" ", _SCRIPT_RE.sub(" ", text))
+        return _WS_RE.sub(" ", html.unescape(text)).strip()
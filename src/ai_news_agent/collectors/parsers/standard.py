@@ -1,9 +1,7 @@
 """Standard RSS/Atom feed parser for most RSS feeds"""
 
-from datetime import UTC, datetime
 from typing import Any
 
-import feedparser
 from loguru import logger
 
 from ...models import NewsItem
@@ -20,11 +18,11 @@ class StandardParser(BaseParser):
     - Anthropic Blog
     """
 
-    async def parse(self, content: str) -> list[NewsItem]:
+    def _parse_sync(self, content: str | bytes) -> list[NewsItem]:
         """Parse standard RSS/Atom feed content
 
         Args:
-            content: Raw RSS/XML content as string
+            content: Raw RSS/XML content as string or undecoded bytes
 
         Returns:
             List of validated NewsItem objects
@@ -32,17 +30,11 @@ class StandardParser(BaseParser):
         items: list[NewsItem] = []
 
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(content)
-
-            if feed.bozo:
-                logger.warning(
-                    f"Feed parsing warning for {self.source_name}: "
-                    f"{feed.bozo_exception}"
-                )
+            # Stream <item>/<entry> elements with lxml iterparse
+            entries = self._iter_entries(content)
 
             # Process each entry
-            for entry in feed.entries:
+            for entry in entries:
                 try:
                     item = self._parse_entry(entry)
                     if item:
@@ -65,7 +57,7 @@ class StandardParser(BaseParser):
         """Parse a single feed entry into NewsItem
 
         Args:
-            entry: Feed entry from feedparser
+            entry: Entry dict produced by BaseParser._iter_entries
 
         Returns:
             NewsItem object or None if required fields missing
@@ -78,15 +70,8 @@ class StandardParser(BaseParser):
             logger.debug(f"Skipping entry without title or link in {self.source_name}")
             return None
 
-        # Extract content/summary
-        content = ""
-        if hasattr(entry, "content") and entry.content:
-            # Some feeds have full content
-            content = entry.content[0].get("value", "")
-        elif hasattr(entry, "summary"):
-            content = entry.summary
-        elif hasattr(entry, "description"):
-            content = entry.description
+        # Extract content/summary (full content when the feed provides it)
+        content = entry.get("content") or entry.get("summary", "")
 
         # Clean HTML from content
         content = self._clean_html(content)
@@ -98,38 +83,28 @@ class StandardParser(BaseParser):
         summary = self._clean_html(summary)
 
         # Parse publication date
-        published_at = None
-        if hasattr(entry, "published_parsed") and entry.published_parsed:
-            published_at = datetime(*entry.published_parsed[:6])
-        elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-            published_at = datetime(*entry.updated_parsed[:6])
-        elif hasattr(entry, "published"):
-            published_at = self._parse_date(entry.published)
-        elif hasattr(entry, "updated"):
-            published_at = self._parse_date(entry.updated)
+        published_at = (
+            self._parse_date(entry.get("published"))
+            or self._parse_date(entry.get("updated"))
+            or self._parse_date(entry.get("dc_date"))
+        )
 
         if not published_at:
-            # Use current time if no date found
-            published_at = datetime.now(UTC)
+            # Use collection time if no date found
             logger.debug(f"No publication date found for '{title}', using current time")
+        published_at = self._to_naive_utc(published_at or self._collected_at)
 
         # Extract tags from categories
-        tags = []
-        if hasattr(entry, "tags"):
-            tags = [tag.get("term", "") for tag in entry.tags if tag.get("term")]
+        tags = entry.get("tags", [])
 
         # Extract author for metadata
         metadata = {}
-        if hasattr(entry, "author"):
-            metadata["author"] = entry.author
-        elif hasattr(entry, "authors"):
-            metadata["authors"] = ", ".join(
-                author.get("name", "") for author in entry.authors
-            )
+        if author := entry.get("author") or entry.get("dc_creator"):
+            metadata["author"] = author
 
         # Add GUID if available
-        if hasattr(entry, "id"):
-            metadata["guid"] = entry.id
+        if guid := entry.get("id"):
+            metadata["guid"] = guid
 
         # Create NewsItem
         try:
@@ -140,6 +115,7 @@ class StandardParser(BaseParser):
                 summary=summary,
                 source=self.source_name,
                 published_at=published_at,
+                collected_at=self._collected_at,
                 tags=tags,
                 metadata=metadata,
             )
@@ -1,8 +1,12 @@
 """RSS feed collector with concurrent fetching and retry logic"""
 
 import asyncio
+import random
+import re
 import time
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
+from typing import Any
 
 import aiohttp
 from loguru import logger
@@ -11,7 +15,24 @@ from ..config import settings
 from ..models import CollectorStats, NewsItem
 from ..utils.rate_limiter import ConcurrencyLimiter, RateLimiter
 from .base import BaseCollector
-from .parsers import ArxivParser, StandardParser
+from .parsers import ArxivParser, BaseParser, StandardParser
+
+try:  # aiohttp only decodes brotli bodies when a brotli binding is installed
+    import brotli  # noqa: F401
+
+    _HAS_BROTLI = True
+except ImportError:
+    _HAS_BROTLI = False
+
+try:  # aiodns lets aiohttp resolve hosts without the thread pool
+    import aiodns  # noqa: F401
+
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+# max-age directive of a Cache-Control response header
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
 
 
 class RSSCollector(BaseCollector):
@@ -24,13 +45,45 @@ class RSSCollector(BaseCollector):
     - Performance statistics tracking
     - Graceful error handling
     - Deduplication within batch
+    - Persistent HTTP session with keep-alive across collections
+    - Conditional GET (ETag / Last-Modified) and Cache-Control max-age
+    - Compressed transfer (gzip/deflate, brotli when available)
+    - Optional background prefetch with per-feed refresh intervals
     """
 
+    # Sent with every feed request; aiohttp transparently decodes the body
+    DEFAULT_HEADERS: dict[str, str] = {
+        "Accept-Encoding": "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate",
+        "User-Agent": "ai-news-agent/1.0",
+        "Accept": (
+            "application/rss+xml, application/atom+xml, application/xml;q=0.9, "
+            "*/*;q=0.8"
+        ),
+    }
+
     def __init__(self):
         """Initialize RSS collector with statistics tracking"""
         self.stats: dict[str, CollectorStats] = {}
+        self._parsers: dict[str, BaseParser] = {}
         self._init_stats()
 
+        # Shared by every request and retry
+        self._timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
+
+        # HTTP session is created lazily inside the event loop and reused
+        # across collect() calls so pooled connections survive between runs
+        self._session: aiohttp.ClientSession | None = None
+
+        # Conditional GET state per feed: (ETag, Last-Modified) validators,
+        # the items parsed from the last full response, and the monotonic
+        # time until which that response is fresh per Cache-Control max-age
+        self._validators: dict[str, tuple[str | None, str | None]] = {}
+        self._parsed_cache: dict[str, list[NewsItem]] = {}
+        self._fresh_until: dict[str, float] = {}
+
+        # Background refresh tasks per feed, see start_prefetch()
+        self._prefetch_tasks: dict[str, asyncio.Task] = {}
+
         # Rate limiting: 2 requests per second per domain, burst of 5
         self.rate_limiter = RateLimiter(rate=2.0, burst=5, per_domain=True)
 
@@ -38,9 +91,78 @@ class RSSCollector(BaseCollector):
         self.concurrency_limiter = ConcurrencyLimiter(max_concurrent=3)
 
     def _init_stats(self) -> None:
-        """Initialize statistics for all configured feeds"""
+        """Initialize statistics and parsers for all configured feeds"""
         for feed in settings.rss_feeds:
             self.stats[feed["name"]] = CollectorStats(source=feed["name"])
+            self._parsers[feed["name"]] = self._get_parser(feed["name"])
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+
+        Returns:
+            aiohttp client session backed by a keep-alive connection pool
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=3,
+                resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                happy_eyeballs_delay=0.25,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def start_prefetch(self) -> None:
+        """Start refreshing every feed in the background
+
+        Each feed is refetched every ``ttl`` seconds from its feed config
+        (default: settings.prefetch_interval), starting at a random offset
+        within that interval so feeds do not refresh in bursts. While
+        prefetch runs, collect() serves feeds from the warm cache and only
+        fetches feeds that have not been loaded yet.
+        """
+        for feed in settings.rss_feeds:
+            task = self._prefetch_tasks.get(feed["name"])
+            if task is None or task.done():
+                self._prefetch_tasks[feed["name"]] = asyncio.create_task(
+                    self._prefetch_loop(feed)
+                )
+
+        logger.info(f"Started background prefetch for {len(settings.rss_feeds)} feeds")
+
+    async def stop_prefetch(self) -> None:
+        """Cancel all background prefetch tasks"""
+        tasks = list(self._prefetch_tasks.values())
+        self._prefetch_tasks.clear()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _prefetch_loop(self, feed_config: dict[str, str]) -> None:
+        """Periodically refresh a single feed into the parsed cache
+
+        Args:
+            feed_config: Feed configuration with url, name and optional ttl
+        """
+        ttl = float(feed_config.get("ttl", settings.prefetch_interval))
+
+        # Jitter the first refresh to avoid a thundering herd
+        await asyncio.sleep(random.uniform(0, ttl))
+        while True:
+            await self._fetch_feed(self._get_session(), feed_config)
+            await asyncio.sleep(ttl)
+
+    async def close(self) -> None:
+        """Stop background prefetch and close the shared HTTP session"""
+        await self.stop_prefetch()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def collect(self) -> list[NewsItem]:
         """Collect news items from all configured RSS feeds
@@ -48,47 +170,92 @@ class RSSCollector(BaseCollector):
         Returns:
             List of deduplicated NewsItem objects from all feeds
         """
+        items: list[NewsItem] = []
+        async for batch in self.collect_batched():
+            items.extend(batch)
+        return items
+
+    async def collect_batched(
+        self, batch_size: int = 256
+    ) -> AsyncIterator[list[NewsItem]]:
+        """Collect news items from all feeds in batches as feeds complete
+
+        Lets consumers store or embed items in bulk while slower feeds
+        are still being fetched.
+
+        Args:
+            batch_size: Maximum number of items per batch
+
+        Yields:
+            Lists of deduplicated NewsItem objects, at most batch_size long
+        """
         logger.info(f"Starting RSS collection from {len(settings.rss_feeds)} feeds")
 
         # Create tasks for concurrent fetching
+        session = self._get_session()
         tasks = []
-        async with aiohttp.ClientSession() as session:
-            for feed in settings.rss_feeds:
-                task = self._fetch_feed(session, feed)
-                tasks.append(task)
+        for feed in settings.rss_feeds:
+            task = self._get_feed_items(session, feed)
+            tasks.append(task)
 
-            # Gather results concurrently
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Parsers emit naive UTC dates, so compare against a naive cutoff
+        # and only convert the dates of items that arrive timezone-aware
+        cutoff_date = datetime.now(UTC).replace(tzinfo=None) - timedelta(
+            days=settings.max_age_days
+        )
 
-        # Combine and deduplicate results
-        all_items: list[NewsItem] = []
-        seen_ids: set[str] = set()
+        # Deduplicate and filter old articles as each feed completes
+        batch: list[NewsItem] = []
+        seen_ids: set[int] = set()
+        too_old = 0
 
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Feed collection error: {result}")
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                result = await next_result
+            except Exception as e:
+                logger.error(f"Feed collection error: {e}")
                 continue
 
-            if result:
-                for item in result:
-                    if item.id not in seen_ids:
-                        seen_ids.add(item.id)
-                        all_items.append(item)
+            for item in result:
+                published_at = item.published_at
+                if published_at.tzinfo is not None:
+                    published_at = published_at.astimezone(UTC).replace(tzinfo=None)
+                if published_at <= cutoff_date:
+                    too_old += 1
+                    continue
+
+                key = self._id_key(item.id)
+                if key not in seen_ids:
+                    seen_ids.add(key)
+                    batch.append(item)
+
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
 
-        # Filter old articles
-        cutoff_date = datetime.now(UTC) - timedelta(days=settings.max_age_days)
-        filtered_items = [
-            item
-            for item in all_items
-            if item.published_at.replace(tzinfo=UTC) > cutoff_date
-        ]
+        if batch:
+            yield batch
 
         logger.info(
-            f"Collected {len(filtered_items)} unique items "
-            f"({len(all_items) - len(filtered_items)} filtered as too old)"
+            f"Collected {len(seen_ids)} unique items ({too_old} filtered as too old)"
         )
 
-        return filtered_items
+    async def _get_feed_items(
+        self, session: aiohttp.ClientSession, feed_config: dict[str, str]
+    ) -> list[NewsItem]:
+        """Get a feed's items from the prefetch cache or the network
+
+        Args:
+            session: aiohttp client session
+            feed_config: Feed configuration with url and name
+
+        Returns:
+            List of NewsItem objects from the feed
+        """
+        name = feed_config["name"]
+        if name in self._prefetch_tasks and name in self._parsed_cache:
+            return self._parsed_cache[name]
+        return await self._fetch_feed(session, feed_config)
 
     async def _fetch_feed(
         self, session: aiohttp.ClientSession, feed_config: dict[str, str]
@@ -108,11 +275,26 @@ class RSSCollector(BaseCollector):
 
         start_time = time.time()
 
+        # Serve the previous result while the server says it is still fresh
+        cached_items = self._parsed_cache.get(name)
+        if cached_items is not None and time.monotonic() < self._fresh_until.get(
+            name, 0.0
+        ):
+            logger.debug(f"Using cached items for {name} (Cache-Control max-age)")
+            return cached_items
+
+        headers = dict(self.DEFAULT_HEADERS)
+
+        # Only revalidate when there is a cached result to fall back on
+        if cached_items is not None:
+            etag, last_modified = self._validators.get(name, (None, None))
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         for attempt in range(settings.max_retries):
             try:
-                # Create timeout
-                timeout = aiohttp.ClientTimeout(total=settings.request_timeout)
-
                 # Fetch RSS content
                 logger.debug(f"Fetching {name} (attempt {attempt + 1})")
 
@@ -122,29 +304,53 @@ class RSSCollector(BaseCollector):
                 # Apply concurrency limiting
                 semaphore = await self.concurrency_limiter.acquire(url)
                 async with semaphore:
-                    async with session.get(url, timeout=timeout) as response:
-                        if response.status != 200:
+                    async with session.get(
+                        url, timeout=self._timeout, headers=headers
+                    ) as response:
+                        not_modified = (
+                            response.status == 304 and cached_items is not None
+                        )
+                        if response.status != 200 and not not_modified:
                             raise aiohttp.ClientResponseError(
                                 request_info=response.request_info,
                                 history=response.history,
                                 status=response.status,
                             )
 
-                        content = await response.text()
+                        # Hand the raw bytes to lxml: it decodes them per the
+                        # XML declaration, without an intermediate str copy
+                        content = b"" if not_modified else await response.read()
+                        response_headers = response.headers
+
+                self._fresh_until[name] = time.monotonic() + self._cache_ttl(
+                    response_headers
+                )
 
-                # Parse content with appropriate parser
-                parser = self._get_parser(name)
-                items = await parser.parse(content)
+                if not_modified:
+                    # Feed unchanged since last fetch: skip parsing entirely
+                    logger.debug(f"{name} not modified, reusing cached items")
+                    items = cached_items
+                else:
+                    # Parse in a worker thread so other fetches keep running
+                    parser = self._parsers.get(name) or self._get_parser(name)
+                    items = await asyncio.to_thread(parser._parse_sync, content)
+
+                    self._parsed_cache[name] = items
+                    self._validators[name] = (
+                        response_headers.get("ETag"),
+                        response_headers.get("Last-Modified"),
+                    )
 
                 # Update success statistics
                 elapsed = time.time() - start_time
                 stats.success_count += 1
                 stats.last_success = datetime.now(UTC)
-                stats.average_response_time = (
-                    stats.average_response_time * (stats.success_count - 1) + elapsed
+                # Incremental (Welford) mean: no growing sum to lose precision
+                stats.average_response_time += (
+                    elapsed - stats.average_response_time
                 ) / stats.success_count
-                stats.average_items = (
-                    stats.average_items * (stats.success_count - 1) + len(items)
+                stats.average_items += (
+                    len(items) - stats.average_items
                 ) / stats.success_count
 
                 logger.info(
@@ -177,8 +383,44 @@ class RSSCollector(BaseCollector):
 
         return []
 
-    def _get_parser(self, feed_name: str) -> StandardParser | ArxivParser:
-        """Get appropriate parser for the feed
+    @staticmethod
+    def _id_key(item_id: str | None) -> int:
+        """Reduce an item ID to a 64-bit integer for batch deduplication
+
+        Generated IDs are already BLAKE2b hex digests, so their first 16 hex
+        digits are used directly instead of hashing the string again.
+
+        Args:
+            item_id: NewsItem ID
+
+        Returns:
+            Integer key identifying the item within this process
+        """
+        try:
+            return int(item_id[:16], 16)
+        except (TypeError, ValueError):
+            return hash(item_id)
+
+    @staticmethod
+    def _cache_ttl(headers: Any) -> float:
+        """Get local freshness lifetime from a Cache-Control header
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Seconds the response may be reused without a request (0 if none)
+        """
+        cache_control = headers.get("Cache-Control", "")
+        if "no-cache" in cache_control or "no-store" in cache_control:
+            return 0.0
+
+        match = _MAX_AGE_RE.search(cache_control)
+        return float(match.group(1)) if match else 0.0
+
+    @staticmethod
+    def _get_parser(feed_name: str) -> BaseParser:
+        """Create the appropriate parser for the feed
 
         Args:
             feed_name: Name of the RSS feed
@@ -26,6 +26,9 @@ class RSSCollectorWithStorage(RSSCollector):
     - Handle duplicate marking
     - Use semantic similarity for enhanced deduplication
     """
+
+    # Items per duplicate check while feeds are still being collected
+    DEDUP_BATCH_SIZE = 64
     
     def __init__(self, feeds: list[dict] | None = None):
         """Initialize collector with optional feeds list."""
@@ -42,8 +45,32 @@ class RSSCollectorWithStorage(RSSCollector):
         """
         db_manager = get_db_manager()
 
-        # Collect items using parent class
-        collected_items = await self.collect()
+        # Check each batch for duplicates as soon as it is collected, while
+        # the remaining feeds are still being fetched
+        collected_items: list[NewsItem] = []
+        items_to_store: list[NewsItem] = []
+        duplicate_count = 0
+
+        # Bound once: the loop below runs for every collected item
+        store_item = items_to_store.append
+        log_debug = logger.opt(lazy=True).debug
+
+        async for batch in self.collect_batched(batch_size=self.DEDUP_BATCH_SIZE):
+            collected_items.extend(batch)
+            duplicate_results = await self.dedup_service.check_batch(batch)
+
+            for item, dup_result in zip(batch, duplicate_results, strict=True):
+                if dup_result.is_duplicate:
+                    duplicate_count += 1
+                    # Lazy arguments: nothing is formatted unless DEBUG is on
+                    log_debug(
+                        "Duplicate found for '{}' (type: {}, score: {:.3f})",
+                        lambda item=item: item.title,
+                        lambda dup=dup_result: dup.match_type,
+                        lambda dup=dup_result: dup.similarity_score,
+                    )
+                else:
+                    store_item(item)
 
         if not collected_items:
             logger.info("No items collected from RSS feeds")
@@ -59,38 +86,35 @@ class RSSCollectorWithStorage(RSSCollector):
             run = await collector_repo.create_run("rss")
 
             new_items = []
-            duplicate_count = 0
             failed_sources = []
 
-            # Batch check for duplicates using enhanced deduplication
-            duplicate_results = await self.dedup_service.check_batch(collected_items)
-            
-            # Process each item based on duplicate check results
-            for item, dup_result in zip(collected_items, duplicate_results):
-                try:
-                    if dup_result.is_duplicate:
-                        duplicate_count += 1
-                        logger.debug(
-                            f"Duplicate found for '{item.title}' "
-                            f"(type: {dup_result.match_type}, "
-                            f"score: {dup_result.similarity_score:.3f})"
+            # Store new items with one bulk insert; rows already stored are
+            # skipped by the database and counted as duplicates
+            try:
+                inserted_ids = set(await news_repo.create_many(items_to_store))
+                new_items = [item for item in items_to_store if item.id in inserted_ids]
+                duplicate_count += len(items_to_store) - len(new_items)
+            except Exception as e:
+                # Fall back to item-by-item inserts, each in its own savepoint
+                # so one failure does not poison the session
+                logger.warning(f"Bulk insert failed, storing items one by one: {e}")
+                for item in items_to_store:
+                    try:
+                        async with session.begin_nested():
+                            await news_repo.create(item)
+                        new_items.append(item)
+                    except Exception as item_error:
+                        logger.error(
+                            f"Failed to process item {item.url}: {item_error}"
                         )
-                        continue
-
-                    # Create new item
-                    db_item = await news_repo.create(item)
-
-                    # Add to deduplication cache
-                    await dedup_repo.add_to_cache(db_item)
-                    await self.dedup_service.add_to_cache(item)
+                        if item.source not in failed_sources:
+                            failed_sources.append(item.source)
 
-                    new_items.append(item)
-                    logger.info(f"Stored new item: {item.title}")
-
-                except Exception as e:
-                    logger.error(f"Failed to process item {item.url}: {e}")
-                    if item.source not in failed_sources:
-                        failed_sources.append(item.source)
+            # Add to deduplication cache
+            if new_items:
+                await dedup_repo.add_many_to_cache(new_items)
+                await self.dedup_service.add_many_to_cache(new_items)
+                logger.info(f"Stored {len(new_items)} new items")
 
             # Link items to collector run
             if new_items:
@@ -179,23 +203,7 @@ class RSSCollectorWithStorage(RSSCollector):
             db_items = await news_repo.get_recent(days=days, source=source, limit=limit)
 
             # Convert DB items to NewsItem models
-            items = []
-            for db_item in db_items:
-                item = NewsItem(
-                    id=db_item.id,
-                    url=db_item.url,
-                    title=db_item.title,
-                    content=db_item.content,
-                    summary=db_item.summary,
-                    source=db_item.source,
-                    published_at=db_item.published_at,
-                    collected_at=db_item.collected_at,
-                    tags=db_item.tags,
-                    metadata=db_item.extra_metadata,
-                )
-                items.append(item)
-
-            return items
+            return NewsItem.from_db_many(db_items)
 
     async def get_collection_summary(self, days: int = 7) -> dict:
         """Get summary of collection activity.
@@ -214,7 +222,9 @@ class RSSCollectorWithStorage(RSSCollector):
 
             # Get counts by source
             start_date = datetime.now(UTC) - timedelta(days=days)
-            source_counts = await news_repo.count_by_source(start_date)
+            source_counts, total_items = await news_repo.count_by_source_with_total(
+                start_date
+            )
 
             # Get collector stats
             stats = await collector_repo.get_collector_stats("rss", days=days)
@@ -224,8 +234,8 @@ class RSSCollectorWithStorage(RSSCollector):
 
             return {
                 "period_days": days,
-                "sources": dict(source_counts),
-                "total_items": sum(count for _, count in source_counts),
+                "sources": source_counts,
+                "total_items": total_items,
                 "collector_stats": {
                     "success_count": stats.success_count,
                     "failure_count": stats.failure_count,
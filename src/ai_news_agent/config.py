@@ -33,6 +33,25 @@ class Settings(BaseSettings):
         default=False,
         description="Echo SQL statements for debugging",
     )
+    database_pool_size: int = Field(
+        default=5,
+        ge=1,
+        description="Connections kept open by the pool (not used for SQLite)",
+    )
+    database_max_overflow: int = Field(
+        default=10,
+        ge=0,
+        description="Extra connections opened beyond the pool size under load",
+    )
+    database_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds before a pooled connection is replaced (-1 disables)",
+    )
+    database_pool_timeout: float = Field(
+        default=30,
+        gt=0,
+        description="Seconds to wait for a free pooled connection",
+    )
     data_dir: Path = Field(default=Path("./data"))
     output_dir: Path = Field(default=Path("./output"))
 
@@ -56,13 +75,47 @@ class Settings(BaseSettings):
     # Processing
     max_age_days: int = Field(default=7, ge=1, le=30)
     title_similarity_threshold: float = Field(default=0.85, ge=0.0, le=1.0)
-    content_similarity_threshold: float = Field(default=0.90, ge=0.0, le=1.0)
+    content_similarity_threshold: float = Field(
+        default=0.80,
+        ge=0.0,
+        le=1.0,
+        description="Minimum cosine similarity of embeddings for duplicates",
+    )
     min_content_length: int = Field(default=100, ge=10)
+    embedding_quantize: bool = Field(
+        default=False,
+        description="Run the embedding model with int8 dynamic quantization "
+        "(CPU only)",
+    )
+    deduplication_low_memory: bool = Field(
+        default=False,
+        description="Keep deduplication candidate embeddings as float16",
+    )
+    deduplication_cache_size: int = Field(
+        default=5000,
+        ge=1,
+        description="Maximum items kept in the in-memory deduplication cache",
+    )
+    deduplication_min_text_chars: int = Field(
+        default=32,
+        ge=0,
+        description="Shortest title plus content compared by embedding",
+    )
 
     # Network
     request_timeout: int = Field(default=30, ge=5, le=300)
     max_retries: int = Field(default=3, ge=1, le=10)
     retry_delay: float = Field(default=1.0, ge=0.1, le=60.0)
+    prefetch_enabled: bool = Field(
+        default=False,
+        description="Refresh feeds in the background while the scheduler runs",
+    )
+    prefetch_interval: int = Field(
+        default=3600,
+        ge=60,
+        description="Seconds between background refreshes of each feed "
+        "(overridable per feed with a 'ttl' key)",
+    )
 
     # Logging
     log_level: str = Field(default="INFO")
@@ -1,28 +1,103 @@
 """Embedding generation service for semantic similarity."""
 
 import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
+import torch
 from loguru import logger
 from sentence_transformers import SentenceTransformer
 
 from ..config import settings
+from .store import EmbeddingStore
+
+# Loaded models shared by all EmbeddingService instances
+_MODEL_CACHE: dict[tuple[str, bool], SentenceTransformer] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _load_model(model_name: str, quantize: bool = False) -> SentenceTransformer:
+    """Load a sentence-transformer model once per process.
+
+    Args:
+        model_name: Name of the sentence-transformer model
+        quantize: Convert the model's Linear layers to dynamic int8
+
+    Returns:
+        Shared model instance in inference mode
+    """
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get((model_name, quantize))
+        if model is None:
+            logger.info(f"Loading embedding model: {model_name}")
+            model = SentenceTransformer(model_name, device="cpu" if quantize else None)
+            model.eval()
+            if quantize:
+                # int8 weights, activations quantized on the fly per batch
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+                logger.info(f"Quantized embedding model {model_name} to int8")
+            _MODEL_CACHE[(model_name, quantize)] = model
+        return model
+
+
+@lru_cache(maxsize=4096)
+def _url_domain(url: str) -> str:
+    """Extract the network location of a URL with plain string splits.
+
+    Equivalent to urlparse(url).netloc for absolute URLs, without building
+    a full ParseResult. Cached because the same URLs are combined on every
+    deduplication pass.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Network location, or an empty string if the URL has no scheme
+    """
+    _, sep, rest = url.partition("://")
+    if not sep:
+        return ""
+    for delimiter in "/?#":
+        rest = rest.partition(delimiter)[0]
+    return rest
 
 
 class EmbeddingService:
     """Service for generating text embeddings.
 
     Uses sentence-transformers for efficient semantic similarity computation.
-    Caches embeddings to disk for performance.
+    Caches embeddings on disk in a memory-mapped EmbeddingStore, with an
+    LRU of recently used embeddings in front of it.
     """
 
-    def __init__(self, model_name: str | None = None, cache_dir: Path | None = None):
+    # Maximum number of embeddings kept in the in-memory LRU
+    MEMORY_CACHE_SIZE = 5000
+
+    # Characters of content kept when combining text for similarity
+    MAX_CONTENT_LENGTH = 500
+
+    # Layout of the combined text, filled with title, content and domain
+    SIMILARITY_TEXT_TEMPLATE = "Title: {}\n\nContent: {}\n\nSource: {}"
+
+    def __init__(
+        self,
+        model_name: str | None = None,
+        cache_dir: Path | None = None,
+        quantize: bool | None = None,
+    ):
         """Initialize embedding service.
 
         Args:
             model_name: Name of the sentence-transformer model to use
             cache_dir: Directory for caching embeddings
+            quantize: Use an int8 dynamically quantized model on CPU
+                (default: settings.embedding_quantize)
         """
         self.model_name = model_name or getattr(
             settings,
@@ -32,7 +107,22 @@ class EmbeddingService:
         self.cache_dir = cache_dir or Path(
             getattr(settings, "embedding_cache_dir", ".embeddings_cache")
         )
+        self.quantize = (
+            quantize
+            if quantize is not None
+            else getattr(settings, "embedding_quantize", False)
+        )
         self.cache_dir.mkdir(exist_ok=True)
+        self.store = EmbeddingStore(self.cache_dir)
+
+        # Keyed by the model (and its precision) so embeddings from different
+        # models never share keys; copied per text instead of re-keying
+        model_key = f"{self.model_name}:int8" if self.quantize else self.model_name
+        self._key_hasher = hashlib.blake2b(
+            digest_size=16, key=hashlib.blake2b(model_key.encode()).digest()
+        )
+
+        self._memory_cache: OrderedDict[str, np.ndarray] = OrderedDict()
 
         self._model: SentenceTransformer | None = None
         self._embedding_dim: int | None = None
@@ -41,8 +131,7 @@ class EmbeddingService:
     def model(self) -> SentenceTransformer:
         """Lazy load the embedding model."""
         if self._model is None:
-            logger.info(f"Loading embedding model: {self.model_name}")
-            self._model = SentenceTransformer(self.model_name)
+            self._model = _load_model(self.model_name, self.quantize)
             self._embedding_dim = self._model.get_sentence_embedding_dimension()
             logger.info(f"Model loaded. Embedding dimension: {self._embedding_dim}")
         return self._model
@@ -55,40 +144,43 @@ class EmbeddingService:
         return self._embedding_dim
 
     def _get_cache_key(self, text: str) -> str:
-        """Generate cache key for text."""
-        # Include model name in hash to avoid conflicts
-        content = f"{self.model_name}:{text}"
-        return hashlib.sha256(content.encode()).hexdigest()
-
-    def _get_cache_path(self, cache_key: str) -> Path:
-        """Get cache file path for a cache key."""
-        # Use subdirectories to avoid too many files in one directory
-        subdir = cache_key[:2]
-        return self.cache_dir / subdir / f"{cache_key}.npy"
-
-    def _load_from_cache(self, cache_key: str) -> np.ndarray | None:
-        """Load embedding from cache."""
-        cache_path = self._get_cache_path(cache_key)
-        if cache_path.exists():
-            try:
-                return np.load(cache_path)
-            except Exception as e:
-                logger.warning(f"Failed to load embedding from cache: {e}")
-                # Remove corrupted cache file
-                cache_path.unlink(missing_ok=True)
-        return None
-
-    def _save_to_cache(self, cache_key: str, embedding: np.ndarray) -> None:
-        """Save embedding to cache."""
-        cache_path = self._get_cache_path(cache_key)
-        cache_path.parent.mkdir(exist_ok=True)
-        try:
-            np.save(cache_path, embedding)
-        except Exception as e:
-            logger.warning(f"Failed to save embedding to cache: {e}")
+        """Generate cache key for text (128-bit keyed BLAKE2b, hex)."""
+        hasher = self._key_hasher.copy()
+        hasher.update(text.encode())
+        return hasher.hexdigest()
+
+    def _quantize(self, embeddings: np.ndarray) -> np.ndarray:
+        """Round embeddings to the cache's float16 precision.
+
+        Fresh and cached embeddings are then identical, so similarity
+        scores do not depend on whether a text was already cached.
+
+        Args:
+            embeddings: Unit-length embeddings from the model
+
+        Returns:
+            float32 array holding float16-representable values
+        """
+        return np.asarray(embeddings, dtype=EmbeddingStore.DTYPE).astype(np.float32)
+
+    def _memory_get(self, key: str) -> np.ndarray | None:
+        """Look up an embedding in the in-memory LRU."""
+        embedding = self._memory_cache.get(key)
+        if embedding is not None:
+            self._memory_cache.move_to_end(key)
+        return embedding
+
+    def _memory_put(self, key: str, embedding: np.ndarray) -> None:
+        """Add an embedding to the in-memory LRU, evicting the oldest."""
+        # Shared between callers, so guard against in-place modification
+        embedding.flags.writeable = False
+        self._memory_cache[key] = embedding
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > self.MEMORY_CACHE_SIZE:
+            self._memory_cache.popitem(last=False)
 
     def encode(self, text: str, use_cache: bool = True) -> np.ndarray:
-        """Generate embedding for text.
+        """Generate a unit-length embedding for text.
 
         Args:
             text: Text to encode
@@ -99,20 +191,28 @@ class EmbeddingService:
         """
         if use_cache:
             cache_key = self._get_cache_key(text)
-            cached = self._load_from_cache(cache_key)
+            cached = self._memory_get(cache_key)
+            if cached is not None:
+                self.store.touch([cache_key])
+                return cached
+            cached = self.store.get(cache_key)
             if cached is not None:
+                self._memory_put(cache_key, cached)
                 return cached
 
         # Generate embedding
-        embedding = self.model.encode(text, convert_to_numpy=True)
+        embedding = self._quantize(
+            self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
+        )
 
         if use_cache:
-            self._save_to_cache(cache_key, embedding)
+            self.store.put(cache_key, embedding)
+            self._memory_put(cache_key, embedding)
 
         return embedding
 
     def encode_batch(self, texts: list[str], use_cache: bool = True) -> np.ndarray:
-        """Generate embeddings for multiple texts.
+        """Generate unit-length embeddings for multiple texts.
 
         Args:
             texts: List of texts to encode
@@ -124,41 +224,68 @@ class EmbeddingService:
         if not texts:
             return np.array([])
 
-        embeddings = []
-        texts_to_encode = []
-        text_indices = []
-
-        # Check cache first
-        for i, text in enumerate(texts):
-            if use_cache:
-                cache_key = self._get_cache_key(text)
-                cached = self._load_from_cache(cache_key)
-                if cached is not None:
-                    embeddings.append((i, cached))
-                    continue
-
-            texts_to_encode.append(text)
-            text_indices.append(i)
+        cache_keys = [self._get_cache_key(text) for text in texts]
+        memory_hits: list[int] = []
+        memory_rows: list[np.ndarray] = []
+        store_hits: list[int] = []
+        store_rows = np.empty((0, 0), dtype=np.float32)
+        missing = list(range(len(texts)))
 
-        # Batch encode uncached texts
-        if texts_to_encode:
-            new_embeddings = self.model.encode(texts_to_encode, convert_to_numpy=True)
+        if use_cache:
+            # In-memory LRU first, then one gather from the store for the rest
+            missing = []
+            for i, key in enumerate(cache_keys):
+                embedding = self._memory_get(key)
+                if embedding is None:
+                    missing.append(i)
+                else:
+                    memory_hits.append(i)
+                    memory_rows.append(embedding)
+            self.store.touch([cache_keys[i] for i in memory_hits])
+
+            store_rows, positions = self.store.get_many(
+                [cache_keys[i] for i in missing]
+            )
+            store_hits = [missing[position] for position in positions]
+            for i, embedding in zip(store_hits, store_rows, strict=True):
+                self._memory_put(cache_keys[i], embedding)
+            if store_hits:
+                found = set(store_hits)
+                missing = [i for i in missing if i not in found]
+
+        new_rows = None
+        if missing:
+            # Batch encode uncached texts
+            new_rows = self._quantize(
+                self.model.encode(
+                    [texts[i] for i in missing],
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                )
+            )
 
-            # Cache new embeddings
             if use_cache:
-                for text, embedding in zip(
-                    texts_to_encode, new_embeddings, strict=False
-                ):
-                    cache_key = self._get_cache_key(text)
-                    self._save_to_cache(cache_key, embedding)
-
-            # Add to results
-            for idx, embedding in zip(text_indices, new_embeddings, strict=False):
-                embeddings.append((idx, embedding))
-
-        # Sort by original index and extract embeddings
-        embeddings.sort(key=lambda x: x[0])
-        return np.array([emb for _, emb in embeddings])
+                self.store.put_many([cache_keys[i] for i in missing], new_rows)
+                self.store.flush_async()
+                for i, embedding in zip(missing, new_rows, strict=True):
+                    self._memory_put(cache_keys[i], embedding)
+
+        # Scatter each group into one preallocated array, in input order
+        if new_rows is not None:
+            dim = new_rows.shape[1]
+        elif store_hits:
+            dim = store_rows.shape[1]
+        else:
+            dim = memory_rows[0].shape[0]
+
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+        if memory_hits:
+            embeddings[memory_hits] = memory_rows
+        if store_hits:
+            embeddings[store_hits] = store_rows
+        if new_rows is not None:
+            embeddings[missing] = new_rows
+        return embeddings
 
     def cosine_similarity(
         self, embedding1: np.ndarray, embedding2: np.ndarray
@@ -166,93 +293,106 @@ class EmbeddingService:
         """Calculate cosine similarity between two embeddings.
 
         Args:
-            embedding1: First embedding
-            embedding2: Second embedding
+            embedding1: First unit-length embedding, as returned by encode()
+            embedding2: Second unit-length embedding
 
         Returns:
-            Cosine similarity score (0-1)
+            Cosine similarity score (-1 to 1)
         """
-        # Normalize vectors
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
-
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-
-        # Calculate cosine similarity
-        similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
-
-        # Ensure result is in [0, 1] range
-        return float((similarity + 1) / 2)
+        # Unit-length vectors: the dot product is the cosine
+        return float(np.dot(embedding1, embedding2))
 
     def find_most_similar(
         self,
         query_embedding: np.ndarray,
         candidate_embeddings: np.ndarray,
-        threshold: float = 0.8,
+        threshold: float = 0.6,
         top_k: int | None = None,
     ) -> list[tuple[int, float]]:
         """Find most similar embeddings to query.
 
         Args:
-            query_embedding: Query embedding
-            candidate_embeddings: Array of candidate embeddings
-            threshold: Minimum similarity threshold
+            query_embedding: Unit-length query embedding, as returned by encode()
+            candidate_embeddings: Array of unit-length candidate embeddings
+            threshold: Minimum cosine similarity
             top_k: Return only top K results
 
         Returns:
-            List of (index, similarity_score) tuples, sorted by similarity
+            List of (index, cosine similarity) tuples, sorted by similarity
         """
         if len(candidate_embeddings) == 0:
             return []
 
-        # Vectorized cosine similarity calculation
-        query_norm = np.linalg.norm(query_embedding)
-        if query_norm == 0:
-            return []
-
-        # Normalize query
-        query_normalized = query_embedding / query_norm
+        # One matrix-vector product for all candidates; embeddings are unit
+        # length, so the dot products are the cosines
+        cosines = candidate_embeddings @ query_embedding
+        indices = np.flatnonzero(cosines >= threshold)
 
-        # Calculate similarities
-        similarities = []
-        for i, candidate in enumerate(candidate_embeddings):
-            candidate_norm = np.linalg.norm(candidate)
-            if candidate_norm == 0:
-                continue
+        # Select top_k in O(N) before sorting only those
+        if top_k is not None and top_k < len(indices):
+            if top_k <= 0:
+                return []
+            indices = indices[np.argpartition(-cosines[indices], top_k - 1)[:top_k]]
 
-            # Normalized dot product
-            similarity = np.dot(query_normalized, candidate / candidate_norm)
-            # Convert to 0-1 range
-            similarity = float((similarity + 1) / 2)
+        # Sort by similarity (descending), handed back as plain Python numbers
+        indices = indices[np.argsort(-cosines[indices], kind="stable")]
+        return list(zip(indices.tolist(), cosines[indices].tolist(), strict=True))
 
-            if similarity >= threshold:
-                similarities.append((i, similarity))
+    def top_k_similar(
+        self,
+        query_embeddings: np.ndarray,
+        candidate_embeddings: np.ndarray,
+        k: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the k most similar candidates for each of several queries.
 
-        # Sort by similarity (descending)
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        One matrix product scores every pair, np.argpartition picks each
+        row's top k in O(N), and only those k are sorted.
 
-        # Limit to top_k if specified
-        if top_k is not None:
-            similarities = similarities[:top_k]
+        Args:
+            query_embeddings: Unit-length query embeddings, one row each
+            candidate_embeddings: Unit-length candidate embeddings
+            k: Candidates to return per query (capped at the candidate count)
 
-        return similarities
+        Returns:
+            Tuple of (indices, cosine similarities), both of shape
+            [queries, k] and sorted by similarity, best first
+        """
+        queries = np.atleast_2d(query_embeddings)
+        similarities = queries @ candidate_embeddings.T.astype(np.float32, copy=False)
+
+        k = min(k, similarities.shape[1])
+        if k <= 0:
+            return (
+                np.empty((len(queries), 0), dtype=np.intp),
+                np.empty((len(queries), 0), dtype=np.float32),
+            )
+
+        top = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(similarities, top, axis=1)
+        order = np.argsort(-scores, axis=1, kind="stable")
+        return (
+            np.take_along_axis(top, order, axis=1),
+            np.take_along_axis(scores, order, axis=1),
+        )
 
     def clear_cache(self) -> int:
         """Clear all cached embeddings.
 
         Returns:
-            Number of cache files removed
+            Number of cached embeddings removed, including any per-file
+            entries left over from the previous cache layout
         """
-        count = 0
-        for cache_file in self.cache_dir.rglob("*.npy"):
+        self._memory_cache.clear()
+        count = self.store.clear()
+        for cache_file in self.cache_dir.glob("*/*.npy"):
             try:
                 cache_file.unlink()
                 count += 1
             except Exception as e:
                 logger.warning(f"Failed to remove cache file {cache_file}: {e}")
 
-        logger.info(f"Cleared {count} embedding cache files")
+        logger.info(f"Cleared {count} cached embeddings")
         return count
 
     def combine_text_for_similarity(self, title: str, content: str, url: str) -> str:
@@ -266,20 +406,41 @@ class EmbeddingService:
         Returns:
             Combined text optimized for similarity comparison
         """
-        # Extract domain from URL for context
-        from urllib.parse import urlparse
+        limit = self.MAX_CONTENT_LENGTH
+        if len(content) > limit:
+            content = content[:limit] + "..."
+        return self.SIMILARITY_TEXT_TEMPLATE.format(
+            title, content, _url_domain(str(url))
+        )
 
-        try:
-            domain = urlparse(url).netloc
-        except Exception:
-            domain = ""
+    def combine_text_for_similarity_batch(
+        self,
+        titles: Iterable[str],
+        contents: Iterable[str],
+        urls: Iterable[str],
+    ) -> list[str]:
+        """Combine titles, contents, and URLs of several articles at once.
 
-        # Truncate content to focus on beginning
-        max_content_length = 500
-        if len(content) > max_content_length:
-            content = content[:max_content_length] + "..."
+        Same output as combine_text_for_similarity() per article, built in
+        a single comprehension around the bound template so batch callers
+        skip a method call per item.
 
-        # Combine with weights (title is most important)
-        combined = f"Title: {title}\n\nContent: {content}\n\nSource: {domain}"
+        Args:
+            titles: Article titles
+            contents: Article contents (will be truncated)
+            urls: Article URLs
 
-        return combined
+        Returns:
+            Combined texts, one per article
+        """
+        # Truncate content to focus on beginning; the title is most important
+        limit = self.MAX_CONTENT_LENGTH
+        fill = self.SIMILARITY_TEXT_TEMPLATE.format
+        return [
+            fill(
+                title,
+                content[:limit] + "..." if len(content) > limit else content,
+                _url_domain(str(url)),
+            )
+            for title, content, url in zip(titles, contents, urls, strict=True)
+        ]
@@ -1,16 +1,76 @@
 """Enhanced deduplication service with semantic similarity."""
 
+import asyncio
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import NamedTuple
 
 import numpy as np
 from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..models import NewsItem
 from ..storage import DeduplicationRepository, NewsItemRepository, get_db_manager
 from ..storage.models import NewsItemDB
 from .embeddings import EmbeddingService
+from .simhash import SimHashIndex, hamming_distances, simhash, tokenize
+
+
+@lru_cache(maxsize=16384)
+def _title_fingerprint(title: str) -> int:
+    """SimHash a title.
+
+    Cached on the text itself, so a title seen again is not tokenized twice
+    and a changed title is never served a stale value.
+
+    Args:
+        title: Item title
+
+    Returns:
+        64-bit fingerprint
+    """
+    return simhash(tokenize(title))
+
+
+def _iter_old_cache_files(root: str | os.PathLike, cutoff: float) -> Iterator[str]:
+    """Find per-file embeddings of the old cache layout not modified since cutoff.
+
+    The old layout kept one ``<root>/<prefix>/<key>.npy`` file per
+    embedding. Walking it with scandir avoids building a Path per file and
+    lets the directory entries answer the is-directory checks.
+
+    Args:
+        root: Embedding cache directory
+        cutoff: POSIX timestamp; files modified before it are yielded
+
+    Yields:
+        Paths of the old files
+    """
+    try:
+        with os.scandir(root) as top:
+            subdirs = [
+                entry.path for entry in top if entry.is_dir(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return
+
+    for subdir in subdirs:
+        try:
+            with os.scandir(subdir) as entries:
+                for entry in entries:
+                    if (
+                        entry.name.endswith(".npy")
+                        and entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime < cutoff
+                    ):
+                        yield entry.path
+        except FileNotFoundError:
+            continue  # Removed concurrently
 
 
 class DuplicateMatch(NamedTuple):
@@ -19,7 +79,8 @@ class DuplicateMatch(NamedTuple):
     is_duplicate: bool
     original_id: str | None
     similarity_score: float
-    match_type: str  # 'exact_url', 'exact_title', 'similar_content'
+    # 'exact_url', 'exact_title', 'similar_title', 'similar_content'
+    match_type: str
 
 
 class DeduplicationService:
@@ -28,72 +89,131 @@ class DeduplicationService:
     Combines multiple strategies:
     1. Exact URL matching (fastest)
     2. Exact title matching
-    3. Semantic similarity using embeddings
-    4. Time-based filtering to avoid comparing with very old items
+    3. Near-identical titles via SimHash fingerprints
+    4. Semantic similarity using embeddings
+    5. Time-based filtering to avoid comparing with very old items
     """
 
+    # Items published further apart than this are never duplicates
+    DUPLICATE_WINDOW_SECONDS = 7 * 24 * 3600
+
+    # Titles at most this many bits apart are treated as the same story
+    SIMHASH_MAX_DISTANCE = 3
+
+    # Shorter titles are left to the embedding stage; a few shared words
+    # say little about whether two stories are the same
+    SIMHASH_MIN_TOKENS = 5
+
+    # Candidates per item considered by the semantic similarity check
+    SEMANTIC_TOP_K = 5
+
+    # Old cache files removed concurrently per round during cleanup
+    CLEANUP_CONCURRENCY = 64
+
     def __init__(
         self,
         embedding_service: EmbeddingService | None = None,
         similarity_threshold: float | None = None,
         lookback_days: int | None = None,
+        low_memory: bool | None = None,
     ):
         """Initialize deduplication service.
 
         Args:
             embedding_service: Service for generating embeddings
-            similarity_threshold: Threshold for considering items similar
+            similarity_threshold: Minimum cosine similarity for duplicates
             lookback_days: How many days back to check for duplicates
+            low_memory: Keep candidate embeddings as float16
+                (default: settings.deduplication_low_memory)
         """
         self.embedding_service = embedding_service or EmbeddingService()
         self.similarity_threshold = similarity_threshold or getattr(
-            settings, "content_similarity_threshold", 0.85
+            settings, "content_similarity_threshold", 0.80
         )
         self.lookback_days = lookback_days or getattr(
             settings, "deduplication_lookback_days", 30
         )
+        self.low_memory = (
+            low_memory
+            if low_memory is not None
+            else getattr(settings, "deduplication_low_memory", False)
+        )
+        # float16 halves the candidate matrix; scores are computed in float32
+        self._cache_dtype = np.float16 if self.low_memory else np.float32
+        # Bounds both the embedding LRU and the candidate items
+        self.cache_size = getattr(settings, "deduplication_cache_size", 5000)
+        # Items with less title and content text than this carry too little
+        # signal for an embedding comparison
+        self.min_text_chars = getattr(settings, "deduplication_min_text_chars", 32)
 
         # Cache for current session
-        self._embedding_cache: dict[str, np.ndarray] = {}
-        self._items_cache: list[tuple[NewsItemDB, np.ndarray]] = []
+        self._embedding_cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._items_cache: list[tuple[NewsItemDB | NewsItem, np.ndarray]] = []
+        # Candidate embeddings in one preallocated matrix, rows aligned with
+        # _items_cache. Once cache_size items are held it is used as a ring
+        # buffer: _cache_head is the slot the next item overwrites.
+        self._cache_matrix: np.ndarray | None = None
+        self._cache_rows = 0
+        self._cache_head = 0
+        # Title SimHash per cached item, aligned with _items_cache and
+        # preallocated like _cache_matrix; see _get_fingerprints()
+        self._fingerprints: np.ndarray | None = None
+        self._fingerprint_rows = 0
+        # Title fingerprints by band, rebuilt with _fingerprints; see
+        # _get_title_index()
+        self._title_index: SimHashIndex | None = None
+        # Publication times of _items_cache as epoch seconds, kept alongside
+        # the fingerprints; see _get_published_timestamps()
+        self._published_ts: np.ndarray | None = None
+        self._published_rows = 0
+        self._url_index: dict[str, str] = {}  # url -> id of recent items
         self._cache_loaded = False
 
-    async def load_recent_items_cache(self) -> None:
-        """Load recent items and their embeddings into memory cache."""
+    async def load_recent_items_cache(
+        self, session: AsyncSession | None = None
+    ) -> None:
+        """Load recent items and their embeddings into memory cache.
+
+        Args:
+            session: Open session to query with (default: a new session)
+        """
         if self._cache_loaded:
             return
 
-        db_manager = get_db_manager()
-        async with db_manager.get_session() as session:
+        async with self._session_scope(session) as session:
             news_repo = NewsItemRepository(session)
 
             # Get recent items
             recent_items = await news_repo.get_recent(
                 days=self.lookback_days,
-                limit=1000,  # Reasonable limit for memory
+                limit=min(1000, self.cache_size),  # Reasonable limit for memory
             )
 
             if not recent_items:
                 self._cache_loaded = True
                 return
 
+            # Oldest first, so the candidate ring buffer evicts in age order
+            recent_items = recent_items[::-1]
+
             # Generate embeddings for all items
             logger.info(f"Loading embeddings for {len(recent_items)} recent items")
 
-            texts = []
-            for item in recent_items:
-                combined_text = self.embedding_service.combine_text_for_similarity(
-                    item.title, item.content, item.url
-                )
-                texts.append(combined_text)
+            texts = self.embedding_service.combine_text_for_similarity_batch(
+                [item.title for item in recent_items],
+                [item.content for item in recent_items],
+                [item.url for item in recent_items],
+            )
 
             # Batch encode
             embeddings = self.embedding_service.encode_batch(texts)
 
             # Store in cache
             self._items_cache = list(zip(recent_items, embeddings, strict=False))
-            for item, embedding in self._items_cache:
-                self._embedding_cache[item.id] = embedding
+            self._remember_embeddings(recent_items, embeddings)
+            self._url_index = {str(item.url): item.id for item in recent_items}
+            self._build_candidate_matrix()
+            self._cache_head = 0
 
             self._cache_loaded = True
             logger.info(
@@ -112,24 +232,30 @@ class DeduplicationService:
         # Ensure cache is loaded
         await self.load_recent_items_cache()
 
+        # Rendering an HttpUrl is not free; do it once
+        url = str(news_item.url)
+
         db_manager = get_db_manager()
         async with db_manager.get_session() as session:
             news_repo = NewsItemRepository(session)
             dedup_repo = DeduplicationRepository(session)
 
-            # 1. Check exact URL match (fastest)
-            existing = await news_repo.get_by_url(str(news_item.url))
-            if existing:
+            # 1. Check exact URL match (fastest), recent items first
+            existing_id = self._url_index.get(url)
+            if existing_id is None:
+                existing = await news_repo.get_by_url(url)
+                existing_id = existing.id if existing else None
+            if existing_id:
                 return DuplicateMatch(
                     is_duplicate=True,
-                    original_id=existing.id,
+                    original_id=existing_id,
                     similarity_score=1.0,
                     match_type="exact_url",
                 )
 
             # 2. Check deduplication cache for exact matches
             similar_cached = await dedup_repo.find_similar(
-                str(news_item.url),
+                url,
                 news_item.title,
                 news_item.content,
                 threshold=0.99,  # Very high threshold for exact matches
@@ -143,52 +269,28 @@ class DeduplicationService:
                 )
 
             # 3. Semantic similarity check
-            if self._items_cache:
+            if self._items_cache and self._has_enough_text(news_item):
                 # Generate embedding for new item
                 combined_text = self.embedding_service.combine_text_for_similarity(
-                    news_item.title, news_item.content, str(news_item.url)
+                    news_item.title, news_item.content, url
                 )
                 item_embedding = self.embedding_service.encode(combined_text)
 
-                # Compare with cached items
-                candidate_embeddings = np.array([emb for _, emb in self._items_cache])
-                similar_items = self.embedding_service.find_most_similar(
+                # Compare with cached items; both sides are unit length, so
+                # no norms are computed per check
+                top_indices, top_scores = self.embedding_service.top_k_similar(
                     item_embedding,
-                    candidate_embeddings,
-                    threshold=self.similarity_threshold,
-                    top_k=5,  # Check top 5 matches
+                    self._get_candidate_matrix(),
+                    self.SEMANTIC_TOP_K,
                 )
-
-                if similar_items:
-                    # Get the most similar item
-                    best_idx, best_score = similar_items[0]
-                    best_item, _ = self._items_cache[best_idx]
-
-                    # Additional validation: check if published dates are close
-                    time_diff = abs(
-                        (
-                            news_item.published_at - best_item.published_at
-                        ).total_seconds()
+                match = self._semantic_match(news_item, top_indices[0], top_scores[0])
+                if match is not None:
+                    logger.info(
+                        f"Duplicate found via semantic similarity: "
+                        f"'{news_item.title}' similar to {match.original_id} "
+                        f"(score: {match.similarity_score:.3f})"
                     )
-                    # If published more than 7 days apart, probably not duplicate
-                    if time_diff > 7 * 24 * 3600:
-                        logger.debug(
-                            f"Similar content found but published "
-                            f"{time_diff / 3600:.1f} hours apart, "
-                            f"not considering as duplicate"
-                        )
-                    else:
-                        logger.info(
-                            f"Duplicate found via semantic similarity: "
-                            f"'{news_item.title}' similar to '{best_item.title}' "
-                            f"(score: {best_score:.3f})"
-                        )
-                        return DuplicateMatch(
-                            is_duplicate=True,
-                            original_id=best_item.id,
-                            similarity_score=best_score,
-                            match_type="similar_content",
-                        )
+                    return match
 
         return DuplicateMatch(
             is_duplicate=False,
@@ -210,116 +312,537 @@ class DeduplicationService:
         embedding = self.embedding_service.encode(combined_text)
 
         # Add to memory cache
-        self._embedding_cache[news_item.id] = embedding
+        self._remember_embeddings([news_item], [embedding])
+        self._append_candidates([news_item], embedding.reshape(1, -1))
 
         # Note: The database cache update is handled by the storage layer
 
-    async def check_batch(self, news_items: list[NewsItem]) -> list[DuplicateMatch]:
+    async def add_many_to_cache(self, news_items: list[NewsItem]) -> None:
+        """Add several news items to the deduplication cache at once.
+
+        Args:
+            news_items: News items to add
+        """
+        if not news_items:
+            return
+
+        # Generate all embeddings in one batch
+        combined_texts = self.embedding_service.combine_text_for_similarity_batch(
+            [item.title for item in news_items],
+            [item.content for item in news_items],
+            [item.url for item in news_items],
+        )
+        embeddings = self.embedding_service.encode_batch(combined_texts)
+
+        # Add to memory cache
+        self._remember_embeddings(news_items, embeddings)
+        self._append_candidates(news_items, embeddings)
+
+    def _remember_embeddings(
+        self, news_items: list[NewsItem | NewsItemDB], embeddings: np.ndarray
+    ) -> None:
+        """Put embeddings into the bounded LRU, evicting the oldest entries.
+
+        Args:
+            news_items: Items the embeddings belong to
+            embeddings: Embeddings, one row per item
+        """
+        cache = self._embedding_cache
+        for item, embedding in zip(news_items, embeddings, strict=True):
+            cache[item.id] = embedding
+            cache.move_to_end(item.id)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def _append_candidates(
+        self, news_items: list[NewsItem], embeddings: np.ndarray
+    ) -> None:
+        """Make newly stored items candidates for later duplicate checks.
+
+        Args:
+            news_items: Items that were stored
+            embeddings: Their embeddings, one row per item
+        """
+        # Until the cache is loaded, the items will come in with the load
+        if not self._cache_loaded:
+            return
+
+        # Derived arrays that are out of date are rebuilt on next use
+        matrix_current = (
+            self._cache_matrix is not None
+            and 0 < self._cache_rows == len(self._items_cache)
+        )
+        fingerprints_current = (
+            self._fingerprints is not None
+            and self._fingerprint_rows == len(self._items_cache)
+        )
+        timestamps_current = (
+            self._published_ts is not None
+            and self._published_rows == len(self._items_cache)
+        )
+        rows = self._normalized(embeddings, self._cache_dtype)
+
+        title_index = self._title_index if fingerprints_current else None
+
+        for item, embedding, row in zip(news_items, embeddings, rows, strict=True):
+            fingerprint = self._fingerprint(item) if fingerprints_current else None
+            if len(self._items_cache) < self.cache_size:
+                slot = len(self._items_cache)
+                self._items_cache.append((item, embedding))
+                if title_index is not None:
+                    title_index.add(slot, fingerprint)
+                if fingerprints_current and slot == len(self._fingerprints):
+                    self._fingerprints = self._grown(self._fingerprints)
+                if timestamps_current and slot == len(self._published_ts):
+                    self._published_ts = self._grown(self._published_ts)
+            else:
+                # Full: overwrite the oldest candidate in place
+                slot = self._cache_head
+                self._cache_head = (slot + 1) % self.cache_size
+                evicted, _ = self._items_cache[slot]
+                evicted_url = str(evicted.url)
+                if self._url_index.get(evicted_url) == evicted.id:
+                    del self._url_index[evicted_url]
+                self._items_cache[slot] = (item, embedding)
+                if title_index is not None:
+                    title_index.remove(slot, int(self._fingerprints[slot]))
+                    title_index.add(slot, fingerprint)
+
+            if fingerprints_current:
+                self._fingerprints[slot] = fingerprint
+            if timestamps_current:
+                self._published_ts[slot] = self._timestamp(item.published_at)
+            if matrix_current:
+                if slot == len(self._cache_matrix):
+                    self._cache_matrix = self._grown(self._cache_matrix)
+                self._cache_matrix[slot] = row
+            self._url_index[str(item.url)] = item.id
+
+        if matrix_current:
+            self._cache_rows = len(self._items_cache)
+        if fingerprints_current:
+            self._fingerprint_rows = len(self._items_cache)
+        if timestamps_current:
+            self._published_rows = len(self._items_cache)
+
+    async def check_batch(
+        self, news_items: list[NewsItem], session: AsyncSession | None = None
+    ) -> list[DuplicateMatch]:
         """Check multiple news items for duplicates efficiently.
 
+        Runs in three stages: exact URL/title matches are resolved for the
+        whole batch with a couple of queries, near-identical titles are
+        caught by comparing SimHash fingerprints, then only the remaining
+        items are embedded (in one batch) and compared against the recent
+        items with a single matrix product.
+
         Args:
             news_items: List of news items to check
+            session: Open session to query with; by default at most one
+                session is opened for the whole batch
 
         Returns:
             List of DuplicateMatch results
         """
         # Ensure cache is loaded
-        await self.load_recent_items_cache()
-
-        results = []
+        await self.load_recent_items_cache(session)
+
+        # Stage 1: exact matches, no embeddings needed
+        results = await self._find_exact_matches(news_items, session)
+        survivors = [i for i, result in enumerate(results) if not result.is_duplicate]
+        if not survivors or not self._items_cache:
+            return results
+
+        # Stage 2: near-identical titles, still no embeddings needed
+        survivors = [
+            i for i in survivors if not self._match_title(news_items, results, i)
+        ]
+        if not survivors:
+            return results
+
+        # Stage 3: semantic similarity for the survivors with enough text
+        survivors = [i for i in survivors if self._has_enough_text(news_items[i])]
+        if not survivors:
+            return results
+        to_embed = [news_items[i] for i in survivors]
+        texts = self.embedding_service.combine_text_for_similarity_batch(
+            [item.title for item in to_embed],
+            [item.content for item in to_embed],
+            [item.url for item in to_embed],
+        )
+        # encode_batch returns unit-length rows and the candidate matrix is
+        # normalized when built, so the product below is the cosine directly
+        new_embeddings = self.embedding_service.encode_batch(texts)
+        top_indices, top_scores = self.embedding_service.top_k_similar(
+            new_embeddings, self._get_candidate_matrix(), self.SEMANTIC_TOP_K
+        )
 
-        # Generate embeddings for all new items
-        texts = []
-        for item in news_items:
-            combined_text = self.embedding_service.combine_text_for_similarity(
-                item.title, item.content, str(item.url)
+        # Only rows whose best score clears the threshold need a Python pass
+        passing = np.flatnonzero(top_scores[:, 0] >= self.similarity_threshold)
+        for row in passing.tolist():
+            match = self._semantic_match(
+                news_items[survivors[row]], top_indices[row], top_scores[row]
             )
-            texts.append(combined_text)
+            if match is not None:
+                results[survivors[row]] = match
 
-        new_embeddings = self.embedding_service.encode_batch(texts)
+        return results
 
-        # Check each item
-        for item, embedding in zip(news_items, new_embeddings, strict=False):
-            # First try fast checks (URL, exact title)
-            result = await self._check_exact_matches(item)
-            if result.is_duplicate:
-                results.append(result)
-                continue
-
-            # Semantic similarity check
-            if self._items_cache:
-                candidate_embeddings = np.array([emb for _, emb in self._items_cache])
-                similar_items = self.embedding_service.find_most_similar(
-                    embedding,
-                    candidate_embeddings,
-                    threshold=self.similarity_threshold,
-                    top_k=1,
-                )
+    def _semantic_match(
+        self, news_item: NewsItem, indices: np.ndarray, scores: np.ndarray
+    ) -> DuplicateMatch | None:
+        """Pick the best similar recent item published close to a news item.
 
-                if similar_items:
-                    best_idx, best_score = similar_items[0]
-                    best_item, _ = self._items_cache[best_idx]
+        Candidates are tried best first, so a match that fails the time
+        check does not hide a slightly weaker one that passes. Publication
+        gaps are computed for all candidates at once from epoch timestamps.
 
-                    # Time-based validation
-                    time_diff = abs(
-                        (item.published_at - best_item.published_at).total_seconds()
-                    )
-                    if time_diff <= 7 * 24 * 3600:  # Within 7 days
-                        results.append(
-                            DuplicateMatch(
-                                is_duplicate=True,
-                                original_id=best_item.id,
-                                similarity_score=best_score,
-                                match_type="similar_content",
-                            )
-                        )
-                        continue
-
-            results.append(
-                DuplicateMatch(
-                    is_duplicate=False,
-                    original_id=None,
-                    similarity_score=0.0,
-                    match_type="none",
+        Args:
+            news_item: Item being checked
+            indices: Its top candidate indices into the items cache, best first
+            scores: Their cosine similarities
+
+        Returns:
+            DuplicateMatch for the first acceptable candidate, or None
+        """
+        # If published more than 7 days apart, probably not duplicate
+        time_diffs = np.abs(
+            self._timestamp(news_item.published_at)
+            - self._get_published_timestamps()[indices]
+        )
+        for idx, score, time_diff in zip(
+            indices.tolist(), scores.tolist(), time_diffs.tolist(), strict=True
+        ):
+            if score < self.similarity_threshold:
+                break
+
+            if time_diff <= self.DUPLICATE_WINDOW_SECONDS:
+                candidate, _ = self._items_cache[idx]
+                return DuplicateMatch(
+                    is_duplicate=True,
+                    original_id=candidate.id,
+                    similarity_score=score,
+                    match_type="similar_content",
                 )
+            logger.debug(
+                f"Similar content found but published "
+                f"{time_diff / 3600:.1f} hours apart, "
+                f"not considering as duplicate"
             )
+        return None
 
-        return results
+    def _match_title(
+        self, news_items: list[NewsItem], results: list[DuplicateMatch], i: int
+    ) -> bool:
+        """Mark an item as a duplicate if a recent item has a near-identical title.
+
+        Args:
+            news_items: Items being checked
+            results: Results to update in place
+            i: Index of the item to check
 
-    async def _check_exact_matches(self, news_item: NewsItem) -> DuplicateMatch:
-        """Check for exact URL or title matches.
+        Returns:
+            True if the item was marked as a duplicate
+        """
+        if self.SIMHASH_MAX_DISTANCE < 0:  # Title stage disabled
+            return False
+
+        item = news_items[i]
+        tokens = tokenize(item.title)
+        if len(tokens) < self.SIMHASH_MIN_TOKENS:
+            return False
+
+        # Only items sharing a fingerprint band can be close enough
+        fingerprint = self._fingerprint(item)
+        candidates = self._get_title_index().candidates(fingerprint)
+        if not candidates:
+            return False
+        indices = np.array(sorted(candidates))
+        distances = hamming_distances(
+            fingerprint, self._get_fingerprints()[indices]
+        )
+        best = int(distances.argmin())
+        best_idx, distance = int(indices[best]), int(distances[best])
+        if distance > self.SIMHASH_MAX_DISTANCE:
+            return False
+
+        time_diff = abs(
+            self._timestamp(item.published_at)
+            - self._get_published_timestamps()[best_idx]
+        )
+        if time_diff > self.DUPLICATE_WINDOW_SECONDS:  # Not within 7 days
+            return False
+
+        best_item, _ = self._items_cache[best_idx]
+
+        results[i] = DuplicateMatch(
+            is_duplicate=True,
+            original_id=best_item.id,
+            similarity_score=1.0 - distance / 64,
+            match_type="similar_title",
+        )
+        return True
+
+    def _has_enough_text(self, item: NewsItem) -> bool:
+        """Check whether an item has enough text for a semantic comparison.
 
         Args:
-            news_item: News item to check
+            item: News item to check
 
         Returns:
-            DuplicateMatch result
+            True if its stripped title and content reach min_text_chars
         """
-        db_manager = get_db_manager()
-        async with db_manager.get_session() as session:
-            news_repo = NewsItemRepository(session)
+        return (
+            len(item.title.strip()) + len(item.content.strip())
+            >= self.min_text_chars
+        )
 
-            # Check exact URL
-            existing = await news_repo.get_by_url(str(news_item.url))
-            if existing:
-                return DuplicateMatch(
-                    is_duplicate=True,
-                    original_id=existing.id,
-                    similarity_score=1.0,
-                    match_type="exact_url",
-                )
+    @staticmethod
+    def _normalized(
+        embeddings: np.ndarray, dtype: np.dtype = np.float32
+    ) -> np.ndarray:
+        """L2-normalize embeddings into a contiguous matrix.
 
-        return DuplicateMatch(
+        Args:
+            embeddings: Embeddings, one row per item
+            dtype: dtype of the returned matrix; normalization is done in
+                float32 either way
+
+        Returns:
+            New matrix of unit rows
+        """
+        matrix = np.array(embeddings, dtype=np.float32, ndmin=2)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True).clip(min=1e-12)
+        return matrix.astype(dtype, copy=False)
+
+    def _get_candidate_matrix(self) -> np.ndarray:
+        """Get the cached items' embeddings as one normalized matrix.
+
+        Built once when the cache is loaded and updated in place as items
+        are added, so duplicate checks multiply against it directly instead
+        of stacking the rows on every call. Rebuilt if it no longer matches
+        the items cache.
+
+        Returns:
+            Matrix with one unit row per cached item (float16 in low-memory
+            mode)
+        """
+        if self._cache_matrix is None or self._cache_rows != len(self._items_cache):
+            self._build_candidate_matrix()
+        # A fresh view per call: rows may since have been overwritten in place
+        return self._cache_matrix[: self._cache_rows]
+
+    def _capacity(self, rows: int) -> int:
+        """Get the rows to allocate for a per-candidate array.
+
+        Doubles the row count, to at least 64 and at most cache_size, so
+        appending items reallocates only a logarithmic number of times.
+
+        Args:
+            rows: Rows the array must hold
+
+        Returns:
+            Capacity in rows
+        """
+        return max(min(self.cache_size, max(2 * rows, 64)), rows)
+
+    def _grown(self, array: np.ndarray) -> np.ndarray:
+        """Copy a full per-candidate array into a larger allocation.
+
+        Args:
+            array: Array whose every row is in use
+
+        Returns:
+            Array of the same dtype with the rows copied to the front
+        """
+        rows = len(array)
+        grown = np.empty((self._capacity(rows + 1), *array.shape[1:]), array.dtype)
+        grown[:rows] = array
+        return grown
+
+    def _build_candidate_matrix(self) -> None:
+        """Allocate the candidate matrix and fill it from the items cache."""
+        rows = len(self._items_cache)
+        dim = len(self._items_cache[0][1]) if rows else 0
+        self._cache_matrix = np.empty((self._capacity(rows), dim), self._cache_dtype)
+        if rows:
+            self._cache_matrix[:rows] = self._normalized(
+                [emb for _, emb in self._items_cache], self._cache_dtype
+            )
+        self._cache_rows = rows
+
+    def _fingerprint(self, item: NewsItem | NewsItemDB) -> int:
+        """Compute the SimHash fingerprint of an item's title.
+
+        Args:
+            item: News item or stored row
+
+        Returns:
+            64-bit title fingerprint
+        """
+        return _title_fingerprint(item.title if isinstance(item.title, str) else "")
+
+    def _get_fingerprints(self) -> np.ndarray:
+        """Get SimHash fingerprints of the cached items.
+
+        Computed on first use and whenever the items cache has changed size
+        without them; _append_candidates() keeps them current otherwise.
+
+        Returns:
+            uint64 array with one title fingerprint per cached item
+        """
+        rows = len(self._items_cache)
+        if self._fingerprints is None or self._fingerprint_rows != rows:
+            self._fingerprints = np.empty(self._capacity(rows), np.uint64)
+            self._fingerprints[:rows] = [
+                self._fingerprint(item) for item, _ in self._items_cache
+            ]
+            self._fingerprint_rows = rows
+            self._title_index = None
+        return self._fingerprints[:rows]
+
+    def _get_title_index(self) -> SimHashIndex:
+        """Get the band index of the cached items' title fingerprints.
+
+        Built on first use and whenever the fingerprints are rebuilt; keys
+        are items cache indices.
+
+        Returns:
+            Index finding titles within SIMHASH_MAX_DISTANCE bits
+        """
+        fingerprints = self._get_fingerprints()
+        if self._title_index is None:
+            self._title_index = SimHashIndex(self.SIMHASH_MAX_DISTANCE)
+            for idx, fingerprint in enumerate(fingerprints.tolist()):
+                self._title_index.add(idx, fingerprint)
+        return self._title_index
+
+    @staticmethod
+    def _timestamp(value: datetime) -> float:
+        """Convert a publication date to epoch seconds.
+
+        Args:
+            value: Naive (stored as UTC) or timezone-aware datetime
+
+        Returns:
+            POSIX timestamp
+        """
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.timestamp()
+
+    def _get_published_timestamps(self) -> np.ndarray:
+        """Get publication times of the cached items as epoch seconds.
+
+        Computed on first use and whenever the items cache has changed size
+        without them; _append_candidates() keeps them current otherwise.
+
+        Returns:
+            float64 array with one timestamp per cached item
+        """
+        rows = len(self._items_cache)
+        if self._published_ts is None or self._published_rows != rows:
+            self._published_ts = np.empty(self._capacity(rows), np.float64)
+            self._published_ts[:rows] = [
+                self._timestamp(item.published_at) for item, _ in self._items_cache
+            ]
+            self._published_rows = rows
+        return self._published_ts[:rows]
+
+    @staticmethod
+    def _session_scope(
+        session: AsyncSession | None,
+    ) -> AbstractAsyncContextManager[AsyncSession]:
+        """Reuse a caller's open session, or open a new one.
+
+        Args:
+            session: Session passed in by the caller, if any
+
+        Returns:
+            Async context manager yielding the session to query with
+        """
+        if session is not None:
+            return nullcontext(session)
+        return get_db_manager().get_session()
+
+    async def _find_exact_matches(
+        self, news_items: list[NewsItem], session: AsyncSession | None = None
+    ) -> list[DuplicateMatch]:
+        """Check several items for exact URL or title matches at once.
+
+        URLs of recent items are matched in memory; only the remaining items
+        are looked up in the database, with one query per kind of match.
+
+        Args:
+            news_items: News items to check
+            session: Open session to query with (default: a new session)
+
+        Returns:
+            DuplicateMatch result per item
+        """
+        no_match = DuplicateMatch(
             is_duplicate=False,
             original_id=None,
             similarity_score=0.0,
             match_type="none",
         )
+        results = [no_match] * len(news_items)
+        # Rendering an HttpUrl is not free; do it once per item
+        urls = [str(item.url) for item in news_items]
+
+        remaining: list[int] = []
+        for i, url in enumerate(urls):
+            if recent_id := self._url_index.get(url):
+                results[i] = DuplicateMatch(
+                    is_duplicate=True,
+                    original_id=recent_id,
+                    similarity_score=1.0,
+                    match_type="exact_url",
+                )
+            else:
+                remaining.append(i)
+        if not remaining:
+            return results
+
+        to_query = [news_items[i] for i in remaining]
+        async with self._session_scope(session) as session:
+            news_repo = NewsItemRepository(session)
+            dedup_repo = DeduplicationRepository(session)
+
+            stored_ids = await news_repo.get_ids_by_urls([urls[i] for i in remaining])
+            cached_ids = await dedup_repo.find_many_exact(to_query)
+
+        for i, cached_id in zip(remaining, cached_ids, strict=True):
+            if stored_id := stored_ids.get(urls[i]):
+                results[i] = DuplicateMatch(
+                    is_duplicate=True,
+                    original_id=stored_id,
+                    similarity_score=1.0,
+                    match_type="exact_url",
+                )
+            elif cached_id:
+                results[i] = DuplicateMatch(
+                    is_duplicate=True,
+                    original_id=cached_id,
+                    similarity_score=1.0,
+                    match_type="exact_title",
+                )
+
+        return results
 
     def clear_memory_cache(self) -> None:
         """Clear the in-memory cache."""
         self._embedding_cache.clear()
         self._items_cache.clear()
+        self._cache_matrix = None
+        self._cache_rows = 0
+        self._cache_head = 0
+        self._fingerprints = None
+        self._fingerprint_rows = 0
+        self._title_index = None
+        self._published_ts = None
+        self._published_rows = 0
+        self._url_index.clear()
         self._cache_loaded = False
         logger.info("Cleared deduplication memory cache")
 
@@ -342,26 +865,48 @@ class DeduplicationService:
             db_removed = await dedup_repo.cleanup_old_entries(days)
             await session.commit()
 
-        # Clean embedding cache files older than threshold
-        cache_removed = 0
+        # Drop cached embeddings not used within the threshold; pruning
+        # rewrites the store's data file, so it runs on a worker thread
         cutoff_time = datetime.now(UTC) - timedelta(days=days)
+        embeddings_removed = await asyncio.to_thread(
+            self.embedding_service.store.prune, cutoff_time.timestamp()
+        )
 
-        for cache_file in self.embedding_service.cache_dir.rglob("*.npy"):
-            try:
-                # Check file modification time
-                mtime = datetime.fromtimestamp(cache_file.stat().st_mtime, tz=UTC)
-                if mtime < cutoff_time:
-                    cache_file.unlink()
+        # Remove per-file embeddings left over from the previous cache layout:
+        # scan on one worker thread, then unlink in concurrent rounds
+        old_files = await asyncio.to_thread(
+            list,
+            _iter_old_cache_files(
+                self.embedding_service.cache_dir, cutoff_time.timestamp()
+            ),
+        )
+        cache_removed = 0
+        failed: list[tuple[str, BaseException]] = []
+        for start in range(0, len(old_files), self.CLEANUP_CONCURRENCY):
+            chunk = old_files[start : start + self.CLEANUP_CONCURRENCY]
+            outcomes = await asyncio.gather(
+                *(asyncio.to_thread(os.unlink, path) for path in chunk),
+                return_exceptions=True,
+            )
+            for path, outcome in zip(chunk, outcomes, strict=True):
+                if outcome is None:
                     cache_removed += 1
-            except Exception as e:
-                logger.warning(f"Failed to check/remove cache file {cache_file}: {e}")
+                elif not isinstance(outcome, FileNotFoundError):  # Already gone
+                    failed.append((path, outcome))
+        if failed:
+            path, error = failed[0]
+            logger.warning(
+                f"Failed to remove {len(failed)} cache files; first: {path}: {error}"
+            )
 
         logger.info(
             f"Cleanup complete: {db_removed} DB entries, "
+            f"{embeddings_removed} cached embeddings and "
             f"{cache_removed} embedding cache files removed"
         )
 
         return {
             "database_entries_removed": db_removed,
+            "embeddings_removed": embeddings_removed,
             "cache_files_removed": cache_removed,
         }
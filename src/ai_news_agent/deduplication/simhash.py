@@ -0,0 +1,138 @@
+"""64-bit SimHash fingerprints for cheap near-duplicate detection."""
+
+import hashlib
+import re
+
+import numpy as np
+
+# Word tokens of a title; punctuation and whitespace differences are ignored
+_TOKEN_RE = re.compile(r"\w+")
+
+_BITS = np.arange(64, dtype=np.uint64)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def simhash(tokens: list[str]) -> int:
+    """Compute the 64-bit SimHash fingerprint of a token list.
+
+    Each token is hashed to 64 bits; a fingerprint bit is set when more
+    tokens have it set than not. Texts sharing most of their tokens end up
+    a few bits apart.
+
+    Args:
+        tokens: Tokens of the text
+
+    Returns:
+        Fingerprint as an unsigned 64-bit integer (0 for no tokens)
+    """
+    if not tokens:
+        return 0
+
+    hashes = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest())
+            for token in tokens
+        ),
+        dtype=np.uint64,
+        count=len(tokens),
+    )
+    set_counts = ((hashes[:, None] >> _BITS) & np.uint64(1)).sum(axis=0)
+    bits = (2 * set_counts > len(tokens)).astype(np.uint64)
+    return int((bits << _BITS).sum())
+
+
+def hamming_distances(fingerprint: int, fingerprints: np.ndarray) -> np.ndarray:
+    """Count differing bits between one fingerprint and many.
+
+    Args:
+        fingerprint: Fingerprint to compare
+        fingerprints: uint64 array of fingerprints
+
+    Returns:
+        Array of Hamming distances, one per fingerprint
+    """
+    diff = fingerprints ^ np.uint64(fingerprint)
+    if hasattr(np, "bitwise_count"):  # NumPy 2: hardware popcount
+        return np.bitwise_count(diff)
+    return np.unpackbits(diff.view(np.uint8)).reshape(-1, 64).sum(axis=1)
+
+
+class SimHashIndex:
+    """Find fingerprints within a few bits of a query without a full scan.
+
+    Fingerprints are split into max_distance + 1 bands. Two fingerprints at
+    most max_distance bits apart differ in at most max_distance bands, so
+    they agree exactly on at least one; each band is indexed in a dict and
+    a lookup only gathers the keys sharing a band with the query.
+    """
+
+    def __init__(self, max_distance: int):
+        """Initialize an empty index.
+
+        Args:
+            max_distance: Largest Hamming distance lookups must find
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        bands = max_distance + 1
+        width = -(-64 // bands)
+        self._shifts = list(range(0, 64, width))
+        self._mask = (1 << width) - 1
+        self._tables: list[dict[int, set[int]]] = [{} for _ in self._shifts]
+
+    def _bands(self, fingerprint: int) -> list[int]:
+        """Split a fingerprint into its band values."""
+        return [(fingerprint >> shift) & self._mask for shift in self._shifts]
+
+    def add(self, key: int, fingerprint: int) -> None:
+        """Index a fingerprint under a key.
+
+        Args:
+            key: Caller's key for the fingerprint, e.g. a row index
+            fingerprint: 64-bit fingerprint
+        """
+        for table, band in zip(self._tables, self._bands(fingerprint), strict=True):
+            table.setdefault(band, set()).add(key)
+
+    def remove(self, key: int, fingerprint: int) -> None:
+        """Remove a key indexed with a fingerprint.
+
+        Args:
+            key: Key passed to add()
+            fingerprint: Fingerprint it was added with
+        """
+        for table, band in zip(self._tables, self._bands(fingerprint), strict=True):
+            keys = table.get(band)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del table[band]
+
+    def candidates(self, fingerprint: int) -> set[int]:
+        """Get the keys that may lie within max_distance bits of a fingerprint.
+
+        Every key within max_distance is returned; others sharing a band may
+        be too, so callers check the actual distances.
+
+        Args:
+            fingerprint: 64-bit fingerprint to look up
+
+        Returns:
+            Set of candidate keys
+        """
+        found: set[int] = set()
+        for table, band in zip(self._tables, self._bands(fingerprint), strict=True):
+            if keys := table.get(band):
+                found |= keys
+        return found
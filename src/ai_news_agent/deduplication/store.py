@@ -0,0 +1,333 @@
+"""Persistent on-disk store for text embeddings."""
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+
+def _flush_at_exit(store_ref: weakref.ref) -> None:
+    """Persist a store's unflushed rows when the interpreter exits."""
+    store = store_ref()
+    if store is not None and store._pending and store.directory.is_dir():
+        store.flush()
+
+
+class EmbeddingStore:
+    """Embedding cache backed by a single memory-mapped array.
+
+    All embeddings live as float16 rows of one ``embeddings.npy`` file that
+    is memory-mapped on first use, half the size of float32 storage. A
+    sidecar ``index.json`` maps each cache key to its row and the time it
+    was last used. Lookups are a dict probe plus an array gather instead of
+    one file per embedding.
+
+    The index is written on flush(); rows appended after the last flush are
+    simply cache misses if the process dies before that. Routine flushes
+    run on a background writer thread (see flush_async()), so callers do
+    not wait on msync and the index write, and pending rows are flushed on
+    interpreter exit so the next start finds them. The store is thread-safe but not
+    safe for concurrent use by several processes.
+    """
+
+    DATA_FILE = "embeddings.npy"
+    INDEX_FILE = "index.json"
+
+    # Rows added each time the data file runs out of space
+    GROW_ROWS = 4096
+
+    # On-disk precision; lookups are returned as float32
+    DTYPE = np.float16
+
+    def __init__(self, directory: Path, flush_every: int = 64):
+        """Initialize embedding store.
+
+        Args:
+            directory: Directory holding the data and index files
+            flush_every: Persist the index after this many unflushed additions
+        """
+        self.directory = directory
+        self.flush_every = flush_every
+
+        self._data: np.memmap | None = None
+        self._index: dict[str, list[float]] = {}  # key -> [row, last_used]
+        self._count = 0
+        self._dim: int | None = None
+        self._pending = 0
+        self._loaded = False
+
+        # Guards all state; shared with the background writer thread
+        self._lock = threading.RLock()
+        self._flush_requested = threading.Event()
+        self._writer: threading.Thread | None = None
+
+        # The daemon writer may be cut off at exit; flush synchronously then
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    @property
+    def data_path(self) -> Path:
+        """Path of the memory-mapped embeddings file."""
+        return self.directory / self.DATA_FILE
+
+    @property
+    def index_path(self) -> Path:
+        """Path of the key to row index file."""
+        return self.directory / self.INDEX_FILE
+
+    def __len__(self) -> int:
+        """Number of stored embeddings."""
+        with self._lock:
+            self._load()
+            return len(self._index)
+
+    def _load(self) -> None:
+        """Load the index and map the data file, once."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not (self.index_path.exists() and self.data_path.exists()):
+            return
+
+        try:
+            index = json.loads(self.index_path.read_text())
+            data = np.load(self.data_path, mmap_mode="r+")
+            if data.ndim != 2 or data.shape[0] < index["count"]:
+                raise ValueError("embedding data does not match index")
+            if data.dtype != self.DTYPE:
+                raise ValueError(f"unsupported embedding dtype {data.dtype}")
+        except Exception as e:
+            logger.warning(f"Discarding unreadable embedding store: {e}")
+            self.index_path.unlink(missing_ok=True)
+            self.data_path.unlink(missing_ok=True)
+            return
+
+        self._data = data
+        self._dim = data.shape[1]
+        self._count = index["count"]
+        self._index = index["keys"]
+
+    def _resize(self, capacity: int, rows: np.ndarray | None = None) -> None:
+        """Rewrite the data file with a new capacity.
+
+        Args:
+            capacity: Number of rows the new file can hold
+            rows: Rows to place at the start (default: current stored rows)
+        """
+        if rows is None:
+            rows = (
+                self._data[: self._count]
+                if self._data is not None
+                else np.empty((0, self._dim), dtype=self.DTYPE)
+            )
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.data_path.with_suffix(".tmp")
+        new_data = np.lib.format.open_memmap(
+            tmp_path, mode="w+", dtype=self.DTYPE, shape=(capacity, self._dim)
+        )
+        new_data[: len(rows)] = rows
+        new_data.flush()
+        del new_data
+
+        self._data = None
+        os.replace(tmp_path, self.data_path)
+        self._data = np.load(self.data_path, mmap_mode="r+")
+
+    def get_many(self, keys: list[str]) -> tuple[np.ndarray, list[int]]:
+        """Look up several embeddings at once.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Tuple of (found embeddings array, positions in keys they belong to)
+        """
+        with self._lock:
+            self._load()
+            if self._data is None:
+                return np.empty((0, 0), dtype=np.float32), []
+
+            now = int(time.time())
+            positions: list[int] = []
+            rows: list[int] = []
+            for i, key in enumerate(keys):
+                entry = self._index.get(key)
+                if entry is not None:
+                    entry[1] = now
+                    positions.append(i)
+                    rows.append(int(entry[0]))
+
+            # Advanced indexing gathers the rows into a fresh in-memory array
+            return self._data[rows].astype(np.float32), positions
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Look up a single embedding.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored embedding, or None if the key is not cached
+        """
+        found, _ = self.get_many([key])
+        return found[0] if len(found) else None
+
+    def touch(self, keys: list[str]) -> None:
+        """Mark embeddings as used without reading them.
+
+        Keeps entries served from a caller's own cache from being pruned.
+
+        Args:
+            keys: Cache keys to mark; unknown keys are ignored
+        """
+        with self._lock:
+            self._load()
+            now = int(time.time())
+            for key in keys:
+                if (entry := self._index.get(key)) is not None:
+                    entry[1] = now
+
+    def put_many(self, keys: list[str], embeddings: np.ndarray) -> None:
+        """Store several embeddings at once.
+
+        Args:
+            keys: Cache keys
+            embeddings: Embeddings, one row per key
+        """
+        with self._lock:
+            self._load()
+            embeddings = np.asarray(embeddings, dtype=self.DTYPE)
+            if embeddings.ndim == 1:
+                embeddings = embeddings.reshape(1, -1)
+            if not keys:
+                return
+
+            if self._dim is None:
+                self._dim = embeddings.shape[1]
+            elif embeddings.shape[1] != self._dim:
+                logger.warning(
+                    f"Not caching embeddings of dimension {embeddings.shape[1]}, "
+                    f"store holds dimension {self._dim}"
+                )
+                return
+
+            needed = self._count + len(keys)
+            capacity = 0 if self._data is None else self._data.shape[0]
+            if needed > capacity:
+                grow = -(-(needed - capacity) // self.GROW_ROWS) * self.GROW_ROWS
+                self._resize(capacity + grow)
+
+            now = int(time.time())
+            for key, embedding in zip(keys, embeddings, strict=True):
+                entry = self._index.get(key)
+                if entry is None:
+                    self._data[self._count] = embedding
+                    self._index[key] = [self._count, now]
+                    self._count += 1
+                else:
+                    self._data[int(entry[0])] = embedding
+                    entry[1] = now
+
+            self._pending += len(keys)
+            if self._pending >= self.flush_every:
+                self.flush_async()
+
+    def put(self, key: str, embedding: np.ndarray) -> None:
+        """Store a single embedding.
+
+        Args:
+            key: Cache key
+            embedding: Embedding vector
+        """
+        self.put_many([key], embedding)
+
+    def flush(self) -> None:
+        """Persist pending rows and the index to disk."""
+        with self._lock:
+            if self._data is None:
+                return
+
+            try:
+                self._data.flush()
+                tmp_path = self.index_path.with_suffix(".tmp")
+                tmp_path.write_text(
+                    json.dumps({"count": self._count, "keys": self._index})
+                )
+                os.replace(tmp_path, self.index_path)
+                self._pending = 0
+            except Exception as e:
+                logger.warning(f"Failed to persist embedding store: {e}")
+
+    def flush_async(self) -> None:
+        """Request a flush from the background writer thread and return."""
+        with self._lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="embedding-store-writer", daemon=True
+                )
+                self._writer.start()
+        self._flush_requested.set()
+
+    def _write_loop(self) -> None:
+        """Background writer: flush whenever requested."""
+        while True:
+            self._flush_requested.wait()
+            # Requests arriving while flushing are coalesced into the next one
+            self._flush_requested.clear()
+            self.flush()
+
+    def prune(self, older_than: float) -> int:
+        """Drop embeddings not used since a point in time and compact the file.
+
+        Args:
+            older_than: POSIX timestamp; entries last used before it are removed
+
+        Returns:
+            Number of embeddings removed
+        """
+        with self._lock:
+            self._load()
+            stale = [key for key, (_, used) in self._index.items() if used < older_than]
+            if not stale:
+                return 0
+
+            for key in stale:
+                del self._index[key]
+
+            kept_rows = [int(row) for row, _ in self._index.values()]
+            rows = self._data[kept_rows]
+            for new_row, entry in enumerate(self._index.values()):
+                entry[0] = new_row
+            self._count = len(kept_rows)
+
+            capacity = -(-max(self._count, 1) // self.GROW_ROWS) * self.GROW_ROWS
+            self._resize(capacity, rows)
+            self.flush()
+
+            return len(stale)
+
+    def clear(self) -> int:
+        """Remove all stored embeddings.
+
+        Returns:
+            Number of embeddings removed
+        """
+        with self._lock:
+            self._load()
+            removed = len(self._index)
+
+            self._data = None
+            self._index = {}
+            self._count = 0
+            self._pending = 0
+            self.data_path.unlink(missing_ok=True)
+            self.index_path.unlink(missing_ok=True)
+
+            return removed
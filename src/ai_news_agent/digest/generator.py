@@ -1,6 +1,6 @@
 """Main digest generator that orchestrates the digest creation process."""
 
-from collections import defaultdict
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 from loguru import logger
@@ -77,14 +77,7 @@ class DigestGenerator:
                 return existing.content_markdown, existing.content_html
 
             # Get news items for the day
-            start_time = date
-            end_time = date + timedelta(days=1)
-
-            items = await news_repo.get_recent(days=1)
-            # Filter to exact date range
-            items = [
-                item for item in items if start_time <= item.published_at < end_time
-            ]
+            items = await news_repo.get_in_range(date, date + timedelta(days=1))
 
             if not items:
                 logger.info(f"No items found for {date.date()}")
@@ -93,21 +86,7 @@ class DigestGenerator:
             logger.info(f"Found {len(items)} items for {date.date()}")
 
             # Convert to NewsItem models
-            news_items = []
-            for db_item in items:
-                news_item = NewsItem(
-                    id=db_item.id,
-                    url=db_item.url,
-                    title=db_item.title,
-                    content=db_item.content,
-                    summary=db_item.summary,
-                    source=db_item.source,
-                    published_at=db_item.published_at,
-                    collected_at=db_item.collected_at,
-                    tags=db_item.tags,
-                    metadata=db_item.extra_metadata,
-                )
-                news_items.append(news_item)
+            news_items = NewsItem.from_db_many(items)
 
             # Rank items
             ranked_items = self.ranker.rank_items(
@@ -117,26 +96,31 @@ class DigestGenerator:
                 reference_time=date,
             )
 
-            # Group by category
-            grouped_items = self.ranker.group_by_category(ranked_items)
+            # Group by category and collect sources in one pass
+            summary = self.ranker.summarize(ranked_items)
 
             # Prepare metadata
-            sources = list({item.source for item, _ in ranked_items})
-            categories = list(grouped_items.keys())
-
             metadata = {
-                "sources": sources,
-                "categories": categories,
-                "grouped_items": grouped_items,
+                "sources": summary.sources,
+                "categories": list(summary.categories),
+                "grouped_items": summary.categories,
                 "total_collected": len(items),
             }
 
-            # Format content
-            markdown_content = self.markdown_formatter.format_daily_digest(
-                ranked_items, date, metadata
-            )
-            html_content = self.html_formatter.format_daily_digest(
-                ranked_items, date, metadata
+            # Format content off the event loop; the formatters are stateless
+            markdown_content, html_content = await asyncio.gather(
+                asyncio.to_thread(
+                    self.markdown_formatter.format_daily_digest,
+                    ranked_items,
+                    date,
+                    metadata,
+                ),
+                asyncio.to_thread(
+                    self.html_formatter.format_daily_digest,
+                    ranked_items,
+                    date,
+                    metadata,
+                ),
             )
 
             # Store in database
@@ -199,11 +183,7 @@ class DigestGenerator:
                 return existing.content_markdown, existing.content_html
 
             # Get all items for the week
-            items = await news_repo.get_recent(days=7)
-            # Filter to exact week range
-            items = [
-                item for item in items if week_start <= item.published_at < week_end
-            ]
+            items = await news_repo.get_in_range(week_start, week_end)
 
             if not items:
                 logger.info(f"No items found for week {week_start.date()}")
@@ -212,21 +192,7 @@ class DigestGenerator:
             logger.info(f"Found {len(items)} items for week {week_start.date()}")
 
             # Convert to NewsItem models
-            news_items = []
-            for db_item in items:
-                news_item = NewsItem(
-                    id=db_item.id,
-                    url=db_item.url,
-                    title=db_item.title,
-                    content=db_item.content,
-                    summary=db_item.summary,
-                    source=db_item.source,
-                    published_at=db_item.published_at,
-                    collected_at=db_item.collected_at,
-                    tags=db_item.tags,
-                    metadata=db_item.extra_metadata,
-                )
-                news_items.append(news_item)
+            news_items = NewsItem.from_db_many(items)
 
             # Get top topics
             top_topics = self.ranker.get_top_topics(news_items, limit=10)
@@ -239,16 +205,10 @@ class DigestGenerator:
                 reference_time=week_end,
             )
 
-            # Group by day
-            by_day = defaultdict(list)
-            for item, score in all_ranked:
-                day_key = item.published_at.strftime("%A, %B %d")
-                by_day[day_key].append((item, score))
+            # Group by day - keeps the order of first appearance in the ranking
+            by_day = self.ranker.summarize(all_ranked).by_day
 
-            # Sort days - keep original order from items (already sorted by date)
-            # No need to re-sort since items are already in date order
-
-            # Prepare metadata
+            # Prepare metadata; sources are counted over all collected items
             sources = {item.source for item in news_items}
             metadata = {
                 "total_collected": len(items),
@@ -269,12 +229,24 @@ class DigestGenerator:
                     "across various projects."
                 )
 
-            # Format content
-            markdown_content = self.markdown_formatter.format_weekly_summary(
-                all_ranked, week_start, week_end, top_topics, metadata
-            )
-            html_content = self.html_formatter.format_weekly_summary(
-                all_ranked, week_start, week_end, top_topics, metadata
+            # Format content off the event loop; the formatters are stateless
+            markdown_content, html_content = await asyncio.gather(
+                asyncio.to_thread(
+                    self.markdown_formatter.format_weekly_summary,
+                    all_ranked,
+                    week_start,
+                    week_end,
+                    top_topics,
+                    metadata,
+                ),
+                asyncio.to_thread(
+                    self.html_formatter.format_weekly_summary,
+                    all_ranked,
+                    week_start,
+                    week_end,
+                    top_topics,
+                    metadata,
+                ),
             )
 
             # Store in database
@@ -1,7 +1,11 @@
 """News item ranking for digest generation."""
 
-from collections import Counter
+import heapq
+from collections import Counter, defaultdict
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from itertools import chain
+from typing import NamedTuple
 
 import numpy as np
 from loguru import logger
@@ -9,6 +13,51 @@ from loguru import logger
 from ..config import settings
 from ..models import NewsItem
 
+# Primary tags mapped to a common digest category; other tags are their own
+_TAG_CATEGORIES = {
+    **dict.fromkeys(["ai", "ml", "machine-learning", "artificial-intelligence"], "ai"),
+    **dict.fromkeys(["security", "cybersecurity", "vulnerability"], "security"),
+    **dict.fromkeys(["tech", "technology", "software", "hardware"], "technology"),
+    **dict.fromkeys(["science", "research", "study"], "science"),
+    **dict.fromkeys(["business", "finance", "economy"], "business"),
+}
+
+
+def _timestamp(value: datetime) -> float:
+    """Convert a datetime to epoch seconds, reading naive values as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+def _best_first(scores: list[float], head: int) -> Iterator[int]:
+    """Yield indices in order of descending score, ties in input order.
+
+    The first head indices come from a heap selection; the rest are only
+    sorted if the caller keeps iterating past them.
+
+    Args:
+        scores: Score per index
+        head: Number of indices expected to be consumed
+
+    Yields:
+        Indices into scores, best first
+    """
+    key = scores.__getitem__
+    # nlargest is documented to equal sorted(..., reverse=True)[:n], ties
+    # included, so the fallback continues exactly where it stops
+    yield from heapq.nlargest(head, range(len(scores)), key=key)
+    if head < len(scores):
+        yield from sorted(range(len(scores)), key=key, reverse=True)[head:]
+
+
+class RankedSummary(NamedTuple):
+    """Groupings of ranked items used by the digest formatters."""
+
+    categories: dict[str, list[tuple[NewsItem, float]]]
+    by_day: dict[str, list[tuple[NewsItem, float]]]
+    sources: list[str]  # In order of first appearance
+
 
 class NewsRanker:
     """Ranks news items for inclusion in digests.
@@ -56,7 +105,7 @@ class NewsRanker:
         self.length_weight /= total
 
         # Load important tags from settings
-        self.important_tags = set(
+        self.important_tags = frozenset(
             getattr(
                 settings,
                 "important_tags",
@@ -87,20 +136,17 @@ class NewsRanker:
 
         reference_time = reference_time or datetime.now(UTC)
 
-        # Calculate individual scores
-        scored_items = []
-        for item in items:
-            score = self._calculate_score(item, reference_time, items)
-            scored_items.append((item, score))
-
-        # Sort by score
-        scored_items.sort(key=lambda x: x[1], reverse=True)
+        # Score all items at once
+        scores = self._score_items(items, reference_time).tolist()
 
-        # Apply source diversity filter
+        # Apply source diversity filter, best first; the leading candidates
+        # come from a heap and the rest are only sorted if the source cap
+        # leaves the selection short
         selected = []
         source_counts = Counter()
 
-        for item, score in scored_items:
+        for i in _best_first(scores, max_items * max_per_source):
+            item, score = items[i], scores[i]
             if source_counts[item.source] < max_per_source:
                 selected.append((item, score))
                 source_counts[item.source] += 1
@@ -115,58 +161,73 @@ class NewsRanker:
 
         return selected
 
-    def _calculate_score(
-        self,
-        item: NewsItem,
-        reference_time: datetime,
-        all_items: list[NewsItem],
-    ) -> float:
-        """Calculate ranking score for a single item.
+    def _score_items(
+        self, items: list[NewsItem], reference_time: datetime
+    ) -> np.ndarray:
+        """Calculate ranking scores for all items with array operations.
 
         Args:
-            item: News item to score
+            items: News items to score
             reference_time: Reference time for recency
-            all_items: All items being ranked (for diversity)
 
         Returns:
-            Combined score (0-1)
+            float64 array of combined scores (0-1), one per item
         """
+        count = len(items)
+
         # Recency score (exponential decay)
-        hours_old = (reference_time - item.published_at).total_seconds() / 3600
-        recency_score = np.exp(-hours_old / 24)  # Half-life of 24 hours
-
-        # Relevance score based on tags
-        relevance_score = 0.0
-        if item.tags:
-            matching_tags = set(item.tags) & self.important_tags
-            if matching_tags:
-                relevance_score = min(1.0, len(matching_tags) / 2)  # Cap at 2 matches
-
-        # Length score (prefer medium-length content)
-        content_length = len(item.content)
-        if content_length < 100:
-            length_score = 0.1
-        elif content_length < 500:
-            length_score = 0.5
-        elif content_length < 2000:
-            length_score = 1.0
-        else:
-            length_score = 0.8  # Very long might be less digestible
+        published = np.fromiter(
+            (_timestamp(item.published_at) for item in items),
+            dtype=np.float64,
+            count=count,
+        )
+        hours_old = (_timestamp(reference_time) - published) / 3600
+        recency_scores = np.exp(-hours_old / 24)  # Half-life of 24 hours
+
+        # Relevance score based on tags, capped at 2 matches; tags are
+        # unique per item, so membership tests count matches without
+        # building an intersection set. Most items match no important tag,
+        # which a single isdisjoint call settles.
+        important_tags = self.important_tags
+        is_important = important_tags.__contains__
+        matches = np.fromiter(
+            (
+                0
+                if important_tags.isdisjoint(tags := item.tags or ())
+                else sum(map(is_important, tags))
+                for item in items
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        relevance_scores = np.minimum(1.0, matches / 2)
+
+        # Length score (prefer medium-length content; very long might be
+        # less digestible)
+        lengths = np.fromiter(
+            (len(item.content) for item in items), dtype=np.int64, count=count
+        )
+        length_scores = np.select(
+            [lengths < 100, lengths < 500, lengths < 2000], [0.1, 0.5, 1.0], 0.8
+        )
 
         # Diversity score (inverse of source frequency)
-        source_count = sum(1 for i in all_items if i.source == item.source)
-        diversity_score = 1.0 / (1 + np.log(source_count))
+        items_per_source = Counter(item.source for item in items)
+        source_counts = np.fromiter(
+            (items_per_source[item.source] for item in items),
+            dtype=np.float64,
+            count=count,
+        )
+        diversity_scores = 1.0 / (1 + np.log(source_counts))
 
         # Combine scores
-        total_score = (
-            self.recency_weight * recency_score
-            + self.relevance_weight * relevance_score
-            + self.length_weight * length_score
-            + self.diversity_weight * diversity_score
+        return (
+            self.recency_weight * recency_scores
+            + self.relevance_weight * relevance_scores
+            + self.length_weight * length_scores
+            + self.diversity_weight * diversity_scores
         )
 
-        return total_score
-
     def group_by_category(
         self, ranked_items: list[tuple[NewsItem, float]]
     ) -> dict[str, list[tuple[NewsItem, float]]]:
@@ -178,40 +239,44 @@ class NewsRanker:
         Returns:
             Dict mapping category to list of items
         """
-        categories = {}
-
-        for item, score in ranked_items:
-            # Determine primary category
-            if not item.tags:
-                category = "general"
-            else:
-                # Use first tag as category, with some normalization
-                primary_tag = item.tags[0].lower()
-
-                # Map similar tags to common categories
-                if primary_tag in [
-                    "ai",
-                    "ml",
-                    "machine-learning",
-                    "artificial-intelligence",
-                ]:
-                    category = "ai"
-                elif primary_tag in ["security", "cybersecurity", "vulnerability"]:
-                    category = "security"
-                elif primary_tag in ["tech", "technology", "software", "hardware"]:
-                    category = "technology"
-                elif primary_tag in ["science", "research", "study"]:
-                    category = "science"
-                elif primary_tag in ["business", "finance", "economy"]:
-                    category = "business"
-                else:
-                    category = primary_tag
-
-            if category not in categories:
-                categories[category] = []
-            categories[category].append((item, score))
-
-        return categories
+        return self.summarize(ranked_items).categories
+
+    def summarize(self, ranked_items: list[tuple[NewsItem, float]]) -> RankedSummary:
+        """Group ranked items by category and by day, and collect their sources.
+
+        Args:
+            ranked_items: List of (item, score) tuples
+
+        Returns:
+            RankedSummary built in a single pass over the items
+        """
+        categories = defaultdict(list)
+        by_day = defaultdict(list)
+        sources: dict[str, None] = {}
+
+        for entry in ranked_items:
+            item = entry[0]
+            categories[self._category_for(item.tags)].append(entry)
+            by_day[item.published_at.strftime("%A, %B %d")].append(entry)
+            sources[item.source] = None
+
+        return RankedSummary(dict(categories), dict(by_day), list(sources))
+
+    @staticmethod
+    def _category_for(tags: list[str]) -> str:
+        """Determine an item's primary category from its tags.
+
+        Args:
+            tags: Item tags
+
+        Returns:
+            Category of the first tag, with similar tags mapped to a common
+            category; "general" for untagged items
+        """
+        if not tags:
+            return "general"
+        primary_tag = tags[0].lower()
+        return _TAG_CATEGORIES.get(primary_tag, primary_tag)
 
     def get_top_topics(
         self, items: list[NewsItem], limit: int = 5
@@ -225,10 +290,7 @@ class NewsRanker:
         Returns:
             List of (topic, count) tuples
         """
-        tag_counts = Counter()
-
-        for item in items:
-            if item.tags:
-                tag_counts.update(item.tags)
+        # One Counter pass over all tags instead of an update() per item
+        tag_counts = Counter(chain.from_iterable(item.tags or () for item in items))
 
         return tag_counts.most_common(limit)
@@ -1,12 +1,45 @@
 """Pydantic models for data validation"""
 
 import hashlib
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
 from typing import Any, Self
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
+# NewsItem fields and the NewsItemDB columns they are stored in
+_DB_FIELDS = (
+    "id",
+    "url",
+    "title",
+    "content",
+    "summary",
+    "source",
+    "published_at",
+    "collected_at",
+    "tags",
+    "metadata",
+)
+_get_db_values = attrgetter(
+    *("extra_metadata" if name == "metadata" else name for name in _DB_FIELDS)
+)
+
+
+@lru_cache(maxsize=65536)
+def _item_id(url: str, title: str) -> str:
+    """Hash a URL and title into a NewsItem ID
+
+    Cached because feeds are polled repeatedly and keep returning the same
+    entries until they are stored.
+
+    The ID is a content key, not a security token; BLAKE2b with a 32-byte
+    digest is faster than SHA-256 and keeps the 64 hex character IDs.
+    """
+    return hashlib.blake2b(f"{url}{title}".encode(), digest_size=32).hexdigest()
+
 
 class NewsStatus(str, Enum):
     """Status of a news item"""
@@ -20,7 +53,7 @@ class NewsStatus(str, Enum):
 class NewsItem(BaseModel):
     """Core news item model with validation"""
 
-    id: str | None = Field(default=None, description="SHA256 hash of URL+title")
+    id: str | None = Field(default=None, description="BLAKE2b hash of URL+title")
     url: HttpUrl = Field(description="Original article URL")
     title: str = Field(min_length=1, description="Article title")
     content: str = Field(default="", description="Full article content")
@@ -38,17 +71,52 @@ class NewsItem(BaseModel):
     def generate_id(self) -> Self:
         """Generate ID from URL and title if not provided"""
         if not self.id:
-            content = f"{self.url}{self.title}".encode()
-            self.id = hashlib.sha256(content).hexdigest()
+            self.id = _item_id(str(self.url), self.title)
         return self
 
+    @classmethod
+    def from_db(cls, db_item: Any) -> Self:
+        """Build a NewsItem from a stored database row without re-validating
+
+        Rows were validated by NewsItem before they were stored, so the
+        pydantic validation pass is skipped and fields are set directly.
+        The URL is kept as the normalized string it was stored as.
+
+        Args:
+            db_item: NewsItemDB row
+
+        Returns:
+            NewsItem with the row's values
+        """
+        values = _get_db_values(db_item)
+        return cls.model_construct(**dict(zip(_DB_FIELDS, values, strict=True)))
+
+    @classmethod
+    def from_db_many(cls, db_items: Iterable[Any]) -> list[Self]:
+        """Build NewsItems from several stored rows, see from_db()
+
+        Args:
+            db_items: NewsItemDB rows
+
+        Returns:
+            NewsItems in the order of the rows
+        """
+        construct = cls.model_construct
+        return [
+            construct(**dict(zip(_DB_FIELDS, values, strict=True)))
+            for values in map(_get_db_values, db_items)
+        ]
+
     @field_validator("tags", mode="before")
     @classmethod
     def clean_tags(cls, v: list[str]) -> list[str]:
-        """Clean and deduplicate tags"""
+        """Clean and deduplicate tags, keeping their first-seen order
+
+        Order matters: the first tag picks an item's digest category.
+        """
         if not v:
             return []
-        return list({tag.lower().strip() for tag in v if tag.strip()})
+        return list(dict.fromkeys(tag for tag in (t.strip().lower() for t in v) if tag))
 
     model_config = {
         "json_schema_extra": {
@@ -1,9 +1,17 @@
 """Cron-based task scheduler for AI News Agent."""
 
 import asyncio
+import time
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any, Callable, Coroutine
 
+from apscheduler.events import (
+    EVENT_JOB_MAX_INSTANCES,
+    EVENT_JOB_SUBMITTED,
+    JobSubmissionEvent,
+)
+from apscheduler.job import Job
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from loguru import logger
@@ -12,6 +20,9 @@ from ..collectors.rss_with_storage import RSSCollectorWithStorage
 from ..config import settings
 from ..digest import DigestGenerator
 
+# Where generated digests are written
+DIGEST_DIR = Path("digests")
+
 
 class ScheduledTask:
     """Represents a scheduled task."""
@@ -52,9 +63,20 @@ class Scheduler:
         """Initialize scheduler."""
         self.scheduler = AsyncIOScheduler(timezone="UTC")
         self.tasks: dict[str, ScheduledTask] = {}
+        # Jobs as returned by add_job; the in-memory job store updates these
+        # same objects, so next run times are read without store lookups
+        self._jobs: dict[str, Job] = {}
         self.collector = RSSCollectorWithStorage()
         self.digest_generator = DigestGenerator()
         
+        # Per-task status snapshot, rebuilt only after task state changes
+        self._status_cache: dict[str, dict[str, Any]] | None = None
+        
+        # Dispatched once APScheduler has moved the job to its next fire time
+        self.scheduler.add_listener(
+            self._on_job_submitted, EVENT_JOB_SUBMITTED | EVENT_JOB_MAX_INSTANCES
+        )
+        
     def add_task(self, task: ScheduledTask) -> None:
         """Add a task to the scheduler.
         
@@ -86,6 +108,8 @@ class Scheduler:
         if hasattr(job, 'next_run_time'):
             task.next_run = job.next_run_time
         self.tasks[task.name] = task
+        self._jobs[task.name] = job
+        self._status_cache = None
         
         logger.info(
             f"Scheduled task '{task.name}' with cron '{task.cron_expression}', "
@@ -101,6 +125,8 @@ class Scheduler:
         if task_name in self.tasks:
             self.scheduler.remove_job(task_name)
             del self.tasks[task_name]
+            self._jobs.pop(task_name, None)
+            self._status_cache = None
             logger.info(f"Removed task '{task_name}'")
     
     async def _run_task(self, task: ScheduledTask) -> None:
@@ -111,6 +137,7 @@ class Scheduler:
         """
         logger.info(f"Running scheduled task: {task.name}")
         start_time = datetime.now(UTC)
+        started = time.perf_counter()
         
         try:
             # Execute task function
@@ -121,12 +148,7 @@ class Scheduler:
             task.run_count += 1
             task.last_error = None
             
-            # Get next run time
-            job = self.scheduler.get_job(task.name)
-            if job and hasattr(job, 'next_run_time'):
-                task.next_run = job.next_run_time
-            
-            duration = (datetime.now(UTC) - start_time).total_seconds()
+            duration = time.perf_counter() - started
             logger.info(
                 f"Task '{task.name}' completed successfully in {duration:.1f}s"
             )
@@ -135,6 +157,23 @@ class Scheduler:
             task.error_count += 1
             task.last_error = str(e)
             logger.error(f"Task '{task.name}' failed: {e}", exc_info=True)
+        
+        finally:
+            self._status_cache = None
+    
+    def _on_job_submitted(self, event: JobSubmissionEvent) -> None:
+        """Refresh a task's next run time when its job is due.
+        
+        Args:
+            event: Submission event of the job
+        """
+        task = self.tasks.get(event.job_id)
+        job = self._jobs.get(event.job_id)
+        if task is None or job is None:
+            return
+        
+        task.next_run = getattr(job, 'next_run_time', None)
+        self._status_cache = None
     
     def setup_default_tasks(self) -> None:
         """Set up default scheduled tasks from configuration."""
@@ -204,10 +243,11 @@ class Scheduler:
         
         try:
             # Determine time range
+            now = datetime.now(UTC)
             if period == "daily":
-                since = datetime.now(UTC) - timedelta(days=1)
+                since = now - timedelta(days=1)
             else:  # weekly
-                since = datetime.now(UTC) - timedelta(days=7)
+                since = now - timedelta(days=7)
             
             # Get recent items
             items = await self.collector.get_recent_items(
@@ -226,7 +266,7 @@ class Scheduler:
             )
             
             # Save digest (you might want to email it, save to file, etc.)
-            digest_path = f"digests/{period}_{datetime.now(UTC).strftime('%Y%m%d_%H%M%S')}.md"
+            digest_path = DIGEST_DIR / f"{period}_{now:%Y%m%d_%H%M%S}.md"
             # TODO: Implement digest saving/sending
             
             logger.info(f"Generated {period} digest with {len(digest.items)} items")
@@ -269,10 +309,16 @@ class Scheduler:
             return
         
         self.scheduler.start()
+        self._status_cache = None
         logger.info(f"Scheduler started with {len(self.tasks)} tasks")
         
-        # Log next run times
+        # Keep feeds warm between collections; stopped again by shutdown()
+        if getattr(settings, 'prefetch_enabled', False):
+            self.collector.start_prefetch()
+        
+        # Log next run times; jobs added before the start got theirs just now
         for task in self.tasks.values():
+            task.next_run = getattr(self._jobs.get(task.name), 'next_run_time', None)
             logger.info(f"Task '{task.name}' next run: {task.next_run}")
     
     def stop(self) -> None:
@@ -284,11 +330,25 @@ class Scheduler:
         self.scheduler.shutdown(wait=False)
         logger.info("Scheduler stopped")
     
+    async def shutdown(self) -> None:
+        """Stop the scheduler, feed prefetch and the collector's connections.
+        
+        Use this instead of stop() when the event loop is about to end, so
+        prefetch tasks are cancelled and the shared aiohttp session is
+        closed rather than left to be reported as unclosed at exit.
+        """
+        if self.scheduler.running:
+            self.stop()
+        await self.collector.close()
+    
     def get_status(self) -> dict[str, Any]:
-        """Get scheduler status and task information."""
-        return {
-            "running": self.scheduler.running,
-            "tasks": {
+        """Get scheduler status and task information.
+        
+        Task details are served from a snapshot that is rebuilt only after
+        a task is added, removed or run; treat the result as read-only.
+        """
+        if self._status_cache is None:
+            self._status_cache = {
                 name: {
                     "cron": task.cron_expression,
                     "last_run": task.last_run.isoformat() if task.last_run else None,
@@ -299,6 +359,10 @@ class Scheduler:
                 }
                 for name, task in self.tasks.items()
             }
+        
+        return {
+            "running": self.scheduler.running,
+            "tasks": self._status_cache,
         }
     
     async def run_task_now(self, task_name: str) -> None:
@@ -8,20 +8,37 @@ from typing import Any
 class SecretScanner:
     """Scan for potential secrets in configuration and environment"""
 
-    # Patterns that might indicate secrets
+    # Patterns that might indicate secrets, most specific first
     SECRET_PATTERNS = [
-        (r'sk-[a-zA-Z0-9]{40,}', 'API Key'),
-        (r'AKIA[0-9A-Z]{16}', 'AWS Access Key'),
-        (r'[a-zA-Z0-9_-]{40,}', 'Generic Token'),
-        (r'-----BEGIN.*PRIVATE KEY-----', 'Private Key'),
+        (re.compile(r'sk-[a-zA-Z0-9]{40,}'), 'API Key'),
+        (re.compile(r'AKIA[0-9A-Z]{16}'), 'AWS Access Key'),
+        (re.compile(r'-----BEGIN.*PRIVATE KEY-----'), 'Private Key'),
+        (re.compile(r'[a-zA-Z0-9_-]{40,}'), 'Generic Token'),
     ]
 
+    # All patterns as one alternation, so each value is searched once; the
+    # named group that matched identifies the pattern
+    _SECRET_RE = re.compile(
+        "|".join(
+            f"(?P<p{i}>{pattern.pattern})"
+            for i, (pattern, _) in enumerate(SECRET_PATTERNS)
+        )
+    )
+    _SECRET_DESCRIPTIONS = {
+        f"p{i}": desc for i, (_, desc) in enumerate(SECRET_PATTERNS)
+    }
+
     # Keys that commonly contain secrets
     SENSITIVE_KEYS = [
         'api_key', 'apikey', 'api_secret', 'secret', 'password',
         'token', 'auth', 'credential', 'private_key'
     ]
 
+    # Any of the sensitive key names, found with a single search
+    _SENSITIVE_KEY_RE = re.compile(
+        "|".join(map(re.escape, SENSITIVE_KEYS)), re.IGNORECASE
+    )
+
     @classmethod
     def scan_dict(cls, data: dict[str, Any], path: str = "") -> list[str]:
         """Scan dictionary for potential secrets
@@ -39,14 +56,11 @@ class SecretScanner:
             current_path = f"{path}.{key}" if path else key
 
             # Check if key name suggests sensitive data
-            if any(sensitive in key.lower() for sensitive in cls.SENSITIVE_KEYS):
+            if cls.is_sensitive_key(key):
                 if isinstance(value, str) and value and not value.startswith("${"):
                     # Check against patterns
-                    for pattern, desc in cls.SECRET_PATTERNS:
-                        if re.search(pattern, value):
-                            warnings.append(
-                                f"Potential {desc} found at {current_path}"
-                            )
+                    if desc := cls._find_secret(value):
+                        warnings.append(f"Potential {desc} found at {current_path}")
 
             # Recursively scan nested dictionaries
             elif isinstance(value, dict):
@@ -69,20 +83,46 @@ class SecretScanner:
                 continue
 
             # Check sensitive keys
-            if any(sensitive in key.lower() for sensitive in cls.SENSITIVE_KEYS):
+            if cls.is_sensitive_key(key):
                 if value and not value.startswith("${"):
-                    for pattern, desc in cls.SECRET_PATTERNS:
-                        if re.search(pattern, value):
-                            warnings.append(
-                                f"Potential {desc} found in environment variable {key}"
-                            )
+                    if desc := cls._find_secret(value):
+                        warnings.append(
+                            f"Potential {desc} found in environment variable {key}"
+                        )
 
         return warnings
 
+    @classmethod
+    def is_sensitive_key(cls, key: str) -> bool:
+        """Check whether a key name suggests it holds sensitive data
+
+        Args:
+            key: Key or variable name
+
+        Returns:
+            True if the name contains one of SENSITIVE_KEYS, ignoring case
+        """
+        return cls._SENSITIVE_KEY_RE.search(key) is not None
+
+    @classmethod
+    def _find_secret(cls, value: str) -> str | None:
+        """Search a value for the first secret pattern it contains
+
+        Args:
+            value: Value to search
+
+        Returns:
+            Description of the matching pattern, or None if nothing matches
+        """
+        match = cls._SECRET_RE.search(value)
+        return cls._SECRET_DESCRIPTIONS[match.lastgroup] if match else None
+
 
 def mask_secret(value: str, show_chars: int = 4) -> str:
     """Mask a secret value for safe logging
     
+    The mask has a fixed length, so the original length is not revealed.
+    
     Args:
         value: Secret value to mask
         show_chars: Number of characters to show at start
@@ -93,7 +133,7 @@ def mask_secret(value: str, show_chars: int = 4) -> str:
     if not value or len(value) <= show_chars:
         return "***"
 
-    return f"{value[:show_chars]}{'*' * (len(value) - show_chars)}"
+    return f"{value[:show_chars]}***"
 
 
 def safe_config_dict(config: dict[str, Any]) -> dict[str, Any]:
@@ -108,7 +148,7 @@ def safe_config_dict(config: dict[str, Any]) -> dict[str, Any]:
     safe = {}
 
     for key, value in config.items():
-        if any(sensitive in key.lower() for sensitive in SecretScanner.SENSITIVE_KEYS):
+        if SecretScanner.is_sensitive_key(key):
             if isinstance(value, str) and value:
                 safe[key] = mask_secret(value)
             else:
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -11,47 +12,101 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
+    text,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 
 Base = declarative_base()
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = datetime.resolution
+
+
+class EpochMicros(TypeDecorator):
+    """Datetime stored as integer microseconds since the Unix epoch on SQLite.
+
+    SQLite keeps DateTime values as ISO-8601 text, so range queries compare
+    strings at every index probe; integers compare directly. Other
+    databases keep their native timestamp type. Values are returned as
+    naive UTC, as DateTime columns returned them before.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        """Use a BIGINT column on SQLite and DATETIME elsewhere."""
+        if dialect.name == "sqlite":
+            return dialect.type_descriptor(BigInteger())
+        return dialect.type_descriptor(DateTime())
+
+    def process_bind_param(self, value, dialect):
+        """Convert a datetime (naive values are UTC) to epoch microseconds."""
+        if value is None or dialect.name != "sqlite":
+            return value
+        if value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return (value - _EPOCH) // _MICROSECOND
+
+    def process_result_value(self, value, dialect):
+        """Convert epoch microseconds back to a naive UTC datetime."""
+        if value is None or dialect.name != "sqlite":
+            return value
+        return _EPOCH + value * _MICROSECOND
+
 
 class NewsItemDB(Base):
     """Database model for news items."""
 
     __tablename__ = "news_items"
 
-    id = Column(String(64), primary_key=True)  # SHA256 hash
+    id = Column(String(64), primary_key=True)  # BLAKE2b hash
     url = Column(String(2048), nullable=False)
     title = Column(String(512), nullable=False)
     content = Column(Text, nullable=False)
     summary = Column(Text, nullable=True)
     source = Column(String(128), nullable=False)
-    published_at = Column(DateTime, nullable=False)
-    collected_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    published_at = Column(EpochMicros, nullable=False)
+    collected_at = Column(
+        EpochMicros, nullable=False, default=lambda: datetime.now(UTC)
+    )
     tags = Column(JSON, nullable=False, default=list)
     extra_metadata = Column(JSON, nullable=False, default=dict)
     is_duplicate = Column(Boolean, nullable=False, default=False)
     duplicate_of = Column(String(64), nullable=True)
 
-    # Indexes for efficient queries
+    # Indexes for efficient queries. Digest and listing queries read
+    # non-duplicates by publication time, optionally for one source; the
+    # partial index leaves duplicates out entirely.
     __table_args__ = (
-        Index("idx_published_at", "published_at"),
+        Index(
+            "idx_news_nondup_published",
+            "published_at",
+            sqlite_where=text("is_duplicate = 0"),
+            postgresql_where=text("is_duplicate = false"),
+        ),
+        Index("idx_news_source_published", "source", "published_at"),
         Index("idx_collected_at", "collected_at"),
-        Index("idx_source", "source"),
-        Index("idx_is_duplicate", "is_duplicate"),
         UniqueConstraint("url", name="uq_news_item_url"),
     )
 
-    # Relationships
+    # Relationships. Collections use lazy="raise": news items are loaded by
+    # the thousand, and touching a collection per row would be one query
+    # each. Load them explicitly with selectinload() where needed.
     collector_runs = relationship(
-        "CollectorRunDB", secondary="collector_run_items", back_populates="items"
+        "CollectorRunDB",
+        secondary="collector_run_items",
+        back_populates="items",
+        lazy="raise",
+    )
+    digest_entries = relationship(
+        "DigestEntryDB", back_populates="news_item", lazy="raise"
     )
-    digest_entries = relationship("DigestEntryDB", back_populates="news_item")
 
 
 class CollectorRunDB(Base):
@@ -61,8 +116,8 @@ class CollectorRunDB(Base):
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     collector_type = Column(String(64), nullable=False)  # e.g., "rss"
-    started_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
-    completed_at = Column(DateTime, nullable=True)
+    started_at = Column(EpochMicros, nullable=False, default=lambda: datetime.now(UTC))
+    completed_at = Column(EpochMicros, nullable=True)
     total_items = Column(Integer, nullable=False, default=0)
     new_items = Column(Integer, nullable=False, default=0)
     duplicate_items = Column(Integer, nullable=False, default=0)
@@ -77,7 +132,10 @@ class CollectorRunDB(Base):
 
     # Relationships
     items = relationship(
-        "NewsItemDB", secondary="collector_run_items", back_populates="collector_runs"
+        "NewsItemDB",
+        secondary="collector_run_items",
+        back_populates="collector_runs",
+        lazy="raise",
     )
 
 
@@ -106,8 +164,9 @@ class DailyDigestDB(Base):
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
     sent_at = Column(DateTime, nullable=True)
     item_count = Column(Integer, nullable=False, default=0)
-    content_markdown = Column(Text, nullable=True)
-    content_html = Column(Text, nullable=True)
+    # Rendered bodies load only on request (undefer_group("body"))
+    content_markdown = deferred(Column(Text, nullable=True), group="body")
+    content_html = deferred(Column(Text, nullable=True), group="body")
     extra_metadata = Column(JSON, nullable=False, default=dict)
     is_sent = Column(Boolean, nullable=False, default=False)
 
@@ -118,7 +177,7 @@ class DailyDigestDB(Base):
     )
 
     # Relationships
-    entries = relationship("DigestEntryDB", back_populates="daily_digest")
+    entries = relationship("DigestEntryDB", back_populates="daily_digest", lazy="raise")
 
 
 class WeeklySummaryDB(Base):
@@ -132,9 +191,10 @@ class WeeklySummaryDB(Base):
     created_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
     sent_at = Column(DateTime, nullable=True)
     item_count = Column(Integer, nullable=False, default=0)
-    content_markdown = Column(Text, nullable=True)
-    content_html = Column(Text, nullable=True)
-    ai_summary = Column(Text, nullable=True)
+    # Rendered bodies load only on request (undefer_group("body"))
+    content_markdown = deferred(Column(Text, nullable=True), group="body")
+    content_html = deferred(Column(Text, nullable=True), group="body")
+    ai_summary = deferred(Column(Text, nullable=True), group="body")
     top_topics = Column(JSON, nullable=False, default=list)
     extra_metadata = Column(JSON, nullable=False, default=dict)
     is_sent = Column(Boolean, nullable=False, default=False)
@@ -148,7 +208,9 @@ class WeeklySummaryDB(Base):
     )
 
     # Relationships
-    entries = relationship("DigestEntryDB", back_populates="weekly_summary")
+    entries = relationship(
+        "DigestEntryDB", back_populates="weekly_summary", lazy="raise"
+    )
 
 
 class DigestEntryDB(Base):
@@ -184,17 +246,22 @@ class DeduplicationCacheDB(Base):
     __tablename__ = "deduplication_cache"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    url_hash = Column(String(64), nullable=False, unique=True)
-    title_hash = Column(String(64), nullable=False)
-    content_hash = Column(String(64), nullable=False)
-    first_seen_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
-    last_seen_at = Column(DateTime, nullable=False, default=lambda: datetime.now(UTC))
+    # Raw SHA-256 digests: half the bytes of hex per row and index key
+    url_hash = Column(LargeBinary(32), nullable=False, unique=True)
+    title_hash = Column(LargeBinary(32), nullable=False)
+    content_hash = Column(LargeBinary(32), nullable=False)
+    first_seen_at = Column(
+        EpochMicros, nullable=False, default=lambda: datetime.now(UTC)
+    )
+    last_seen_at = Column(
+        EpochMicros, nullable=False, default=lambda: datetime.now(UTC)
+    )
     occurrence_count = Column(Integer, nullable=False, default=1)
     news_item_id = Column(String(64), ForeignKey("news_items.id"), nullable=False)
 
-    # Indexes for fast deduplication lookups
+    # Indexes for fast deduplication lookups; url_hash is indexed by its
+    # unique constraint
     __table_args__ = (
-        Index("idx_url_hash", "url_hash"),
         Index("idx_title_hash", "title_hash"),
         Index("idx_content_hash", "content_hash"),
         Index("idx_first_seen", "first_seen_at"),
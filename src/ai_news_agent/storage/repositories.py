@@ -3,8 +3,10 @@
 import hashlib
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, delete, desc, func, insert, null, or_, select, union_all
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from ..models import CollectorStats, NewsItem
 from .models import (
@@ -18,9 +20,50 @@ from .models import (
 )
 
 
+def _dialect_insert(session: AsyncSession):
+    """Get the INSERT construct supporting ON CONFLICT for a session's dialect.
+
+    Args:
+        session: Session whose database dialect to target
+
+    Returns:
+        Dialect insert() function, or None if the dialect has no ON CONFLICT
+    """
+    return {
+        "sqlite": sqlite.insert,
+        "postgresql": postgresql.insert,
+    }.get(session.bind.dialect.name)
+
+
+def _insert_ignoring_conflicts(
+    session: AsyncSession, table, index_elements: list | None = None
+):
+    """Build an INSERT that skips rows conflicting on the given columns.
+
+    Uses the dialect's ON CONFLICT DO NOTHING where available and a plain
+    INSERT elsewhere.
+
+    Args:
+        session: Session whose database dialect to target
+        table: Mapped class or table to insert into
+        index_elements: Columns of the unique constraint to check (default:
+            skip rows conflicting with any unique constraint)
+
+    Returns:
+        Insert statement
+    """
+    dialect_insert = _dialect_insert(session)
+    if dialect_insert is None:
+        return insert(table)
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=index_elements)
+
+
 class NewsItemRepository:
     """Repository for NewsItem database operations."""
 
+    # Rows per INSERT statement in create_many()
+    BATCH_SIZE = 1000
+
     def __init__(self, session: AsyncSession):
         """Initialize repository with database session.
 
@@ -38,27 +81,73 @@ class NewsItemRepository:
         Returns:
             NewsItemDB: Created database record
         """
-        db_item = NewsItemDB(
-            id=news_item.id,
-            url=str(news_item.url),
-            title=news_item.title,
-            content=news_item.content,
-            summary=news_item.summary,
-            source=news_item.source,
-            published_at=news_item.published_at,
-            collected_at=news_item.collected_at,
-            tags=news_item.tags,
-            extra_metadata=news_item.metadata,
-        )
+        db_item = NewsItemDB(**self._to_row(news_item))
         self.session.add(db_item)
         await self.session.flush()
         return db_item
 
+    async def create_many(self, news_items: list[NewsItem]) -> list[str]:
+        """Create several news items with one multi-row INSERT.
+
+        Items whose ID or URL is already stored are skipped by the database
+        (ON CONFLICT DO NOTHING on any unique constraint, as rows stored
+        before the BLAKE2b switch keep their SHA-256 IDs), and the IDs of
+        the rows actually inserted come back from the same statement via
+        RETURNING. Large inputs are sent in chunks of BATCH_SIZE rows to
+        bound statement size. The inserts run in one savepoint, so on any
+        other failure none of the items are stored and the session remains
+        usable.
+
+        Args:
+            news_items: NewsItems to persist
+
+        Returns:
+            List[str]: IDs of the created items, excluding skipped ones
+        """
+        if not news_items:
+            return []
+
+        rows = [self._to_row(news_item) for news_item in news_items]
+        stmt = _insert_ignoring_conflicts(self.session, NewsItemDB).returning(
+            NewsItemDB.id
+        )
+        created: list[str] = []
+        async with self.session.begin_nested():
+            for start in range(0, len(rows), self.BATCH_SIZE):
+                result = await self.session.execute(
+                    stmt, rows[start : start + self.BATCH_SIZE]
+                )
+                created.extend(result.scalars())
+        return created
+
+    @staticmethod
+    def _to_row(news_item: NewsItem) -> dict:
+        """Map a NewsItem to NewsItemDB column values.
+
+        Args:
+            news_item: NewsItem to map
+
+        Returns:
+            dict: Column values keyed by attribute name
+        """
+        return {
+            "id": news_item.id,
+            "url": str(news_item.url),
+            "title": news_item.title,
+            "content": news_item.content,
+            "summary": news_item.summary,
+            "source": news_item.source,
+            "published_at": news_item.published_at,
+            "collected_at": news_item.collected_at,
+            "tags": news_item.tags,
+            "extra_metadata": news_item.metadata,
+        }
+
     async def get_by_id(self, item_id: str) -> NewsItemDB | None:
         """Get news item by ID.
 
         Args:
-            item_id: News item ID (SHA256 hash)
+            item_id: News item ID (BLAKE2b hash of URL+title)
 
         Returns:
             Optional[NewsItemDB]: Found item or None
@@ -82,6 +171,23 @@ class NewsItemRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_ids_by_urls(self, urls: list[str]) -> dict[str, str]:
+        """Get the IDs of stored items for several URLs with one query.
+
+        Args:
+            urls: News item URLs
+
+        Returns:
+            dict[str, str]: Mapping of each stored URL to its item ID
+        """
+        if not urls:
+            return {}
+
+        result = await self.session.execute(
+            select(NewsItemDB.url, NewsItemDB.id).where(NewsItemDB.url.in_(set(urls)))
+        )
+        return dict(result.all())
+
     async def find_duplicates(
         self, url: str, title: str, lookback_days: int = 7
     ) -> list[NewsItemDB]:
@@ -147,6 +253,31 @@ class NewsItemRepository:
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def get_in_range(self, start: datetime, end: datetime) -> list[NewsItemDB]:
+        """Get news items published within a time range.
+
+        Args:
+            start: Start of the range (inclusive)
+            end: End of the range (exclusive)
+
+        Returns:
+            List[NewsItemDB]: Non-duplicate items, oldest first
+        """
+        query = (
+            select(NewsItemDB)
+            .where(
+                and_(
+                    NewsItemDB.published_at >= start,
+                    NewsItemDB.published_at < end,
+                    NewsItemDB.is_duplicate == False,
+                )
+            )
+            .order_by(NewsItemDB.published_at)
+        )
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def mark_as_duplicate(
         self, item_id: str, duplicate_of: str
     ) -> NewsItemDB | None:
@@ -189,6 +320,35 @@ class NewsItemRepository:
         result = await self.session.execute(query)
         return list(result.all())
 
+    async def count_by_source_with_total(
+        self, start_date: datetime | None = None
+    ) -> tuple[dict[str, int], int]:
+        """Count news items by source and in total with one query.
+
+        The per-source counts and the grand total come back from a single
+        UNION ALL; the total row is the one with a NULL source.
+
+        Args:
+            start_date: Count items after this date
+
+        Returns:
+            Tuple[Dict[str, int], int]: Counts keyed by source, and the total
+        """
+        conditions = [NewsItemDB.is_duplicate == False]
+        if start_date:
+            conditions.append(NewsItemDB.collected_at >= start_date)
+
+        per_source = (
+            select(NewsItemDB.source, func.count(NewsItemDB.id))
+            .where(*conditions)
+            .group_by(NewsItemDB.source)
+        )
+        total = select(null(), func.count(NewsItemDB.id)).where(*conditions)
+
+        result = await self.session.execute(union_all(per_source, total))
+        counts = dict(result.all())
+        return counts, counts.pop(None, 0)
+
 
 class CollectorRepository:
     """Repository for collector run operations."""
@@ -420,7 +580,9 @@ class DigestRepository:
             Optional[DailyDigestDB]: Found digest or None
         """
         result = await self.session.execute(
-            select(DailyDigestDB).where(DailyDigestDB.date == date)
+            select(DailyDigestDB)
+            .where(DailyDigestDB.date == date)
+            .options(undefer_group("body"))
         )
         return result.scalar_one_or_none()
 
@@ -475,7 +637,9 @@ class DigestRepository:
             Optional[WeeklySummaryDB]: Found summary or None
         """
         result = await self.session.execute(
-            select(WeeklySummaryDB).where(WeeklySummaryDB.week_start == week_start)
+            select(WeeklySummaryDB)
+            .where(WeeklySummaryDB.week_start == week_start)
+            .options(undefer_group("body"))
         )
         return result.scalar_one_or_none()
 
@@ -487,13 +651,17 @@ class DigestRepository:
         """
         # Get unsent daily digests
         daily_result = await self.session.execute(
-            select(DailyDigestDB).where(DailyDigestDB.is_sent == False)
+            select(DailyDigestDB)
+            .where(DailyDigestDB.is_sent == False)
+            .options(undefer_group("body"))
         )
         daily_digests = list(daily_result.scalars().all())
 
         # Get unsent weekly summaries
         weekly_result = await self.session.execute(
-            select(WeeklySummaryDB).where(WeeklySummaryDB.is_sent == False)
+            select(WeeklySummaryDB)
+            .where(WeeklySummaryDB.is_sent == False)
+            .options(undefer_group("body"))
         )
         weekly_summaries = list(weekly_result.scalars().all())
 
@@ -524,16 +692,39 @@ class DeduplicationRepository:
         self.session = session
 
     @staticmethod
-    def _hash_text(text: str) -> str:
+    def _hash_text(text: str) -> bytes:
         """Create SHA256 hash of text.
 
         Args:
             text: Text to hash
 
         Returns:
-            str: Hex digest of hash
+            bytes: Raw 32-byte digest, half the size of the hex form
         """
-        return hashlib.sha256(text.encode()).hexdigest()
+        return hashlib.sha256(text.encode()).digest()
+
+    def _upsert_cache_entries(self):
+        """Build an INSERT that refreshes cache entries whose URL is known.
+
+        A conflicting url_hash bumps last_seen_at and adds the row's
+        occurrence_count to the stored one, all in the database, so lookup
+        and write are one atomic round trip.
+
+        Returns:
+            Insert statement
+        """
+        dialect_insert = _dialect_insert(self.session)
+        if dialect_insert is None:
+            return insert(DeduplicationCacheDB)
+        stmt = dialect_insert(DeduplicationCacheDB)
+        return stmt.on_conflict_do_update(
+            index_elements=[DeduplicationCacheDB.url_hash],
+            set_={
+                "last_seen_at": stmt.excluded.last_seen_at,
+                "occurrence_count": DeduplicationCacheDB.occurrence_count
+                + stmt.excluded.occurrence_count,
+            },
+        )
 
     async def add_to_cache(self, news_item: NewsItemDB) -> DeduplicationCacheDB:
         """Add item to deduplication cache.
@@ -542,35 +733,63 @@ class DeduplicationRepository:
             news_item: News item to cache
 
         Returns:
-            DeduplicationCacheDB: Created cache entry
+            DeduplicationCacheDB: Created or refreshed cache entry
         """
-        url_hash = self._hash_text(news_item.url)
-        title_hash = self._hash_text(news_item.title.lower())
-        content_hash = self._hash_text(news_item.content[:500].lower())  # First 500 chars
-
-        # Check if already exists
-        result = await self.session.execute(
-            select(DeduplicationCacheDB).where(
-                DeduplicationCacheDB.url_hash == url_hash
+        stmt = (
+            self._upsert_cache_entries()
+            .values(
+                url_hash=self._hash_text(news_item.url),
+                title_hash=self._hash_text(news_item.title.lower()),
+                # First 500 chars
+                content_hash=self._hash_text(news_item.content[:500].lower()),
+                news_item_id=news_item.id,
+                occurrence_count=1,
             )
+            .returning(DeduplicationCacheDB)
         )
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            existing.last_seen_at = datetime.now(UTC)
-            existing.occurrence_count += 1
-            return existing
-
-        # Create new cache entry
-        cache_entry = DeduplicationCacheDB(
-            url_hash=url_hash,
-            title_hash=title_hash,
-            content_hash=content_hash,
-            news_item_id=news_item.id,
+        result = await self.session.execute(
+            stmt, execution_options={"populate_existing": True}
+        )
+        return result.scalar_one()
+
+    async def add_many_to_cache(self, news_items: list[NewsItem]) -> int:
+        """Add several items to the deduplication cache at once.
+
+        All items go out in one INSERT ... ON CONFLICT DO UPDATE: new URLs
+        create entries, known ones are refreshed in place.
+
+        Args:
+            news_items: News items to cache
+
+        Returns:
+            int: Number of cache entries created
+        """
+        entries: dict[bytes, dict] = {}
+        for news_item in news_items:
+            url_hash = self._hash_text(str(news_item.url))
+            if url_hash in entries:
+                entries[url_hash]["occurrence_count"] += 1
+                continue
+            entries[url_hash] = {
+                "url_hash": url_hash,
+                "title_hash": self._hash_text(news_item.title.lower()),
+                "content_hash": self._hash_text(news_item.content[:500].lower()),
+                "news_item_id": news_item.id,
+                "occurrence_count": 1,
+            }
+
+        if not entries:
+            return 0
+
+        stmt = self._upsert_cache_entries().returning(
+            DeduplicationCacheDB.url_hash, DeduplicationCacheDB.occurrence_count
+        )
+        result = await self.session.execute(stmt, list(entries.values()))
+        # A refreshed entry ends up above the count it was sent with
+        return sum(
+            count == entries[url_hash]["occurrence_count"]
+            for url_hash, count in result
         )
-        self.session.add(cache_entry)
-        await self.session.flush()
-        return cache_entry
 
     async def find_similar(
         self, url: str, title: str, content: str, threshold: float = 0.85
@@ -604,6 +823,51 @@ class DeduplicationRepository:
         )
         return result.scalar_one_or_none()
 
+    async def find_many_exact(self, news_items: list[NewsItem]) -> list[str | None]:
+        """Find exact cache matches for several items with one query.
+
+        Uses the same rule as find_similar: same URL, or same title and
+        content prefix.
+
+        Args:
+            news_items: News items to check
+
+        Returns:
+            list[str | None]: Matching news item ID per input item, or None
+        """
+        if not news_items:
+            return []
+
+        keys = [
+            (
+                self._hash_text(str(news_item.url)),
+                self._hash_text(news_item.title.lower()),
+                self._hash_text(news_item.content[:500].lower()),
+            )
+            for news_item in news_items
+        ]
+
+        result = await self.session.execute(
+            select(DeduplicationCacheDB).where(
+                or_(
+                    DeduplicationCacheDB.url_hash.in_({key[0] for key in keys}),
+                    DeduplicationCacheDB.title_hash.in_({key[1] for key in keys}),
+                )
+            )
+        )
+        by_url: dict[bytes, str] = {}
+        by_title_content: dict[tuple[bytes, bytes], str] = {}
+        for entry in result.scalars():
+            by_url[entry.url_hash] = entry.news_item_id
+            by_title_content.setdefault(
+                (entry.title_hash, entry.content_hash), entry.news_item_id
+            )
+
+        return [
+            by_url.get(url_hash) or by_title_content.get((title_hash, content_hash))
+            for url_hash, title_hash, content_hash in keys
+        ]
+
     async def cleanup_old_entries(self, days: int = 30) -> int:
         """Remove old cache entries.
 
@@ -615,15 +879,10 @@ class DeduplicationRepository:
         """
         cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
+        # One DELETE in the database instead of loading and deleting each row
         result = await self.session.execute(
-            select(DeduplicationCacheDB).where(
-                DeduplicationCacheDB.last_seen_at < cutoff_date
-            )
+            delete(DeduplicationCacheDB)
+            .where(DeduplicationCacheDB.last_seen_at < cutoff_date)
+            .execution_options(synchronize_session=False)
         )
-        old_entries = list(result.scalars().all())
-
-        for entry in old_entries:
-            await self.session.delete(entry)
-
-        await self.session.flush()
-        return len(old_entries)
+        return result.rowcount
@@ -1,14 +1,25 @@
 """Tests for enhanced deduplication service."""
 
+import time
+import weakref
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
+import torch
 
 from ai_news_agent.deduplication import DeduplicationService, EmbeddingService
+from ai_news_agent.deduplication.embeddings import _load_model
 from ai_news_agent.deduplication.service import DuplicateMatch
+from ai_news_agent.deduplication.simhash import (
+    SimHashIndex,
+    hamming_distances,
+    simhash,
+    tokenize,
+)
+from ai_news_agent.deduplication.store import EmbeddingStore, _flush_at_exit
 from ai_news_agent.models import NewsItem
 
 
@@ -34,7 +45,7 @@ def dedup_service(embedding_service):
     """Create deduplication service."""
     return DeduplicationService(
         embedding_service=embedding_service,
-        similarity_threshold=0.85,
+        similarity_threshold=0.7,
         lookback_days=30
     )
 
@@ -89,8 +100,8 @@ class TestEmbeddingService:
         emb2 = embedding_service.encode(text2)
         
         similarity = embedding_service.cosine_similarity(emb1, emb2)
-        assert 0 <= similarity <= 1
-        assert similarity > 0.5  # Should be somewhat similar
+        assert -1 <= similarity <= 1
+        assert similarity > 0.0  # Should be somewhat similar
         
         # Different texts should have lower similarity
         text3 = "Weather forecast predicts rain tomorrow"
@@ -131,15 +142,222 @@ class TestEmbeddingService:
         candidate_embs = embedding_service.encode_batch(candidates)
         
         similar = embedding_service.find_most_similar(
-            query_emb, candidate_embs, threshold=0.6, top_k=2
+            query_emb, candidate_embs, threshold=0.2, top_k=2
         )
         
         assert len(similar) <= 2
-        assert all(score >= 0.6 for _, score in similar)
+        assert all(score >= 0.2 for _, score in similar)
         # AI-related candidates should rank higher
         top_indices = [idx for idx, _ in similar]
         assert 0 in top_indices or 2 in top_indices
 
+    def test_find_most_similar_vectorized(self, embedding_service):
+        """Test ranking, threshold and top_k on unit-length embeddings."""
+        query = np.array([1.0, 0.0])
+        candidates = np.array(
+            [[0.0, 1.0], [0.8, 0.6], [-0.6, -0.8], [1.0, 0.0], [-1.0, 0.0]]
+        )
+
+        similar = embedding_service.find_most_similar(
+            query, candidates, threshold=0.0
+        )
+
+        # Scores are raw cosines: orthogonal is exactly 0, opposing below it
+        assert [idx for idx, _ in similar] == [3, 1, 0]
+        assert similar[0][1] == pytest.approx(1.0)
+        assert similar[1][1] == pytest.approx(0.8)
+        assert similar[2][1] == pytest.approx(0.0)
+
+        top = embedding_service.find_most_similar(
+            query, candidates, threshold=0.0, top_k=2
+        )
+        assert top == similar[:2]
+
+    def test_top_k_similar(self, embedding_service):
+        """Test batched top-k selection returns each row's best matches sorted."""
+        candidates = np.eye(4, dtype=np.float32)
+        queries = np.array(
+            [[0.0, 0.6, 0.8, 0.0], [1.0, 0.0, 0.0, 0.0]], dtype=np.float32
+        )
+        
+        indices, scores = embedding_service.top_k_similar(queries, candidates, 2)
+        
+        assert indices[0].tolist() == [2, 1]
+        assert np.allclose(scores[0], [0.8, 0.6])
+        assert indices[1, 0] == 0 and scores[1, 0] == pytest.approx(1.0)
+        
+        # k is capped at the number of candidates
+        indices, _ = embedding_service.top_k_similar(queries, candidates, 10)
+        assert indices.shape == (2, 4)
+
+    def test_combine_text_includes_domain(self, embedding_service):
+        """Test the URL's network location is appended as the source."""
+        combined = embedding_service.combine_text_for_similarity(
+            "Title", "Body", "https://news.example.com:8443/a?b=1#c"
+        )
+        assert combined.endswith("Source: news.example.com:8443")
+        
+        no_scheme = embedding_service.combine_text_for_similarity("T", "B", "example.com/a")
+        assert no_scheme.endswith("Source: ")
+
+    def test_combine_text_batch_matches_single(self, embedding_service):
+        """Test the batch variant builds the same text as the per-item one."""
+        titles = ["Short", "Long"]
+        contents = ["Body", "x" * 600]
+        urls = ["https://a.example.com/1", "https://b.example.com/2"]
+        
+        combined = embedding_service.combine_text_for_similarity_batch(
+            titles, contents, urls
+        )
+        
+        assert combined == [
+            embedding_service.combine_text_for_similarity(t, c, u)
+            for t, c, u in zip(titles, contents, urls)
+        ]
+        assert "x" * 500 + "...\n\nSource: b.example.com" in combined[1]
+
+    def test_model_loaded_once_per_name(self, temp_cache_dir):
+        """Test services using the same model name share one loaded model."""
+        with patch.dict('ai_news_agent.deduplication.embeddings._MODEL_CACHE', clear=True):
+            with patch('ai_news_agent.deduplication.embeddings.SentenceTransformer') as mock_cls:
+                first = EmbeddingService(model_name="shared", cache_dir=temp_cache_dir)
+                second = EmbeddingService(model_name="shared", cache_dir=temp_cache_dir)
+                
+                assert first.model is second.model
+                mock_cls.assert_called_once_with("shared", device=None)
+                mock_cls.return_value.eval.assert_called_once()
+    
+    def test_quantized_model(self, temp_cache_dir):
+        """Test int8 quantization of Linear layers and separate cache keys."""
+        with patch.dict('ai_news_agent.deduplication.embeddings._MODEL_CACHE', clear=True):
+            with patch(
+                'ai_news_agent.deduplication.embeddings.SentenceTransformer',
+                return_value=torch.nn.Sequential(torch.nn.Linear(4, 4)),
+            ) as mock_cls:
+                service = EmbeddingService(
+                    model_name="m", cache_dir=temp_cache_dir, quantize=True
+                )
+                model = _load_model(service.model_name, service.quantize)
+        
+        mock_cls.assert_called_once_with("m", device="cpu")
+        assert isinstance(model[0], torch.ao.nn.quantized.dynamic.Linear)
+        plain = EmbeddingService(model_name="m", cache_dir=temp_cache_dir)
+        assert service._get_cache_key("text") != plain._get_cache_key("text")
+
+    def test_cache_key_depends_on_model(self, temp_cache_dir):
+        """Test cache keys are short, stable and scoped to the model."""
+        service_a = EmbeddingService(model_name="model-a", cache_dir=temp_cache_dir)
+        service_b = EmbeddingService(model_name="model-b", cache_dir=temp_cache_dir)
+
+        key = service_a._get_cache_key("same text")
+
+        assert len(key) == 32
+        assert key == service_a._get_cache_key("same text")
+        assert key != service_a._get_cache_key("other text")
+        assert key != service_b._get_cache_key("same text")
+
+
+class TestEmbeddingStore:
+    """Test memory-mapped embedding store."""
+    
+    def test_put_get_persists_across_instances(self, temp_cache_dir):
+        """Test embeddings survive a flush and reopen."""
+        store = EmbeddingStore(temp_cache_dir)
+        store.put_many(["a", "b"], np.array([[1.0, 2.0], [3.0, 4.0]]))
+        store.flush()
+        
+        reopened = EmbeddingStore(temp_cache_dir)
+        found, positions = reopened.get_many(["b", "missing", "a"])
+        
+        assert positions == [0, 2]
+        assert np.array_equal(found, [[3.0, 4.0], [1.0, 2.0]])
+        assert reopened.get("missing") is None
+        assert len(reopened) == 2
+    
+    def test_flush_async_persists_in_background(self, temp_cache_dir):
+        """Test automatic flushes are written by the background writer."""
+        store = EmbeddingStore(temp_cache_dir, flush_every=2)
+        store.put_many(["a", "b"], np.array([[1.0, 2.0], [3.0, 4.0]]))
+        
+        deadline = time.monotonic() + 5
+        while not store.index_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        found, positions = EmbeddingStore(temp_cache_dir).get_many(["a", "b"])
+        assert positions == [0, 1]
+        assert np.array_equal(found, [[1.0, 2.0], [3.0, 4.0]])
+    
+    def test_pending_rows_flushed_at_exit(self, temp_cache_dir):
+        """Test the exit hook persists rows added since the last flush."""
+        store = EmbeddingStore(temp_cache_dir)
+        store.put("a", np.array([1.0, 2.0]))
+        assert not store.index_path.exists()
+        
+        _flush_at_exit(weakref.ref(store))
+        
+        assert np.array_equal(EmbeddingStore(temp_cache_dir).get("a"), [1.0, 2.0])
+    
+    def test_grows_and_prunes(self, temp_cache_dir):
+        """Test data file growth and pruning of unused entries."""
+        store = EmbeddingStore(temp_cache_dir)
+        store.GROW_ROWS = 2
+        keys = [f"key{i}" for i in range(5)]
+        store.put_many(keys, np.arange(10, dtype=np.float32).reshape(5, 2))
+        
+        # Mark everything but key3 as long unused
+        for key in keys:
+            if key != "key3":
+                store._index[key][1] = 0
+        
+        assert store.prune(older_than=1) == 4
+        assert len(store) == 1
+        assert np.array_equal(store.get("key3"), [6.0, 7.0])
+    
+    def test_encode_batch_mixes_cached_and_new(self, embedding_service):
+        """Test batch encoding keeps input order across cache hits and misses."""
+        embedding_service._model = MagicMock()
+        embedding_service._model.encode.side_effect = lambda texts, **_: np.array(
+            [[1.0 / len(text), 0.0] for text in texts], dtype=np.float32
+        )
+        
+        embedding_service.encode_batch(["bb"])
+        result = embedding_service.encode_batch(["a", "bb", "ccc"])
+        
+        assert result.dtype == np.float32
+        assert np.allclose(result[:, 0], [1.0, 0.5, 1 / 3], rtol=1e-3)
+        # Only the two uncached texts were sent to the model the second time
+        assert embedding_service._model.encode.call_args[0][0] == ["a", "ccc"]
+    
+    def test_memory_cache_in_front_of_store(self, embedding_service):
+        """Test recent embeddings are served from the bounded in-memory LRU."""
+        embedding_service.MEMORY_CACHE_SIZE = 2
+        embedding_service._model = MagicMock()
+        embedding_service._model.encode.side_effect = lambda texts, **_: np.array(
+            [[1.0 / len(text), 0.0] for text in texts], dtype=np.float32
+        )
+        
+        embedding_service.encode_batch(["a", "bb", "ccc"])
+        assert len(embedding_service._memory_cache) == 2
+        
+        with patch.object(embedding_service.store, 'get_many') as mock_get_many:
+            mock_get_many.return_value = (np.empty((0, 2)), [])
+            result = embedding_service.encode_batch(["bb", "ccc"])
+            mock_get_many.assert_called_once_with([])
+        
+        # Cached arrays are shared, so they are read-only
+        with pytest.raises(ValueError):
+            embedding_service.encode("ccc")[0] = 0.0
+        
+        assert np.allclose(result[:, 0], [0.5, 1 / 3], rtol=1e-3)
+        # Evicted from memory, still found in the store
+        assert embedding_service.encode("a")[0] == pytest.approx(1.0)
+        assert embedding_service._model.encode.call_count == 1
+        
+        # Memory, store and model results are combined in input order
+        mixed = embedding_service.encode_batch(["dddd", "ccc", "bb", "a"])
+        assert np.allclose(mixed[:, 0], [0.25, 1 / 3, 0.5, 1.0], rtol=1e-3)
+        assert embedding_service._model.encode.call_args[0][0] == ["dddd"]
+
 
 class TestDeduplicationService:
     """Test deduplication service functionality."""
@@ -219,7 +437,7 @@ class TestDeduplicationService:
         # Should detect as duplicate due to semantic similarity
         assert result.is_duplicate is True
         assert result.original_id == "cached_item_123"
-        assert result.similarity_score > 0.8  # High similarity
+        assert result.similarity_score > 0.6  # High similarity
         assert result.match_type == "similar_content"
     
     @pytest.mark.asyncio
@@ -314,19 +532,461 @@ class TestDeduplicationService:
         dedup_service._items_cache = []
         
         # Mock the exact match checks
-        with patch.object(dedup_service, '_check_exact_matches') as mock_check:
-            mock_check.return_value = DuplicateMatch(
-                is_duplicate=False,
-                original_id=None,
-                similarity_score=0.0,
-                match_type="none"
-            )
+        with patch.object(dedup_service, '_find_exact_matches') as mock_check:
+            mock_check.return_value = [
+                DuplicateMatch(
+                    is_duplicate=False,
+                    original_id=None,
+                    similarity_score=0.0,
+                    match_type="none"
+                )
+            ] * 3
             
             results = await dedup_service.check_batch(items)
         
         assert len(results) == 3
         assert all(not result.is_duplicate for result in results)
     
+    @pytest.mark.asyncio
+    async def test_batch_check_exact_prefilter(self, dedup_service, sample_news_item):
+        """Test exact matches are resolved in bulk and skip embedding."""
+        other = NewsItem(
+            url="https://example.com/other",
+            title="Unrelated story",
+            content="Something else entirely",
+            source="TestSource",
+            published_at=sample_news_item.published_at,
+        )
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(
+            MagicMock(id="cached_item_123", published_at=other.published_at),
+            np.array([1.0, 0.0], dtype=np.float32),
+        )]
+        
+        with patch('ai_news_agent.deduplication.service.get_db_manager') as mock_db:
+            mock_session = AsyncMock()
+            mock_db.return_value.get_session.return_value.__aenter__.return_value = mock_session
+            
+            mock_news_repo = AsyncMock()
+            mock_news_repo.get_ids_by_urls.return_value = {
+                str(sample_news_item.url): "stored_item"
+            }
+            mock_dedup_repo = AsyncMock()
+            mock_dedup_repo.find_many_exact.return_value = [None, None]
+            
+            with patch('ai_news_agent.deduplication.service.NewsItemRepository', return_value=mock_news_repo):
+                with patch('ai_news_agent.deduplication.service.DeduplicationRepository', return_value=mock_dedup_repo):
+                    with patch.object(
+                        dedup_service.embedding_service,
+                        'encode_batch',
+                        return_value=np.array([[0.6, 0.8]], dtype=np.float32),
+                    ) as mock_encode:
+                        results = await dedup_service.check_batch(
+                            [sample_news_item, other]
+                        )
+        
+        # Only the item without an exact match is embedded
+        mock_encode.assert_called_once()
+        assert len(mock_encode.call_args[0][0]) == 1
+        assert results[0].match_type == "exact_url"
+        assert results[0].original_id == "stored_item"
+        assert results[1].is_duplicate is False
+    
+    @pytest.mark.asyncio
+    async def test_exact_matches_use_recent_url_index(
+        self, dedup_service, sample_news_item
+    ):
+        """Test recent URLs are matched in memory without querying the database."""
+        dedup_service._url_index = {str(sample_news_item.url): "recent_item"}
+        
+        with patch('ai_news_agent.deduplication.service.get_db_manager') as mock_db:
+            results = await dedup_service._find_exact_matches([sample_news_item])
+        
+        mock_db.assert_not_called()
+        assert results[0].match_type == "exact_url"
+        assert results[0].original_id == "recent_item"
+    
+    @pytest.mark.asyncio
+    async def test_exact_matches_reuse_caller_session(
+        self, dedup_service, sample_news_item
+    ):
+        """Test a session passed in is reused instead of opening a new one."""
+        session = AsyncMock()
+        
+        with patch('ai_news_agent.deduplication.service.get_db_manager') as mock_db:
+            with patch(
+                'ai_news_agent.deduplication.service.NewsItemRepository'
+            ) as mock_news_repo:
+                with patch(
+                    'ai_news_agent.deduplication.service.DeduplicationRepository'
+                ) as mock_dedup_repo:
+                    mock_news_repo.return_value.get_ids_by_urls = AsyncMock(
+                        return_value={}
+                    )
+                    mock_dedup_repo.return_value.find_many_exact = AsyncMock(
+                        return_value=[None]
+                    )
+                    results = await dedup_service._find_exact_matches(
+                        [sample_news_item], session
+                    )
+        
+        mock_db.assert_not_called()
+        mock_news_repo.assert_called_once_with(session)
+        mock_dedup_repo.assert_called_once_with(session)
+        assert results[0].is_duplicate is False
+    
+    @pytest.mark.asyncio
+    async def test_batch_check_skips_items_without_text(self, dedup_service):
+        """Test items with almost no title or content are not embedded."""
+        item = NewsItem(
+            url="https://example.com/empty",
+            title="Update",
+            source="TestSource",
+            published_at=datetime.now(UTC),
+        )
+        cached = MagicMock(id="cached_item_123", title="Something else entirely")
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(cached, np.array([1.0, 0.0], dtype=np.float32))]
+        
+        no_exact = [DuplicateMatch(False, None, 0.0, "none")]
+        with patch.object(
+            dedup_service, '_find_exact_matches', AsyncMock(return_value=no_exact)
+        ):
+            with patch.object(
+                dedup_service.embedding_service, 'encode_batch'
+            ) as mock_encode:
+                results = await dedup_service.check_batch([item])
+        
+        mock_encode.assert_not_called()
+        assert results[0].is_duplicate is False
+    
+    def test_simhash_index_finds_all_near_fingerprints(self):
+        """Test band lookups return every fingerprint within the distance."""
+        rng = np.random.default_rng(0)
+        base = int(rng.integers(0, 2**63))
+        fingerprints = [
+            base ^ (1 << int(b)) ^ (1 << int(c))
+            for b, c in rng.integers(0, 64, size=(50, 2))
+        ]
+        fingerprints += [int(f) for f in rng.integers(0, 2**63, size=200)]
+        index = SimHashIndex(max_distance=3)
+        for key, fingerprint in enumerate(fingerprints):
+            index.add(key, fingerprint)
+        index.remove(0, fingerprints[0])
+        
+        distances = hamming_distances(base, np.array(fingerprints, dtype=np.uint64))
+        expected = {key for key, d in enumerate(distances.tolist()) if d <= 3} - {0}
+        
+        assert expected
+        assert expected <= index.candidates(base)
+        assert 0 not in index.candidates(base)
+    
+    def test_fingerprint_reused_without_touching_metadata(
+        self, dedup_service, sample_news_item
+    ):
+        """Test fingerprints are cached internally and follow text changes."""
+        metadata = dict(sample_news_item.metadata)
+        fingerprint = dedup_service._fingerprint(sample_news_item)
+        
+        assert fingerprint == simhash(tokenize(sample_news_item.title))
+        assert sample_news_item.metadata == metadata
+        with patch('ai_news_agent.deduplication.service.simhash') as mock_simhash:
+            assert dedup_service._fingerprint(sample_news_item) == fingerprint
+        mock_simhash.assert_not_called()
+        
+        sample_news_item.title = "A completely different headline"
+        assert dedup_service._fingerprint(sample_news_item) != fingerprint
+    
+    @pytest.mark.asyncio
+    async def test_batch_check_similar_title(self, dedup_service):
+        """Test near-identical titles are matched by SimHash without embedding."""
+        item = NewsItem(
+            url="https://example.com/rewrite",
+            title="OpenAI Releases GPT-5 With Improved Reasoning Capabilities Today",
+            content="A rewritten report of the same announcement",
+            source="TestSource",
+            published_at=datetime.now(UTC),
+        )
+        cached = MagicMock(
+            id="cached_item_123",
+            title="OpenAI releases GPT-5 with improved reasoning capabilities today!",
+            published_at=item.published_at,
+        )
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(cached, np.array([1.0, 0.0], dtype=np.float32))]
+        
+        no_exact = [DuplicateMatch(False, None, 0.0, "none")]
+        with patch.object(
+            dedup_service, '_find_exact_matches', AsyncMock(return_value=no_exact)
+        ):
+            with patch.object(
+                dedup_service.embedding_service, 'encode_batch'
+            ) as mock_encode:
+                results = await dedup_service.check_batch([item])
+        
+        mock_encode.assert_not_called()
+        assert results[0].is_duplicate is True
+        assert results[0].match_type == "similar_title"
+        assert results[0].original_id == "cached_item_123"
+    
+    @pytest.mark.asyncio
+    async def test_batch_check_falls_back_to_next_candidate(
+        self, dedup_service, sample_news_item
+    ):
+        """Test a best match outside the time window does not hide the next one."""
+        published = sample_news_item.published_at
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [
+            (
+                MagicMock(id="old_item", published_at=published - timedelta(days=30)),
+                np.array([1.0, 0.0], dtype=np.float32),
+            ),
+            (
+                MagicMock(id="recent_item", published_at=published),
+                np.array([0.8, 0.6], dtype=np.float32),
+            ),
+        ]
+        
+        no_exact = [DuplicateMatch(False, None, 0.0, "none")]
+        with patch.object(
+            dedup_service, '_find_exact_matches', AsyncMock(return_value=no_exact)
+        ):
+            with patch.object(
+                dedup_service.embedding_service,
+                'encode_batch',
+                return_value=np.array([[1.0, 0.0]], dtype=np.float32),
+            ):
+                results = await dedup_service.check_batch([sample_news_item])
+        
+        assert results[0].is_duplicate is True
+        assert results[0].match_type == "similar_content"
+        assert results[0].original_id == "recent_item"
+        assert results[0].similarity_score == pytest.approx(0.8)
+    
+    @pytest.mark.asyncio
+    async def test_batch_check_computes_no_norms(self, dedup_service, sample_news_item):
+        """Test checks reuse the prenormalized candidates and unit queries."""
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(
+            MagicMock(id="cached_item_123", published_at=sample_news_item.published_at),
+            np.array([0.6, 0.8], dtype=np.float32),
+        )]
+        dedup_service._get_candidate_matrix()
+        
+        no_exact = [DuplicateMatch(False, None, 0.0, "none")]
+        with patch.object(
+            dedup_service, '_find_exact_matches', AsyncMock(return_value=no_exact)
+        ):
+            with patch.object(
+                dedup_service.embedding_service,
+                'encode_batch',
+                return_value=np.array([[0.6, 0.8]], dtype=np.float32),
+            ):
+                with patch('numpy.linalg.norm') as mock_norm:
+                    results = await dedup_service.check_batch([sample_news_item])
+        
+        mock_norm.assert_not_called()
+        assert results[0].original_id == "cached_item_123"
+    
+    @pytest.mark.asyncio
+    async def test_low_memory_candidate_matrix(self, embedding_service, sample_news_item):
+        """Test low-memory mode stores candidates as float16 and still matches."""
+        service = DeduplicationService(
+            embedding_service=embedding_service,
+            similarity_threshold=0.7,
+            low_memory=True,
+        )
+        service._cache_loaded = True
+        service._items_cache = [(
+            MagicMock(id="cached_item_123", published_at=sample_news_item.published_at),
+            np.array([0.6, 0.8], dtype=np.float32),
+        )]
+        assert service._get_candidate_matrix().dtype == np.float16
+        
+        no_exact = [DuplicateMatch(False, None, 0.0, "none")]
+        with patch.object(service, '_find_exact_matches', AsyncMock(return_value=no_exact)):
+            with patch.object(
+                embedding_service,
+                'encode_batch',
+                return_value=np.array([[0.6, 0.8]], dtype=np.float32),
+            ):
+                results = await service.check_batch([sample_news_item])
+        
+        assert results[0].original_id == "cached_item_123"
+        assert results[0].similarity_score == pytest.approx(1.0, abs=1e-3)
+    
+    @pytest.mark.asyncio
+    async def test_add_many_to_cache_extends_candidates(
+        self, dedup_service, sample_news_item
+    ):
+        """Test stored items are appended to the candidate matrix."""
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(
+            MagicMock(id="cached_item_123", title="Cached story"),
+            np.array([2.0, 0.0], dtype=np.float32),
+        )]
+        matrix = dedup_service._get_candidate_matrix()
+        assert matrix.dtype == np.float32
+        assert np.allclose(matrix, [[1.0, 0.0]])
+        
+        with patch.object(
+            dedup_service.embedding_service,
+            'encode_batch',
+            return_value=np.array([[0.0, 3.0]], dtype=np.float32),
+        ):
+            await dedup_service.add_many_to_cache([sample_news_item])
+        
+        assert len(dedup_service._items_cache) == 2
+        assert dedup_service._items_cache[1][0] is sample_news_item
+        assert np.allclose(dedup_service._get_candidate_matrix(), [[1.0, 0.0], [0.0, 1.0]])
+    
+    @pytest.mark.asyncio
+    async def test_load_cache_uses_persisted_embeddings(
+        self, embedding_service, temp_cache_dir
+    ):
+        """Test a restarted service loads stored embeddings without the model."""
+        rows = [
+            MagicMock(
+                id=f"item{i}",
+                url=f"https://example.com/{i}",
+                title=f"Story {i}",
+                content="Body",
+                published_at=datetime.now(UTC),
+            )
+            for i in range(2)
+        ]
+        texts = embedding_service.combine_text_for_similarity_batch(
+            [row.title for row in rows],
+            [row.content for row in rows],
+            [row.url for row in rows],
+        )
+        stored = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+        embedding_service.store.put_many(
+            [embedding_service._get_cache_key(text) for text in texts], stored
+        )
+        embedding_service.store.flush()
+        
+        restarted = DeduplicationService(
+            embedding_service=EmbeddingService(
+                model_name="all-MiniLM-L6-v2", cache_dir=temp_cache_dir
+            )
+        )
+        with patch('ai_news_agent.deduplication.service.get_db_manager'):
+            mock_news_repo = AsyncMock()
+            mock_news_repo.get_recent.return_value = rows
+            with patch(
+                'ai_news_agent.deduplication.service.NewsItemRepository',
+                return_value=mock_news_repo,
+            ):
+                with patch(
+                    'ai_news_agent.deduplication.embeddings._load_model'
+                ) as mock_load:
+                    await restarted.load_recent_items_cache()
+        
+        mock_load.assert_not_called()
+        assert np.allclose(restarted._get_candidate_matrix(), stored[::-1])
+    
+    @pytest.mark.asyncio
+    async def test_cache_size_bounds_memory(self, dedup_service, sample_news_item):
+        """Test the oldest candidates and embeddings are evicted past the cap."""
+        dedup_service.cache_size = 2
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(
+            MagicMock(id="oldest", url="https://example.com/oldest"),
+            np.array([1.0, 0.0], dtype=np.float32),
+        )]
+        dedup_service._url_index = {"https://example.com/oldest": "oldest"}
+        dedup_service._get_candidate_matrix()
+        dedup_service._get_title_index()
+        buffer = dedup_service._cache_matrix
+        other = NewsItem(
+            url="https://example.com/other",
+            title="Another story",
+            content="Different content",
+            source="TestSource",
+            published_at=sample_news_item.published_at,
+        )
+        
+        with patch.object(
+            dedup_service.embedding_service,
+            'encode_batch',
+            return_value=np.array([[0.0, 1.0], [0.6, 0.8]], dtype=np.float32),
+        ):
+            await dedup_service.add_many_to_cache([sample_news_item, other])
+        
+        # The oldest slot is overwritten in place
+        assert dedup_service._cache_matrix is buffer
+        assert [item.id for item, _ in dedup_service._items_cache] == [
+            other.id,
+            sample_news_item.id,
+        ]
+        assert np.allclose(
+            dedup_service._get_candidate_matrix(), [[0.6, 0.8], [0.0, 1.0]]
+        )
+        assert "https://example.com/oldest" not in dedup_service._url_index
+        title_fingerprint = simhash(tokenize(sample_news_item.title))
+        assert dedup_service._title_index.candidates(title_fingerprint) == {1}
+        assert list(dedup_service._embedding_cache) == [sample_news_item.id, other.id]
+    
+    @pytest.mark.asyncio
+    async def test_appended_candidates_written_in_place(
+        self, dedup_service, sample_news_item
+    ):
+        """Test fingerprints and timestamps grow by slot, not by copying."""
+        dedup_service._cache_loaded = True
+        dedup_service._items_cache = [(sample_news_item, np.array([1.0, 0.0]))]
+        dedup_service._get_fingerprints()
+        dedup_service._get_published_timestamps()
+        fingerprints = dedup_service._fingerprints
+        timestamps = dedup_service._published_ts
+        items = [
+            NewsItem(
+                url=f"https://example.com/story-{i}",
+                title=f"Story number {i}",
+                content="Some content",
+                source="TestSource",
+                published_at=sample_news_item.published_at + timedelta(hours=i),
+            )
+            for i in range(3)
+        ]
+        
+        with patch.object(
+            dedup_service.embedding_service,
+            'encode_batch',
+            return_value=np.eye(3, 2, dtype=np.float32) + 0.1,
+        ):
+            await dedup_service.add_many_to_cache(items)
+        
+        assert dedup_service._fingerprints is fingerprints
+        assert dedup_service._published_ts is timestamps
+        assert dedup_service._get_fingerprints().tolist() == [
+            dedup_service._fingerprint(item) for item in [sample_news_item, *items]
+        ]
+        assert dedup_service._get_published_timestamps().tolist() == [
+            item.published_at.timestamp() for item in [sample_news_item, *items]
+        ]
+    
+    def test_semantic_match_time_window_uses_timestamps(
+        self, dedup_service, sample_news_item
+    ):
+        """Test publication gaps are checked on epoch timestamps."""
+        published = sample_news_item.published_at
+        stored = published.astimezone(UTC).replace(tzinfo=None)  # Naive UTC
+        dedup_service._items_cache = [
+            (MagicMock(id="too_old", published_at=stored - timedelta(days=8)), None),
+            (MagicMock(id="recent", published_at=stored - timedelta(days=1)), None),
+        ]
+        
+        match = dedup_service._semantic_match(
+            sample_news_item, np.array([0, 1]), np.array([0.99, 0.9])
+        )
+        
+        assert match.original_id == "recent"
+        assert dedup_service._get_published_timestamps().tolist() == [
+            (published - timedelta(days=8)).timestamp(),
+            (published - timedelta(days=1)).timestamp(),
+        ]
+    
     @pytest.mark.asyncio
     async def test_cleanup_old_data(self, dedup_service, temp_cache_dir):
         """Test cleanup of old deduplication data."""
@@ -334,6 +994,8 @@ class TestDeduplicationService:
         old_file = temp_cache_dir / "00" / "old_file.npy"
         old_file.parent.mkdir(exist_ok=True)
         np.save(old_file, np.array([1, 2, 3]))
+        recent_file = temp_cache_dir / "00" / "recent_file.npy"
+        np.save(recent_file, np.array([1, 2, 3]))
         
         # Mock database cleanup
         with patch('ai_news_agent.deduplication.service.get_db_manager') as mock_db:
@@ -1,5 +1,6 @@
 """Tests for digest generation module."""
 
+import math
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -106,6 +107,49 @@ class TestNewsRanker:
         
         assert "breaking" in top_tags or "important" in top_tags
     
+    def test_rank_items_scores(self, sample_news_items):
+        """Test the combined score of each signal for a single item."""
+        ranker = NewsRanker()
+        item = sample_news_items[1]  # Two important tags, short content
+        reference_time = item.published_at + timedelta(hours=24)
+        
+        [(_, score)] = ranker.rank_items([item], reference_time=reference_time)
+        
+        expected = (
+            ranker.recency_weight * math.exp(-1)
+            + ranker.relevance_weight * 1.0
+            + ranker.length_weight * 0.1
+            + ranker.diversity_weight * 1.0
+        )
+        assert score == pytest.approx(expected)
+        
+        # Naive datetimes are read as UTC, as they are stored
+        naive = item.model_copy(
+            update={"published_at": item.published_at.replace(tzinfo=None)}
+        )
+        [(_, naive_score)] = ranker.rank_items([naive], reference_time=reference_time)
+        assert naive_score == pytest.approx(expected)
+    
+    def test_rank_items_past_dominant_source(self, sample_news_items):
+        """Test selection reaches past the head when one source dominates."""
+        ranker = NewsRanker()
+        base = sample_news_items[0]
+        items = [
+            base.model_copy(update={"id": f"top-{i}"}) for i in range(10)
+        ] + [
+            base.model_copy(
+                update={
+                    "id": "other",
+                    "source": "OtherSource",
+                    "published_at": base.published_at - timedelta(days=3),
+                }
+            )
+        ]
+        
+        ranked = ranker.rank_items(items, max_items=2, max_per_source=1)
+        
+        assert [item.id for item, _ in ranked] == ["top-0", "other"]
+    
     def test_group_by_category(self, sample_news_items):
         """Test grouping by category."""
         ranker = NewsRanker()
@@ -126,6 +170,17 @@ class TestNewsRanker:
             ai_titles = [item.title for item, _ in grouped["ai"]]
             assert any("AI" in title or "Machine Learning" in title for title in ai_titles)
     
+    def test_summarize_single_pass(self, sample_news_items):
+        """Test summarize groups by category and day and collects sources."""
+        ranker = NewsRanker()
+        ranked = ranker.rank_items(sample_news_items, max_items=5, max_per_source=3)
+        
+        summary = ranker.summarize(ranked)
+        
+        assert summary.categories == ranker.group_by_category(ranked)
+        assert sum(len(items) for items in summary.by_day.values()) == len(ranked)
+        assert summary.sources == list(dict.fromkeys(item.source for item, _ in ranked))
+    
     def test_get_top_topics(self, sample_news_items):
         """Test extracting top topics."""
         ranker = NewsRanker()
@@ -223,7 +278,7 @@ class TestDigestGenerator:
                 mock_db_item.extra_metadata = item.metadata
                 mock_db_items.append(mock_db_item)
             
-            mock_news_repo.get_recent.return_value = mock_db_items
+            mock_news_repo.get_in_range.return_value = mock_db_items
             
             with patch('ai_news_agent.digest.generator.DigestRepository', return_value=mock_digest_repo):
                 with patch('ai_news_agent.digest.generator.NewsItemRepository', return_value=mock_news_repo):
@@ -247,7 +302,7 @@ class TestDigestGenerator:
             mock_digest_repo.get_daily_digest.return_value = None
             
             mock_news_repo = AsyncMock()
-            mock_news_repo.get_recent.return_value = []
+            mock_news_repo.get_in_range.return_value = []
             
             with patch('ai_news_agent.digest.generator.DigestRepository', return_value=mock_digest_repo):
                 with patch('ai_news_agent.digest.generator.NewsItemRepository', return_value=mock_news_repo):
@@ -285,7 +340,7 @@ class TestDigestGenerator:
                 mock_db_item.extra_metadata = item.metadata
                 mock_db_items.append(mock_db_item)
             
-            mock_news_repo.get_recent.return_value = mock_db_items
+            mock_news_repo.get_in_range.return_value = mock_db_items
             
             with patch('ai_news_agent.digest.generator.DigestRepository', return_value=mock_digest_repo):
                 with patch('ai_news_agent.digest.generator.NewsItemRepository', return_value=mock_news_repo):
@@ -43,10 +43,14 @@ async def test_collector_full_integration():
         # Create a mock response object
         class MockResp:
             status = 200
+            headers = {}
 
             async def text(self):
                 return test_rss
 
+            async def read(self):
+                return test_rss.encode()
+
             async def __aenter__(self):
                 return self
 
@@ -114,10 +118,14 @@ async def test_collector_error_handling():
 
         class MockResp:
             status = 200
+            headers = {}
 
             async def text(self):
                 return good_rss
 
+            async def read(self):
+                return good_rss.encode()
+
             async def __aenter__(self):
                 return self
 
@@ -1,6 +1,8 @@
 """Comprehensive tests for RSS collector module"""
 
-from unittest.mock import patch
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
 
 import aiohttp
 import pytest
@@ -23,15 +25,19 @@ from .fixtures.rss_samples import (
 class MockResponse:
     """Mock aiohttp response"""
 
-    def __init__(self, text: str, status: int = 200):
+    def __init__(self, text: str, status: int = 200, headers: dict | None = None):
         self._text = text
         self.status = status
+        self.headers = headers or {}
         self.request_info = None
         self.history = []
 
     async def text(self) -> str:
         return self._text
 
+    async def read(self) -> bytes:
+        return self._text.encode()
+
     async def __aenter__(self):
         return self
 
@@ -114,6 +120,36 @@ async def test_collector_filters_old_articles():
             assert items[0].title == "Recent AI Development"
 
 
+@pytest.mark.asyncio
+async def test_collector_filters_timezone_aware_dates():
+    """Should compare timezone-aware publication dates against the cutoff"""
+
+    feeds_config = [{"url": "https://example.com/feed", "name": "Test Feed"}]
+    now = datetime.now(timezone(timedelta(hours=-5)))
+    items = [
+        NewsItem(
+            url=f"https://example.com/{name}",
+            title=name,
+            content="Content",
+            source="Test Feed",
+            published_at=published_at,
+        )
+        for name, published_at in [
+            ("recent", now - timedelta(days=1)),
+            ("old", now - timedelta(days=settings.max_age_days + 1)),
+        ]
+    ]
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch.object(
+            RSSCollector, "_get_feed_items", AsyncMock(return_value=items)
+        ):
+            collector = RSSCollector()
+            collected = await collector.collect()
+
+            assert [item.title for item in collected] == ["recent"]
+
+
 @pytest.mark.asyncio
 async def test_collector_handles_network_errors_with_retry():
     """Should retry on failure with exponential backoff"""
@@ -402,3 +438,139 @@ async def test_collector_validates_required_fields():
             # Should only get the valid item
             assert len(items) == 1
             assert items[0].title == "Valid Article"
+
+
+@pytest.mark.asyncio
+async def test_collector_reuses_session_across_collections():
+    """Should keep one HTTP session alive between collect() calls"""
+
+    feeds_config = [{"url": "https://example.com/feed", "name": "Test Feed"}]
+
+    sessions = []
+
+    async def mock_request(self, method, url, **kwargs):
+        sessions.append(self)
+        return MockResponse(TECHCRUNCH_RSS)
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch("aiohttp.ClientSession._request", mock_request):
+            collector = RSSCollector()
+            await collector.collect()
+            await collector.collect()
+
+            assert len(sessions) == 2
+            assert sessions[0] is sessions[1]
+            assert not sessions[0].closed
+
+            await collector.close()
+            assert sessions[0].closed
+            assert collector._session is None
+
+
+@pytest.mark.asyncio
+async def test_collector_conditional_get_reuses_items_on_304():
+    """Should send validators and reuse parsed items on 304 Not Modified"""
+
+    feeds_config = [{"url": "https://example.com/feed", "name": "Test Feed"}]
+
+    sent_headers = []
+
+    async def mock_request(self, method, url, **kwargs):
+        sent_headers.append(kwargs.get("headers") or {})
+        if len(sent_headers) == 1:
+            return MockResponse(
+                TECHCRUNCH_RSS,
+                headers={"ETag": '"abc"', "Last-Modified": "Mon, 15 Jan 2024"},
+            )
+        return MockResponse("", status=304)
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch("aiohttp.ClientSession._request", mock_request):
+            collector = RSSCollector()
+            first = await collector.collect()
+            second = await collector.collect()
+
+            assert "If-None-Match" not in sent_headers[0]
+            assert "gzip" in sent_headers[0]["Accept-Encoding"]
+            assert sent_headers[1]["If-None-Match"] == '"abc"'
+            assert sent_headers[1]["If-Modified-Since"] == "Mon, 15 Jan 2024"
+            assert [i.id for i in second] == [i.id for i in first]
+            assert collector.stats["Test Feed"].success_count == 2
+
+
+@pytest.mark.asyncio
+async def test_collector_honors_cache_control_max_age():
+    """Should not refetch a feed while its max-age has not expired"""
+
+    feeds_config = [{"url": "https://example.com/feed", "name": "Test Feed"}]
+
+    call_count = 0
+
+    async def mock_request(self, method, url, **kwargs):
+        nonlocal call_count
+        call_count += 1
+        return MockResponse(
+            TECHCRUNCH_RSS, headers={"Cache-Control": "public, max-age=600"}
+        )
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch("aiohttp.ClientSession._request", mock_request):
+            collector = RSSCollector()
+            await collector.collect()
+            items = await collector.collect()
+
+            assert call_count == 1
+            assert len(items) == 2
+
+
+@pytest.mark.asyncio
+async def test_collector_serves_prefetched_feeds_from_cache():
+    """Should refresh feeds in the background and collect without fetching"""
+
+    feeds_config = [{"url": "https://example.com/feed", "name": "Test Feed"}]
+
+    call_count = 0
+
+    async def mock_request(self, method, url, **kwargs):
+        nonlocal call_count
+        call_count += 1
+        return MockResponse(TECHCRUNCH_RSS)
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch("aiohttp.ClientSession._request", mock_request):
+            with patch("random.uniform", return_value=0):
+                collector = RSSCollector()
+                collector.start_prefetch()
+                await asyncio.sleep(0.1)
+
+                assert call_count == 1
+                items = await collector.collect()
+                assert call_count == 1
+                assert len(items) == 2
+
+                await collector.close()
+                assert not collector._prefetch_tasks
+
+
+@pytest.mark.asyncio
+async def test_collector_yields_items_in_batches():
+    """Should yield deduplicated items in chunks of at most batch_size"""
+
+    feeds_config = [
+        {"url": "https://example.com/feed1", "name": "Feed 1"},
+        {"url": "https://example.com/feed2", "name": "Feed 2"},
+    ]
+
+    async def mock_request(self, method, url, **kwargs):
+        return MockResponse(TECHCRUNCH_RSS if "feed1" in str(url) else VERGE_RSS)
+
+    with patch.object(settings, "rss_feeds", feeds_config):
+        with patch("aiohttp.ClientSession._request", mock_request):
+            collector = RSSCollector()
+            batches = [batch async for batch in collector.collect_batched(3)]
+            items = await collector.collect()
+
+            assert all(0 < len(batch) <= 3 for batch in batches)
+            assert sorted(i.id for b in batches for i in b) == sorted(
+                i.id for i in items
+            )
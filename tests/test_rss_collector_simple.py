@@ -40,6 +40,19 @@ async def test_arxiv_parser():
     assert str(items[0].url) == "http://arxiv.org/abs/2401.12345"
     assert items[0].source == "ArXiv Test"
     assert "John Doe" in items[0].metadata.get("authors", "")
+    assert items[0].metadata["arxiv_id"] == "2401.12345"
+    assert set(items[0].tags) == {"arxiv", "cs.ai"}
+
+
+def test_arxiv_parser_old_style_id_category():
+    """Test old-style ArXiv IDs yield the category as a tag"""
+    parser = ArxivParser("ArXiv Test")
+    item = parser._parse_entry(
+        {"title": "Paper", "link": "https://arxiv.org/abs/math.GT/0309136v2"}
+    )
+
+    assert item.metadata["arxiv_id"] == "math.GT/0309136v2"
+    assert set(item.tags) == {"math.gt", "arxiv"}
 
 
 @pytest.mark.asyncio
@@ -51,6 +64,84 @@ async def test_empty_feed_parsing():
     assert len(items) == 0
 
 
+@pytest.mark.asyncio
+async def test_parser_decodes_bytes_per_xml_declaration():
+    """Test raw bytes are decoded using the feed's declared encoding"""
+    feed = (
+        '<?xml version="1.0" encoding="ISO-8859-1"?>'
+        "<rss><channel><item><title>Caf\u00e9 AI</title>"
+        "<link>https://example.com/cafe</link></item></channel></rss>"
+    ).encode("latin-1")
+
+    items = await StandardParser("Test Feed").parse(feed)
+
+    assert len(items) == 1
+    assert items[0].title == "Caf\u00e9 AI"
+
+
+@pytest.mark.asyncio
+async def test_parser_uses_one_collection_time_per_feed():
+    """Test all entries of a feed share one collection timestamp"""
+    feed = (
+        "<rss><channel>"
+        "<item><title>A</title><link>https://example.com/a</link></item>"
+        "<item><title>B</title><link>https://example.com/b</link></item>"
+        "</channel></rss>"
+    )
+
+    first, second = await StandardParser("Test Feed").parse(feed)
+
+    assert first.collected_at is second.collected_at
+    # Undated entries fall back to the collection time, as naive UTC
+    assert first.published_at == first.collected_at.replace(tzinfo=None)
+
+
+def test_parser_ignores_extension_namespaces():
+    """Test media: and itunes: elements don't shadow the entry's own fields"""
+    feed = (
+        '<rss xmlns:media="http://search.yahoo.com/mrss/"'
+        ' xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"'
+        ' xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        "<channel><item>"
+        "<media:title>Thumbnail caption</media:title>"
+        "<itunes:summary>Episode blurb</itunes:summary>"
+        "<itunes:author>Podcast Host</itunes:author>"
+        "<title>Real headline</title>"
+        '<media:content url="https://example.com/thumb.jpg"/>'
+        "<link>https://example.com/story</link>"
+        "<content:encoded>&lt;p&gt;Full story&lt;/p&gt;</content:encoded>"
+        "<description>Short summary</description>"
+        "</item></channel></rss>"
+    )
+
+    [item] = StandardParser("Test Feed")._parse_sync(feed)
+
+    assert item.title == "Real headline"
+    assert item.content == "Full story"
+    assert item.summary == "Short summary"
+    assert "author" not in item.metadata
+
+
+def test_clean_html_strips_tags_and_entities():
+    """Test HTML stripping keeps words apart and decodes entities"""
+    parser = StandardParser("Test Feed")
+    html = "<p>AI &amp; ML</p><script>var x = 1;</script><p>news\n today</p>"
+
+    assert parser._clean_html(html) == "AI & ML news today"
+    assert parser._clean_html(None) == ""
+
+
+def test_parse_date_formats():
+    """Test RFC 822, ISO 8601 and free-form feed dates"""
+    parser = StandardParser("Test Feed")
+    expected = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+
+    assert parser._parse_date("Mon, 15 Jan 2024 10:00:00 GMT") == expected
+    assert parser._parse_date("2024-01-15T10:00:00Z") == expected
+    assert parser._parse_date("January 15, 2024") == datetime(2024, 1, 15)
+    assert parser._parse_date("not a date") is None
+
+
 @pytest.mark.asyncio
 async def test_news_item_id_generation():
     """Test NewsItem ID auto-generation"""
@@ -12,6 +12,14 @@ from ai_news_agent.models import NewsItem
 from ai_news_agent.storage.models import CollectorRunDB, NewsItemDB
 
 
+def batches_of(*batches):
+    """Build a collect_batched replacement yielding the given batches."""
+    async def collect_batched(batch_size=256):
+        for batch in batches:
+            yield batch
+    return collect_batched
+
+
 @pytest.fixture
 def sample_news_items():
     """Create sample news items for testing."""
@@ -85,7 +93,7 @@ class TestRSSCollectorWithStorage:
             collector = RSSCollectorWithStorage()
         
         # Mock the parent collect method
-        with patch.object(collector, 'collect', return_value=sample_news_items):
+        with patch.object(collector, 'collect_batched', batches_of(sample_news_items)):
             # Mock deduplication service
             mock_dup_results = [
                 DuplicateMatch(
@@ -108,7 +116,7 @@ class TestRSSCollectorWithStorage:
                 ),
             ]
             with patch.object(collector.dedup_service, 'check_batch', return_value=mock_dup_results):
-                with patch.object(collector.dedup_service, 'add_to_cache'):
+                with patch.object(collector.dedup_service, 'add_many_to_cache'):
                     # Mock database operations
                     with patch('ai_news_agent.collectors.rss_with_storage.get_db_manager') as mock_db:
                         mock_session = AsyncMock()
@@ -125,12 +133,9 @@ class TestRSSCollectorWithStorage:
                         mock_collector_repo.create_run.return_value = mock_run
                         
                         # Mock news item creation
-                        created_items = []
-                        for item in sample_news_items[:2]:  # Only first two are new
-                            db_item = MagicMock()
-                            db_item.id = item.id
-                            created_items.append(db_item)
-                        mock_news_repo.create.side_effect = created_items
+                        mock_news_repo.create_many.return_value = [
+                            item.id for item in sample_news_items[:2]  # Only first two are new
+                        ]
                         
                         # Mock stats
                         with patch.object(collector, 'get_stats', return_value=[]):
@@ -148,11 +153,94 @@ class TestRSSCollectorWithStorage:
         
         # Verify repository calls
         mock_collector_repo.create_run.assert_called_once_with("rss")
-        assert mock_news_repo.create.call_count == 2
-        mock_dedup_repo.add_to_cache.assert_called()
+        mock_news_repo.create_many.assert_called_once_with(sample_news_items[:2])
+        mock_news_repo.create.assert_not_called()
+        mock_dedup_repo.add_many_to_cache.assert_called_once_with(sample_news_items[:2])
         mock_collector_repo.complete_run.assert_called_once()
         mock_session.commit.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_collect_and_store_checks_each_batch(self, sample_news_items):
+        """Test duplicates are checked per collected batch."""
+        with patch('ai_news_agent.collectors.rss.settings') as mock_settings:
+            mock_settings.rss_feeds = []
+            mock_settings.max_age_days = 7
+            collector = RSSCollectorWithStorage()
+        
+        new = DuplicateMatch(
+            is_duplicate=False, original_id=None, similarity_score=0.0, match_type="none"
+        )
+        dup = DuplicateMatch(
+            is_duplicate=True, original_id="x", similarity_score=1.0, match_type="exact_url"
+        )
+        batches = batches_of(sample_news_items[:2], sample_news_items[2:])
+        
+        with patch.object(collector, 'collect_batched', batches):
+            with patch.object(
+                collector.dedup_service, 'check_batch', side_effect=[[new, dup], [new]]
+            ) as mock_check:
+                with patch.object(collector.dedup_service, 'add_many_to_cache'):
+                    with patch('ai_news_agent.collectors.rss_with_storage.get_db_manager') as mock_db:
+                        mock_session = AsyncMock()
+                        mock_db.return_value.get_session.return_value.__aenter__.return_value = mock_session
+                        
+                        mock_news_repo = AsyncMock()
+                        mock_news_repo.create_many.side_effect = lambda items: [
+                            item.id for item in items
+                        ]
+                        mock_collector_repo = AsyncMock()
+                        mock_collector_repo.create_run.return_value = MagicMock(id=1)
+                        
+                        with patch.object(collector, 'get_stats', return_value=[]):
+                            with patch('ai_news_agent.collectors.rss_with_storage.NewsItemRepository', return_value=mock_news_repo):
+                                with patch('ai_news_agent.collectors.rss_with_storage.CollectorRepository', return_value=mock_collector_repo):
+                                    with patch('ai_news_agent.collectors.rss_with_storage.DeduplicationRepository', return_value=AsyncMock()):
+                                        new_items, stats = await collector.collect_and_store()
+        
+        assert mock_check.call_count == 2
+        assert new_items == [sample_news_items[0], sample_news_items[2]]
+        assert stats["total"] == 3
+        assert stats["duplicates"] == 1
+        mock_news_repo.create_many.assert_called_once_with(new_items)
+    
+    @pytest.mark.asyncio
+    async def test_collect_and_store_counts_skipped_rows(self, sample_news_items):
+        """Test rows the database skips as already stored count as duplicates."""
+        with patch('ai_news_agent.collectors.rss.settings') as mock_settings:
+            mock_settings.rss_feeds = []
+            mock_settings.max_age_days = 7
+            collector = RSSCollectorWithStorage()
+        
+        new = DuplicateMatch(
+            is_duplicate=False, original_id=None, similarity_score=0.0, match_type="none"
+        )
+        
+        with patch.object(collector, 'collect_batched', batches_of(sample_news_items)):
+            with patch.object(collector.dedup_service, 'check_batch', return_value=[new] * 3):
+                with patch.object(collector.dedup_service, 'add_many_to_cache'):
+                    with patch('ai_news_agent.collectors.rss_with_storage.get_db_manager') as mock_db:
+                        mock_session = AsyncMock()
+                        mock_db.return_value.get_session.return_value.__aenter__.return_value = mock_session
+                        
+                        mock_news_repo = AsyncMock()
+                        # Second item was stored concurrently by another run
+                        mock_news_repo.create_many.return_value = [
+                            sample_news_items[0].id, sample_news_items[2].id
+                        ]
+                        mock_collector_repo = AsyncMock()
+                        mock_collector_repo.create_run.return_value = MagicMock(id=1)
+                        
+                        with patch.object(collector, 'get_stats', return_value=[]):
+                            with patch('ai_news_agent.collectors.rss_with_storage.NewsItemRepository', return_value=mock_news_repo):
+                                with patch('ai_news_agent.collectors.rss_with_storage.CollectorRepository', return_value=mock_collector_repo):
+                                    with patch('ai_news_agent.collectors.rss_with_storage.DeduplicationRepository', return_value=AsyncMock()):
+                                        new_items, stats = await collector.collect_and_store()
+        
+        assert new_items == [sample_news_items[0], sample_news_items[2]]
+        assert stats["new"] == 2
+        assert stats["duplicates"] == 1
+        assert stats["failed_sources"] == []
+    
     @pytest.mark.asyncio
     async def test_collect_and_store_no_items(self):
         """Test collection with no items returned."""
@@ -163,7 +251,7 @@ class TestRSSCollectorWithStorage:
             collector = RSSCollectorWithStorage()
         
         # Mock empty collection
-        with patch.object(collector, 'collect', return_value=[]):
+        with patch.object(collector, 'collect_batched', batches_of()):
             new_items, stats = await collector.collect_and_store()
         
         assert len(new_items) == 0
@@ -179,7 +267,7 @@ class TestRSSCollectorWithStorage:
             mock_settings.max_age_days = 7
             collector = RSSCollectorWithStorage()
         
-        with patch.object(collector, 'collect', return_value=sample_news_items):
+        with patch.object(collector, 'collect_batched', batches_of(sample_news_items)):
             # All items are duplicates
             mock_dup_results = [
                 DuplicateMatch(
@@ -217,7 +305,7 @@ class TestRSSCollectorWithStorage:
             mock_settings.max_age_days = 7
             collector = RSSCollectorWithStorage()
         
-        with patch.object(collector, 'collect', return_value=sample_news_items):
+        with patch.object(collector, 'collect_batched', batches_of(sample_news_items)):
             mock_dup_results = [
                 DuplicateMatch(
                     is_duplicate=False,
@@ -236,7 +324,11 @@ class TestRSSCollectorWithStorage:
                     mock_run = MagicMock(id=1)
                     mock_collector_repo.create_run.return_value = mock_run
                     
-                    # First item succeeds, second fails, third succeeds
+                    # Bulk insert fails, then item by item in savepoints:
+                    # first item succeeds, second fails, third succeeds
+                    mock_news_repo.create_many.side_effect = Exception("Database error")
+                    mock_session.begin_nested = MagicMock()
+
                     async def create_side_effect(item):
                         if item.source == "HealthTech":
                             raise Exception("Database error")
@@ -251,11 +343,12 @@ class TestRSSCollectorWithStorage:
                             with patch('ai_news_agent.collectors.rss_with_storage.CollectorRepository', return_value=mock_collector_repo):
                                 mock_dedup_repo = AsyncMock()
                                 with patch('ai_news_agent.collectors.rss_with_storage.DeduplicationRepository', return_value=mock_dedup_repo):
-                                    with patch.object(collector.dedup_service, 'add_to_cache'):
+                                    with patch.object(collector.dedup_service, 'add_many_to_cache'):
                                         new_items, stats = await collector.collect_and_store()
         
         assert len(new_items) == 2  # Two successful
         assert "HealthTech" in stats["failed_sources"]  # Middle item failed
+        assert mock_session.begin_nested.call_count == 3
     
     @pytest.mark.asyncio
     async def test_cleanup_old_duplicates(self):
@@ -322,10 +415,10 @@ class TestRSSCollectorWithStorage:
             mock_collector_repo = AsyncMock()
             
             # Mock source counts
-            mock_news_repo.count_by_source.return_value = [
-                ("TechNews", 50),
-                ("HealthTech", 30),
-            ]
+            mock_news_repo.count_by_source_with_total.return_value = (
+                {"TechNews": 50, "HealthTech": 30},
+                80,
+            )
             
             # Mock collector stats
             mock_stats = MagicMock()
@@ -5,6 +5,7 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from apscheduler.events import EVENT_JOB_SUBMITTED, JobSubmissionEvent
 from apscheduler.triggers.cron import CronTrigger
 
 from ai_news_agent.scheduler import ScheduledTask, Scheduler
@@ -307,6 +308,66 @@ class TestScheduler:
         # Try to stop again
         scheduler.stop()  # Should log warning but not fail
     
+    @pytest.mark.asyncio
+    async def test_shutdown_closes_collector(self, scheduler):
+        """Test shutdown stops the scheduler and closes the collector."""
+        scheduler.start()
+        
+        await scheduler.shutdown()
+        await asyncio.sleep(0.1)
+        
+        assert not scheduler.scheduler.running
+        scheduler.collector.close.assert_awaited_once()
+        
+        # Safe to call when already stopped
+        await scheduler.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_started_only_when_enabled(self, scheduler):
+        """Test feed prefetch is opt-in and runs with the scheduler."""
+        scheduler.collector.start_prefetch = MagicMock()
+        
+        scheduler.start()
+        scheduler.stop()
+        await asyncio.sleep(0.1)
+        scheduler.collector.start_prefetch.assert_not_called()
+        
+        with patch("ai_news_agent.scheduler.scheduler.settings") as mock_settings:
+            mock_settings.prefetch_enabled = True
+            scheduler.start()
+        try:
+            scheduler.collector.start_prefetch.assert_called_once_with()
+        finally:
+            await scheduler.shutdown()
+    
+    @pytest.mark.asyncio
+    async def test_next_run_tracked_without_job_lookups(self, scheduler):
+        """Test next run times come from scheduler events, not job lookups."""
+        async def dummy_task():
+            pass
+        
+        task = ScheduledTask("test", "0 * * * *", dummy_task)
+        scheduler.add_task(task)
+        scheduler.start()
+        try:
+            assert task.next_run is not None
+            
+            # APScheduler moves the job on before dispatching the event
+            job = scheduler.scheduler.get_job("test")
+            later = job.next_run_time + timedelta(hours=1)
+            job.modify(next_run_time=later)
+            scheduler._on_job_submitted(
+                JobSubmissionEvent(EVENT_JOB_SUBMITTED, "test", "default", [])
+            )
+            assert task.next_run == later
+            
+            with patch.object(scheduler.scheduler, "get_job") as mock_get_job:
+                await scheduler.run_task_now("test")
+            mock_get_job.assert_not_called()
+            assert task.next_run == later
+        finally:
+            scheduler.stop()
+    
     def test_get_status(self, scheduler):
         """Test getting scheduler status."""
         # Add tasks
@@ -337,6 +398,23 @@ class TestScheduler:
         assert status["tasks"]["task2"]["error_count"] == 2
         assert status["tasks"]["task2"]["last_error"] == "Test error"
     
+    @pytest.mark.asyncio
+    async def test_get_status_cached_until_task_runs(self, scheduler):
+        """Test status snapshot is reused until task state changes."""
+        async def task1():
+            pass
+        
+        scheduler.add_task(ScheduledTask("task1", "0 * * * *", task1))
+        
+        first = scheduler.get_status()
+        assert scheduler.get_status()["tasks"] is first["tasks"]
+        
+        await scheduler.run_task_now("task1")
+        
+        status = scheduler.get_status()
+        assert status["tasks"] is not first["tasks"]
+        assert status["tasks"]["task1"]["run_count"] == 1
+    
     @pytest.mark.asyncio
     async def test_run_task_now(self, scheduler):
         """Test running a specific task immediately."""
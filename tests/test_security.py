@@ -39,6 +39,13 @@ class TestSecretScanner:
         assert any("API Key" in w for w in warnings)
         assert all("api_key" in w for w in warnings)
     
+    def test_scan_dict_one_warning_per_value(self):
+        """Test a value matching several patterns reports the most specific."""
+        data = {"api_key": "sk-abcdefghijklmnopqrstuvwxyz0123456789ABCD"}
+        
+        warnings = SecretScanner.scan_dict(data)
+        assert warnings == ["Potential API Key found at api_key"]
+    
     def test_scan_dict_with_aws_key(self):
         """Test detecting AWS access keys."""
         data = {
@@ -187,13 +194,13 @@ class TestMaskSecret:
         """Test masking a normal secret."""
         secret = "sk-abcdefghijklmnopqrstuvwxyz"
         masked = mask_secret(secret)
-        assert masked == "sk-a*************************"
+        assert masked == "sk-a***"
     
     def test_mask_custom_show_chars(self):
         """Test masking with custom number of visible characters."""
         secret = "my_secret_token"
         masked = mask_secret(secret, show_chars=6)
-        assert masked == "my_sec*********"
+        assert masked == "my_sec***"
     
     def test_mask_short_secret(self):
         """Test masking a secret shorter than show_chars."""
@@ -236,9 +243,9 @@ class TestSafeConfigDict:
         }
         
         safe = safe_config_dict(config)
-        assert safe["api_key"] == "sk-a*************************"
+        assert safe["api_key"] == "sk-a***"
         assert safe["endpoint"] == "https://api.example.com"  # Not masked
-        assert safe["password"] == "supe********"
+        assert safe["password"] == "supe***"
     
     def test_safe_config_nested_secrets(self):
         """Test masking secrets in nested config."""
@@ -255,8 +262,8 @@ class TestSafeConfigDict:
         
         safe = safe_config_dict(config)
         assert safe["database"]["host"] == "localhost"
-        assert safe["database"]["password"] == "db_p***********"
-        assert safe["api"]["token"] == "api_*********"
+        assert safe["database"]["password"] == "db_p***"
+        assert safe["api"]["token"] == "api_***"
         assert safe["api"]["endpoint"] == "https://api.example.com"
     
     def test_safe_config_empty_secrets(self):
@@ -286,13 +293,13 @@ class TestSafeConfigDict:
         }
         
         safe = safe_config_dict(config)
-        assert safe["api_key"] == "secr**********"
+        assert safe["api_key"] == "secr***"
         assert safe["port"] == 8080
         assert safe["enabled"] is True
         assert safe["features"] == ["logging", "caching"]
         # settings should be a dict with masked token
         assert isinstance(safe["settings"], dict)
-        assert safe["settings"]["token"] == "auth**********"
+        assert safe["settings"]["token"] == "auth***"
         assert safe["settings"]["expires"] == 3600
     
     def test_safe_config_case_insensitive(self):
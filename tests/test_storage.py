@@ -1,20 +1,29 @@
 """Tests for the storage module."""
 
 import asyncio
+import hashlib
+import os
+import subprocess
+import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ai_news_agent.models import CollectorStats, NewsItem
 from ai_news_agent.storage import (
     CollectorRepository,
     DatabaseManager,
+    DeduplicationRepository,
     DigestRepository,
     NewsItemRepository,
 )
-from ai_news_agent.storage.models import NewsItemDB
+from ai_news_agent.storage.models import DailyDigestDB, DigestEntryDB, NewsItemDB
 
 
 @pytest.fixture
@@ -52,6 +61,67 @@ def sample_news_item():
 class TestDatabaseManager:
     """Test DatabaseManager functionality."""
 
+    @pytest.mark.asyncio
+    async def test_sqlite_uses_wal(self, tmp_path):
+        """Test file-backed SQLite databases are opened in WAL mode."""
+        from sqlalchemy import text
+        
+        manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'news.db'}")
+        try:
+            async with manager.get_session() as session:
+                journal_mode = await session.scalar(text("PRAGMA journal_mode"))
+                synchronous = await session.scalar(text("PRAGMA synchronous"))
+                temp_store = await session.scalar(text("PRAGMA temp_store"))
+                cache_size = await session.scalar(text("PRAGMA cache_size"))
+        finally:
+            await manager.close()
+        
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert temp_store == 2  # MEMORY
+        assert cache_size == -65536
+    
+    @pytest.mark.asyncio
+    async def test_recent_items_query_uses_index(self, db_session):
+        """Test recent-item queries are served by the digest indexes."""
+        from sqlalchemy import text
+        
+        recent = (
+            select(NewsItemDB)
+            .where(
+                NewsItemDB.published_at >= datetime(2024, 1, 1),
+                NewsItemDB.is_duplicate == False,
+            )
+            .order_by(NewsItemDB.published_at.desc())
+        )
+        by_source = recent.where(NewsItemDB.source == "Test Source")
+        
+        plans = []
+        for query in (recent, by_source):
+            sql = str(query.compile(db_session.bind, compile_kwargs={"literal_binds": True}))
+            rows = await db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+            plans.append(" ".join(row[-1] for row in rows))
+        
+        assert "idx_news_nondup_published" in plans[0]
+        assert "idx_news_source_published" in plans[1]
+    
+    def test_migrations_match_models(self, tmp_path):
+        """Test autogenerate finds nothing to change after upgrading to head."""
+        env = {
+            **os.environ,
+            "AI_NEWS_DATABASE_URL": f"sqlite+aiosqlite:///{tmp_path / 'news.db'}",
+        }
+        
+        for args in (["upgrade", "head"], ["check"]):
+            result = subprocess.run(
+                [sys.executable, "-m", "alembic", *args],
+                cwd=Path(__file__).parent.parent,
+                env=env,
+                capture_output=True,
+                text=True,
+            )
+            assert result.returncode == 0, result.stderr
+    
     @pytest.mark.asyncio
     async def test_init_db(self, db_manager):
         """Test database initialization."""
@@ -89,6 +159,155 @@ class TestNewsItemRepository:
         assert db_item.title == sample_news_item.title
         assert db_item.url == str(sample_news_item.url)
 
+    @pytest.mark.asyncio
+    async def test_create_many(self, db_session, sample_news_item):
+        """Test creating several news items with one insert."""
+        repo = NewsItemRepository(db_session)
+        second = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "url"}),
+            url="https://example.com/article2",
+        )
+        
+        ids = await repo.create_many([sample_news_item, second])
+        await db_session.commit()
+        
+        assert ids == [sample_news_item.id, second.id]
+        found = await repo.get_by_id(second.id)
+        assert found is not None
+        assert found.url == "https://example.com/article2"
+        assert found.is_duplicate is False
+
+    @pytest.mark.asyncio
+    async def test_timestamps_stored_as_epoch_micros(self, db_session, sample_news_item):
+        """Test SQLite stores timestamps as integers and reads back naive UTC."""
+        from sqlalchemy import text
+        
+        published = datetime(2024, 1, 15, 13, 30, 0, 123456, tzinfo=timezone(timedelta(hours=3)))
+        item = NewsItem(
+            **sample_news_item.model_dump(exclude={"published_at"}),
+            published_at=published,
+        )
+        await NewsItemRepository(db_session).create(item)
+        await db_session.commit()
+        
+        raw = await db_session.scalar(text("SELECT published_at FROM news_items"))
+        db_session.expunge_all()
+        found = await NewsItemRepository(db_session).get_by_id(item.id)
+        
+        assert raw == 1705314600123456
+        assert found.published_at == datetime(2024, 1, 15, 10, 30, 0, 123456)
+
+    @pytest.mark.asyncio
+    async def test_from_db_many_round_trip(self, db_session, sample_news_item):
+        """Test stored rows convert back to equivalent NewsItems."""
+        repo = NewsItemRepository(db_session)
+        await repo.create(sample_news_item)
+        
+        [item] = NewsItem.from_db_many(await repo.get_recent(days=1))
+        
+        assert item.id == sample_news_item.id
+        assert item.url == str(sample_news_item.url)
+        assert item.title == sample_news_item.title
+        assert item.tags == sample_news_item.tags
+        assert item.metadata == sample_news_item.metadata
+
+    @pytest.mark.asyncio
+    async def test_from_db_matches_validating_constructor(
+        self, db_session, sample_news_item
+    ):
+        """Test skipping validation yields the same values as validating."""
+        repo = NewsItemRepository(db_session)
+        await repo.create(sample_news_item)
+        [row] = await repo.get_recent(days=1)
+        
+        constructed = NewsItem.from_db(row)
+        validated = NewsItem(
+            id=row.id,
+            url=row.url,
+            title=row.title,
+            content=row.content,
+            summary=row.summary,
+            source=row.source,
+            published_at=row.published_at,
+            collected_at=row.collected_at,
+            tags=row.tags,
+            metadata=row.extra_metadata,
+        )
+        
+        for field in NewsItem.model_fields:
+            if field == "url":
+                assert constructed.url == str(validated.url)
+            elif field == "tags":
+                assert sorted(constructed.tags) == sorted(validated.tags)
+            else:
+                assert getattr(constructed, field) == getattr(validated, field), field
+
+    def test_tags_cleaned_in_order(self, sample_news_item):
+        """Test tags are normalized and deduplicated keeping first-seen order."""
+        item = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "tags"}),
+            tags=[" Security ", "AI", "security", " ", "ai", "Research"],
+        )
+        
+        assert item.tags == ["security", "ai", "research"]
+
+    @pytest.mark.asyncio
+    async def test_create_many_skips_existing(self, db_session, sample_news_item):
+        """Test already stored items are skipped instead of failing the batch."""
+        repo = NewsItemRepository(db_session)
+        await repo.create(sample_news_item)
+        other = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "url"}),
+            url="https://example.com/other",
+        )
+        
+        ids = await repo.create_many([sample_news_item, other])
+        await db_session.commit()
+        
+        assert ids == [other.id]
+        assert await repo.get_by_id(other.id) is not None
+
+    @pytest.mark.asyncio
+    async def test_create_many_skips_existing_url(self, db_session, sample_news_item):
+        """Test a URL stored under a legacy SHA-256 ID is skipped, not a failure."""
+        repo = NewsItemRepository(db_session)
+        legacy_id = hashlib.sha256(
+            f"{sample_news_item.url}{sample_news_item.title}".encode()
+        ).hexdigest()
+        await repo.create(
+            NewsItem(**sample_news_item.model_dump(exclude={"id"}), id=legacy_id)
+        )
+        other = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "url"}),
+            url="https://example.com/other",
+        )
+        
+        ids = await repo.create_many([sample_news_item, other])
+        await db_session.commit()
+        
+        assert ids == [other.id]
+        assert await repo.get_by_id(sample_news_item.id) is None
+        assert await repo.get_by_id(legacy_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_create_many_in_batches(self, db_session, sample_news_item):
+        """Test inserts larger than the batch size are split across statements."""
+        repo = NewsItemRepository(db_session)
+        items = [
+            NewsItem(
+                **sample_news_item.model_dump(exclude={"id", "url"}),
+                url=f"https://example.com/batch/{i}",
+            )
+            for i in range(5)
+        ]
+        
+        with patch.object(NewsItemRepository, "BATCH_SIZE", 2):
+            ids = await repo.create_many([*items, items[0]])
+        await db_session.commit()
+        
+        assert ids == [item.id for item in items]
+        assert await repo.count_by_source() == [(sample_news_item.source, 5)]
+
     @pytest.mark.asyncio
     async def test_get_by_id(self, db_session, sample_news_item):
         """Test getting news item by ID."""
@@ -165,6 +384,27 @@ class TestNewsItemRepository:
         # Should be ordered by published_at desc
         assert recent[0].title == "Article 0"
 
+    @pytest.mark.asyncio
+    async def test_get_in_range(self, db_session):
+        """Test getting news items published within a time range."""
+        repo = NewsItemRepository(db_session)
+        
+        now = datetime.now(timezone.utc)
+        for i in range(5):
+            item = NewsItem(
+                url=f"https://example.com/article{i}",
+                title=f"Article {i}",
+                content=f"Content {i}",
+                source="Test Source",
+                published_at=now - timedelta(days=i, hours=12),
+            )
+            await repo.create(item)
+        await db_session.commit()
+        
+        # End is exclusive, results are ordered oldest first
+        in_range = await repo.get_in_range(now - timedelta(days=3), now - timedelta(days=1))
+        assert [item.title for item in in_range] == ["Article 2", "Article 1"]
+
     @pytest.mark.asyncio
     async def test_mark_as_duplicate(self, db_session):
         """Test marking item as duplicate."""
@@ -223,6 +463,8 @@ class TestNewsItemRepository:
         assert counts_dict["TechCrunch"] == 2
         assert counts_dict["ArXiv"] == 1
         assert counts_dict["OpenAI"] == 1
+        
+        assert await repo.count_by_source_with_total() == (counts_dict, 4)
 
 
 class TestCollectorRepository:
@@ -357,6 +599,54 @@ class TestDigestRepository:
         # SQLite doesn't preserve timezone info, so compare without tz
         assert found.date.replace(tzinfo=timezone.utc) == digest_date
 
+    @pytest.mark.asyncio
+    async def test_digest_body_loaded_on_request(self, db_session, sample_news_item):
+        """Test rendered digest bodies are skipped unless undeferred."""
+        from sqlalchemy import inspect
+        
+        db_item = await NewsItemRepository(db_session).create(sample_news_item)
+        digest_repo = DigestRepository(db_session)
+        digest_date = datetime(2024, 1, 15)
+        digest = await digest_repo.create_daily_digest(digest_date, [db_item])
+        digest.content_markdown = "# Digest"
+        await db_session.commit()
+        db_session.expunge_all()
+        
+        result = await db_session.execute(
+            select(DailyDigestDB).where(DailyDigestDB.id == digest.id)
+        )
+        assert "content_markdown" in inspect(result.scalar_one()).unloaded
+        db_session.expunge_all()
+        
+        found = await digest_repo.get_daily_digest(digest_date)
+        assert found.content_markdown == "# Digest"
+
+    @pytest.mark.asyncio
+    async def test_digest_entries_load_explicitly(self, db_session, sample_news_item):
+        """Test digest entries never lazy-load and load with selectinload."""
+        news_repo = NewsItemRepository(db_session)
+        digest_repo = DigestRepository(db_session)
+        db_item = await news_repo.create(sample_news_item)
+        digest_date = datetime(2024, 1, 15)
+        await digest_repo.create_daily_digest(digest_date, [db_item])
+        await db_session.commit()
+        db_session.expunge_all()
+        
+        digest = await digest_repo.get_daily_digest(digest_date)
+        with pytest.raises(InvalidRequestError):
+            digest.entries
+        
+        result = await db_session.execute(
+            select(DailyDigestDB)
+            .where(DailyDigestDB.id == digest.id)
+            .options(
+                selectinload(DailyDigestDB.entries).joinedload(DigestEntryDB.news_item)
+            )
+            .execution_options(populate_existing=True)
+        )
+        [entry] = result.scalar_one().entries
+        assert entry.news_item.id == sample_news_item.id
+
     @pytest.mark.asyncio
     async def test_create_weekly_summary(self, db_session, sample_news_item):
         """Test creating a weekly summary."""
@@ -435,4 +725,78 @@ class TestDigestRepository:
         
         # Verify
         assert digest.is_sent is True
-        assert digest.sent_at is not None
\ No newline at end of file
+        assert digest.sent_at is not None
+
+
+class TestDeduplicationRepository:
+    """Test DeduplicationRepository functionality."""
+
+    @pytest.mark.asyncio
+    async def test_add_many_to_cache(self, db_session, sample_news_item):
+        """Test bulk cache inserts and refreshes of existing entries."""
+        await NewsItemRepository(db_session).create(sample_news_item)
+        repo = DeduplicationRepository(db_session)
+        
+        assert await repo.add_many_to_cache([sample_news_item]) == 1
+        # Existing entry is refreshed, in-batch repeats are counted
+        assert await repo.add_many_to_cache([sample_news_item] * 2) == 0
+        await db_session.commit()
+        
+        entry = await repo.find_similar(
+            str(sample_news_item.url), "other", "other"
+        )
+        assert entry.news_item_id == sample_news_item.id
+        assert entry.occurrence_count == 3
+        assert entry.url_hash == hashlib.sha256(str(sample_news_item.url).encode()).digest()
+
+    @pytest.mark.asyncio
+    async def test_add_to_cache_refreshes_existing(self, db_session, sample_news_item):
+        """Test adding a known URL refreshes its entry instead of failing."""
+        db_item = await NewsItemRepository(db_session).create(sample_news_item)
+        repo = DeduplicationRepository(db_session)
+        
+        first = await repo.add_to_cache(db_item)
+        first_seen = first.last_seen_at
+        second = await repo.add_to_cache(db_item)
+        
+        assert second.id == first.id
+        assert second.occurrence_count == 2
+        assert second.last_seen_at >= first_seen
+
+    @pytest.mark.asyncio
+    async def test_cleanup_old_entries(self, db_session, sample_news_item):
+        """Test entries not seen within the window are deleted in bulk."""
+        db_item = await NewsItemRepository(db_session).create(sample_news_item)
+        repo = DeduplicationRepository(db_session)
+        entry = await repo.add_to_cache(db_item)
+        entry.last_seen_at = datetime.now(timezone.utc) - timedelta(days=40)
+        await db_session.flush()
+        
+        assert await repo.cleanup_old_entries(days=30) == 1
+        assert await repo.cleanup_old_entries(days=30) == 0
+        assert await repo.find_similar(str(sample_news_item.url), "", "") is None
+
+    @pytest.mark.asyncio
+    async def test_find_many_exact(self, db_session, sample_news_item):
+        """Test bulk exact lookups by URL and by title plus content."""
+        await NewsItemRepository(db_session).create(sample_news_item)
+        repo = DeduplicationRepository(db_session)
+        await repo.add_many_to_cache([sample_news_item])
+        
+        same_text = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "url"}),
+            url="https://mirror.example.com/article",
+        )
+        unrelated = NewsItem(
+            **sample_news_item.model_dump(exclude={"id", "url", "title"}),
+            url="https://example.com/unrelated",
+            title="Unrelated",
+        )
+        
+        matches = await repo.find_many_exact([sample_news_item, same_text, unrelated])
+        
+        assert matches == [sample_news_item.id, sample_news_item.id, None]
+        ids = await NewsItemRepository(db_session).get_ids_by_urls(
+            [str(sample_news_item.url), "https://example.com/unrelated"]
+        )
+        assert ids == {str(sample_news_item.url): sample_news_item.id}